@@ -4,6 +4,13 @@ Raster Accuracy Assessment Plugin
 Herhangi iki raster harita için doğrulama analizi
 """
 
+import time
+
+# Açılış süresi ölçümü için paket yüklenmeye başladığı an
+_LOAD_STARTED = time.perf_counter()
+
+
 def classFactory(iface):
-    from .accuracy_assessment import AccuracyAssessmentPlugin
-    return AccuracyAssessmentPlugin(iface)
+    # Yalnızca hafif eklenti sınıfı yüklenir; analiz modülleri ilk çalıştırmada
+    from .plugin import AccuracyAssessmentPlugin
+    return AccuracyAssessmentPlugin(iface, load_started=_LOAD_STARTED)
@@ -5,30 +5,34 @@ Raster Accuracy Assessment Plugin
 QGIS 3.x uyumlu versiyon - DÜZELTME: Tüm sınıfları dahil eder
 """
 
-from qgis.PyQt.QtCore import Qt, QVariant
+from qgis.PyQt.QtCore import Qt
 from qgis.PyQt.QtGui import QFont
-from qgis.PyQt.QtWidgets import (QAction, QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
+from qgis.PyQt.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
     QSpinBox, QPushButton, QComboBox, QTextEdit, QGroupBox, QFileDialog, QMessageBox, 
     QProgressBar, QTableWidget, QTableWidgetItem, QHeaderView, QCheckBox, QRadioButton,
-    QButtonGroup, QWidget, QScrollArea, QLineEdit, QApplication)
-from qgis.core import (QgsProject, QgsVectorLayer, QgsRasterLayer, QgsField, 
-                       QgsFeature, QgsGeometry, QgsPointXY,
+    QButtonGroup, QWidget, QScrollArea, QLineEdit, QListWidget, QListWidgetItem, QDoubleSpinBox)
+from qgis.core import (QgsProject, QgsVectorLayer, QgsRasterLayer,
                        QgsVectorFileWriter, QgsWkbTypes,
                        QgsApplication, QgsRaster)
 from qgis.utils import iface
-import numpy as np
-import random
-from sklearn.metrics import (cohen_kappa_score, accuracy_score, confusion_matrix, 
-    classification_report, f1_score, precision_score, recall_score,
-    mean_squared_error, mean_absolute_error, r2_score)
 import os
 import json
 from datetime import datetime
 
+from .exhaustive import DEFAULT_WORKERS, check_alignment
+from .pipeline import (PointLayerSource, compute_validation, point_features, point_fields, prepare_validation,
+                       trace_memory_enabled)
+from .raster_cache import DEFAULT_CACHE_BUDGET, RASTER_CACHE
+from .raster_io import RasterSource, parse_bands
+from .core.profiler import TimeCounter
+from .core.report import html_report, text_report
+from .validation_task import ValidationTask
+
 
 class ClassMappingDialog(QDialog):
     """Sınıf eşleştirme için dialog"""
-    def __init__(self, reference_values, classified_values, parent=None):
+    def __init__(self, reference_values, classified_values, parent=None,
+                 reference_counts=None, classified_counts=None):
         super(ClassMappingDialog, self).__init__(parent)
         self.setWindowTitle("Sınıf Eşleştirme")
         self.setMinimumWidth(900)
@@ -37,8 +41,12 @@ class ClassMappingDialog(QDialog):
         self.reference_unique = sorted(list(set(reference_values)))
         self.classified_unique = sorted(list(set(classified_values)))
         
-        self.setup_ui()
+        # Sınıf frekansları {değer: piksel/nokta sayısı}
+        self.reference_counts = reference_counts or {}
+        self.classified_counts = classified_counts or {}
         
+        self.setup_ui()
+    
     def setup_ui(self):
         layout = QVBoxLayout()
         
@@ -74,8 +82,8 @@ class ClassMappingDialog(QDialog):
         reference_layout.addWidget(ref_info)
         
         self.reference_table = QTableWidget()
-        self.reference_table.setColumnCount(3)
-        self.reference_table.setHorizontalHeaderLabels(["Piksel Değeri", "Sınıf Adı", "Kategori"])
+        self.reference_table.setColumnCount(4)
+        self.reference_table.setHorizontalHeaderLabels(["Piksel Değeri", "Sınıf Adı", "Kategori", "Frekans"])
         self.reference_table.setRowCount(len(self.reference_unique))
         
         for i, val in enumerate(self.reference_unique):
@@ -87,7 +95,7 @@ class ClassMappingDialog(QDialog):
                     display_val = f"{val:.4f}"
             else:
                 display_val = str(val)
-                
+            
             item = QTableWidgetItem(display_val)
             item.setFlags(item.flags() & ~Qt.ItemIsEditable)
             self.reference_table.setItem(i, 0, item)
@@ -100,7 +108,7 @@ class ClassMappingDialog(QDialog):
                     default_name = f"Sınıf_{val:.2f}"
             else:
                 default_name = f"Sınıf_{val}"
-                
+            
             name_edit = QLineEdit(default_name)
             self.reference_table.setCellWidget(i, 1, name_edit)
             
@@ -111,6 +119,11 @@ class ClassMappingDialog(QDialog):
             category_spin.setValue(i + 1)
             self.reference_table.setCellWidget(i, 2, category_spin)
             
+            # Frekans - sayı ve yüzde
+            count_item = QTableWidgetItem(self.format_count(self.reference_counts, val))
+            count_item.setFlags(count_item.flags() & ~Qt.ItemIsEditable)
+            self.reference_table.setItem(i, 3, count_item)
+        
         self.reference_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         reference_layout.addWidget(self.reference_table)
         reference_group.setLayout(reference_layout)
@@ -125,8 +138,8 @@ class ClassMappingDialog(QDialog):
         classified_layout.addWidget(class_info)
         
         self.classified_table = QTableWidget()
-        self.classified_table.setColumnCount(3)
-        self.classified_table.setHorizontalHeaderLabels(["Piksel Değeri", "Sınıf Adı", "Kategori"])
+        self.classified_table.setColumnCount(4)
+        self.classified_table.setHorizontalHeaderLabels(["Piksel Değeri", "Sınıf Adı", "Kategori", "Frekans"])
         self.classified_table.setRowCount(len(self.classified_unique))
         
         for i, val in enumerate(self.classified_unique):
@@ -138,7 +151,7 @@ class ClassMappingDialog(QDialog):
                     display_val = f"{val:.4f}"
             else:
                 display_val = str(val)
-                
+            
             item = QTableWidgetItem(display_val)
             item.setFlags(item.flags() & ~Qt.ItemIsEditable)
             self.classified_table.setItem(i, 0, item)
@@ -151,7 +164,7 @@ class ClassMappingDialog(QDialog):
                     default_name = f"Sınıf_{val:.2f}"
             else:
                 default_name = f"Sınıf_{val}"
-                
+            
             name_edit = QLineEdit(default_name)
             self.classified_table.setCellWidget(i, 1, name_edit)
             
@@ -162,6 +175,11 @@ class ClassMappingDialog(QDialog):
             category_spin.setValue(i + 1)
             self.classified_table.setCellWidget(i, 2, category_spin)
             
+            # Frekans - sayı ve yüzde
+            count_item = QTableWidgetItem(self.format_count(self.classified_counts, val))
+            count_item.setFlags(count_item.flags() & ~Qt.ItemIsEditable)
+            self.classified_table.setItem(i, 3, count_item)
+        
         self.classified_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         classified_layout.addWidget(self.classified_table)
         classified_group.setLayout(classified_layout)
@@ -204,19 +222,27 @@ class ClassMappingDialog(QDialog):
         
         layout.addLayout(button_layout)
         self.setLayout(layout)
-        
+    
+    @staticmethod
+    def format_count(counts, val):
+        """Sınıf frekansını 'sayı (%yüzde)' biçiminde döndür"""
+        if val not in counts:
+            return "-"
+        total = sum(counts.values())
+        return f"{counts[val]:,} ({counts[val] / total * 100:.2f}%)"
+    
     def auto_map_sequential(self):
         """Sıralı otomatik eşleştirme"""
         # Referans
         for i in range(self.reference_table.rowCount()):
             category_spin = self.reference_table.cellWidget(i, 2)
             category_spin.setValue(i + 1)
-            
+        
         # Sınıflandırılmış
         for i in range(self.classified_table.rowCount()):
             category_spin = self.classified_table.cellWidget(i, 2)
             category_spin.setValue(i + 1)
-            
+    
     def auto_map_identical(self):
         """Aynı değerleri eşleştir"""
         # Her değer için kategori oluştur
@@ -231,7 +257,7 @@ class ClassMappingDialog(QDialog):
                 category_counter += 1
             category_spin = self.reference_table.cellWidget(i, 2)
             category_spin.setValue(value_to_category[val])
-            
+        
         # Sınıflandırılmış değerleri işle
         for i in range(self.classified_table.rowCount()):
             val = self.classified_unique[i]
@@ -240,7 +266,7 @@ class ClassMappingDialog(QDialog):
                 category_counter += 1
             category_spin = self.classified_table.cellWidget(i, 2)
             category_spin.setValue(value_to_category[val])
-            
+    
     def get_mappings(self):
         """Eşleştirme bilgilerini al"""
         reference_mapping = {}
@@ -254,7 +280,7 @@ class ClassMappingDialog(QDialog):
             category = category_spin.value()
             reference_mapping[val] = category
             reference_names[category] = name_edit.text()
-            
+        
         classified_mapping = {}
         classified_names = {}
         
@@ -267,7 +293,7 @@ class ClassMappingDialog(QDialog):
             classified_mapping[val] = category
             if category not in classified_names:
                 classified_names[category] = name_edit.text()
-            
+        
         # İsim birleştirme: referans isimleri öncelikli
         final_names = {}
         all_categories = set(list(reference_names.keys()) + list(classified_names.keys()))
@@ -289,11 +315,14 @@ class AccuracyAssessmentDialog(QDialog):
         self.setMinimumWidth(1000)
         self.setMinimumHeight(800)
         
-        self.sampled_points = None
+        self.samples = None
         self.validation_results = None
+        self.task = None
+        # Son çalıştırmanın aşama ölçümleri (dışa aktarma süreleri de eklenir)
+        self.profiler = None
         
         self.setup_ui()
-        
+    
     def setup_ui(self):
         """Arayüzü oluştur"""
         main_layout = QVBoxLayout()
@@ -344,8 +373,14 @@ class AccuracyAssessmentDialog(QDialog):
         class_label.setStyleSheet("font-weight: bold;")
         self.classified_combo = QComboBox()
         self.classified_combo.setMinimumWidth(400)
+        self.bands_edit = QLineEdit("1")
+        self.bands_edit.setMaximumWidth(120)
+        self.bands_edit.setToolTip("Değerlendirilecek bantlar, ör. 1,3,5-10 (zaman serisi yığınları için)\n"
+                                   "Bands to assess, e.g. 1,3,5-10 (for time-series stacks)")
         class_layout.addWidget(class_label)
         class_layout.addWidget(self.classified_combo)
+        class_layout.addWidget(QLabel("Bant / Bands:"))
+        class_layout.addWidget(self.bands_edit)
         class_layout.addStretch()
         map_layout.addLayout(class_layout)
         
@@ -353,6 +388,20 @@ class AccuracyAssessmentDialog(QDialog):
         class_info.setStyleSheet("color: #7f8c8d; font-size: 10pt; margin-left: 20px;")
         map_layout.addWidget(class_info)
         
+        # Toplu karşılaştırma - aynı örnekler ve eşleştirmeyle ek haritalar
+        batch_layout = QHBoxLayout()
+        batch_label = QLabel("Toplu Karşılaştırma / Batch Maps:")
+        batch_label.setMinimumWidth(250)
+        self.batch_list = QListWidget()
+        self.batch_list.setMinimumWidth(400)
+        self.batch_list.setMaximumHeight(90)
+        self.batch_list.setToolTip("İşaretlenen haritalar aynı örnekler ve sınıf eşleştirmesiyle değerlendirilir\n"
+                                   "Checked maps are assessed with the same samples and class mapping")
+        batch_layout.addWidget(batch_label)
+        batch_layout.addWidget(self.batch_list)
+        batch_layout.addStretch()
+        map_layout.addLayout(batch_layout)
+        
         map_group.setLayout(map_layout)
         main_layout.addWidget(map_group)
         
@@ -371,20 +420,35 @@ class AccuracyAssessmentDialog(QDialog):
         self.stratified_radio = QRadioButton("Katmanlı / Stratified")
         self.systematic_radio = QRadioButton("Sistematik / Systematic")
         self.csv_radio = QRadioButton("CSV Dosyası / CSV File")
+        self.point_layer_radio = QRadioButton("Nokta Katmanı / Point Layer")
+        self.point_layer_radio.setToolTip("GeoPackage, FlatGeobuf veya başka bir OGR nokta katmanı; yalnızca\n"
+                                          "sınıflandırılmış haritanın kapsamındaki noktalar okunur\n"
+                                          "GeoPackage, FlatGeobuf or another OGR point layer; only points\n"
+                                          "within the classified map's extent are read")
+        self.exhaustive_radio = QRadioButton("Tüm Pikseller / All Pixels")
+        self.exhaustive_radio.setToolTip("Hizalı iki raster'ın tüm piksellerini karşılaştırır\n"
+                                         "Compares every pixel of two aligned rasters")
         
         self.method_group.addButton(self.random_radio, 1)
         self.method_group.addButton(self.stratified_radio, 2)
         self.method_group.addButton(self.systematic_radio, 3)
         self.method_group.addButton(self.csv_radio, 4)
+        self.method_group.addButton(self.exhaustive_radio, 5)
+        self.method_group.addButton(self.point_layer_radio, 6)
         
         self.random_radio.toggled.connect(self.on_sampling_method_changed)
+        self.stratified_radio.toggled.connect(self.on_sampling_method_changed)
         self.csv_radio.toggled.connect(self.on_sampling_method_changed)
+        self.point_layer_radio.toggled.connect(self.on_sampling_method_changed)
+        self.exhaustive_radio.toggled.connect(self.on_sampling_method_changed)
         
         method_layout.addWidget(method_label)
         method_layout.addWidget(self.random_radio)
         method_layout.addWidget(self.stratified_radio)
         method_layout.addWidget(self.systematic_radio)
         method_layout.addWidget(self.csv_radio)
+        method_layout.addWidget(self.point_layer_radio)
+        method_layout.addWidget(self.exhaustive_radio)
         method_layout.addStretch()
         sampling_layout.addLayout(method_layout)
         
@@ -411,13 +475,42 @@ class AccuracyAssessmentDialog(QDialog):
         self.csv_widget.setVisible(False)
         sampling_layout.addWidget(self.csv_widget)
         
+        # Nokta katmanı ve alan seçimi (başlangıçta gizli)
+        self.point_layer_widget = QWidget()
+        point_layer_layout = QHBoxLayout()
+        point_layer_layout.setContentsMargins(250, 0, 0, 0)
+        
+        self.point_layer_combo = QComboBox()
+        self.point_layer_combo.setMinimumWidth(250)
+        self.point_layer_combo.currentIndexChanged.connect(self.on_point_layer_changed)
+        point_layer_layout.addWidget(self.point_layer_combo)
+        
+        point_layer_browse_button = QPushButton("📁 Gözat / Browse")
+        point_layer_browse_button.clicked.connect(self.browse_point_layer)
+        point_layer_layout.addWidget(point_layer_browse_button)
+        
+        point_layer_layout.addWidget(QLabel("Değer / Value:"))
+        self.point_value_combo = QComboBox()
+        self.point_value_combo.setMinimumWidth(120)
+        point_layer_layout.addWidget(self.point_value_combo)
+        
+        point_layer_layout.addWidget(QLabel("Kimlik / Id:"))
+        self.point_id_combo = QComboBox()
+        self.point_id_combo.setMinimumWidth(120)
+        point_layer_layout.addWidget(self.point_id_combo)
+        
+        point_layer_layout.addStretch()
+        self.point_layer_widget.setLayout(point_layer_layout)
+        self.point_layer_widget.setVisible(False)
+        sampling_layout.addWidget(self.point_layer_widget)
+        
         # Nokta sayısı
         points_layout = QHBoxLayout()
         points_label = QLabel("Nokta Sayısı / Number of Points:")
         points_label.setMinimumWidth(250)
         self.points_spin = QSpinBox()
         self.points_spin.setMinimum(30)
-        self.points_spin.setMaximum(100000)
+        self.points_spin.setMaximum(10000000)
         self.points_spin.setValue(500)
         self.points_spin.setSingleStep(50)
         points_layout.addWidget(points_label)
@@ -425,6 +518,86 @@ class AccuracyAssessmentDialog(QDialog):
         points_layout.addStretch()
         sampling_layout.addLayout(points_layout)
         
+        # Katmanlı örnekleme: örnek dağıtımı
+        allocation_layout = QHBoxLayout()
+        allocation_label = QLabel("Örnek Dağıtımı / Allocation:")
+        allocation_label.setMinimumWidth(250)
+        self.allocation_combo = QComboBox()
+        self.allocation_combo.addItem("Orantılı / Proportional", 'proportional')
+        self.allocation_combo.addItem("Eşit / Equal", 'equal')
+        self.allocation_combo.addItem("Neyman", 'neyman')
+        self.allocation_combo.setToolTip("Neyman: sınıf boyutu x sqrt(p(1-p)) ile orantılı; p, sınıfta\n"
+                                         "sınıflandırılmış değeri referans değerine eşit piksel oranıdır\n"
+                                         "Neyman: proportional to class size x sqrt(p(1-p)), where p is the share\n"
+                                         "of class pixels whose classified value equals the reference value")
+        self.min_per_class_spin = QSpinBox()
+        self.min_per_class_spin.setMinimum(0)
+        self.min_per_class_spin.setMaximum(100000)
+        self.min_per_class_spin.setValue(0)
+        self.min_per_class_spin.setPrefix("Min: ")
+        self.min_per_class_spin.setToolTip("Sınıf başına en az örnek sayısı\nMinimum number of samples per class")
+        self.reservoir_check = QCheckBox("Tek geçiş / Single pass")
+        self.reservoir_check.setToolTip("Raster'ı bir kez okuyup sınıf başına rezervuar tutar; bellek örnek sayısına bağlıdır\n"
+                                        "Reads the raster once keeping one reservoir per class; memory depends on sample size")
+        self.allocation_combo.setEnabled(False)
+        self.min_per_class_spin.setEnabled(False)
+        self.reservoir_check.setEnabled(False)
+        allocation_layout.addWidget(allocation_label)
+        allocation_layout.addWidget(self.allocation_combo)
+        allocation_layout.addWidget(self.min_per_class_spin)
+        allocation_layout.addWidget(self.reservoir_check)
+        allocation_layout.addStretch()
+        sampling_layout.addLayout(allocation_layout)
+        
+        # Seyreltme: piksel başına tek nokta ve en az uzaklık
+        thinning_layout = QHBoxLayout()
+        thinning_label = QLabel("Seyreltme / Thinning:")
+        thinning_label.setMinimumWidth(250)
+        self.dedupe_check = QCheckBox("Piksel başına tek nokta / One point per pixel")
+        self.dedupe_check.setToolTip("Sınıflandırılmış haritanın aynı pikseline düşen noktalardan yalnızca ilki\n"
+                                     "kullanılır / Only the first of several points in the same classified\n"
+                                     "pixel is used")
+        self.min_distance_spin = QDoubleSpinBox()
+        self.min_distance_spin.setDecimals(3)
+        self.min_distance_spin.setMaximum(1e9)
+        self.min_distance_spin.setValue(0.0)
+        self.min_distance_spin.setPrefix("En az uzaklık / Min distance: ")
+        self.min_distance_spin.setSpecialValueText("En az uzaklık / Min distance: -")
+        self.min_distance_spin.setToolTip("Birbirine bu uzaklıktan (harita birimi) yakın noktalar seyreltilir;\n"
+                                          "0 = kapalı / Points closer than this distance (map units) are\n"
+                                          "thinned; 0 = off")
+        thinning_layout.addWidget(thinning_label)
+        thinning_layout.addWidget(self.dedupe_check)
+        thinning_layout.addWidget(self.min_distance_spin)
+        thinning_layout.addStretch()
+        sampling_layout.addLayout(thinning_layout)
+        
+        # İş parçacığı sayısı (tüm piksel modu)
+        workers_layout = QHBoxLayout()
+        workers_label = QLabel("İş Parçacığı / Workers:")
+        workers_label.setMinimumWidth(250)
+        self.workers_spin = QSpinBox()
+        self.workers_spin.setMinimum(1)
+        self.workers_spin.setMaximum(max(DEFAULT_WORKERS, 64))
+        self.workers_spin.setValue(DEFAULT_WORKERS)
+        self.workers_spin.setToolTip("Tüm piksel modunda karoları paralel işleyen iş parçacığı sayısı\n"
+                                     "Number of threads processing tiles in all-pixels mode")
+        self.workers_spin.setEnabled(False)
+        self.cache_spin = QSpinBox()
+        self.cache_spin.setMinimum(0)
+        self.cache_spin.setMaximum(65536)
+        self.cache_spin.setSingleStep(128)
+        self.cache_spin.setValue(DEFAULT_CACHE_BUDGET // (1024 * 1024))
+        self.cache_spin.setPrefix("Önbellek / Cache: ")
+        self.cache_spin.setSuffix(" MB")
+        self.cache_spin.setToolTip("Okunan raster blokları için bellek sınırı; aynı haritalarla tekrar çalıştırmada disk okunmaz\n"
+                                   "Memory budget for decoded raster blocks; reruns on the same maps skip disk reads")
+        workers_layout.addWidget(workers_label)
+        workers_layout.addWidget(self.workers_spin)
+        workers_layout.addWidget(self.cache_spin)
+        workers_layout.addStretch()
+        sampling_layout.addLayout(workers_layout)
+        
         sampling_group.setLayout(sampling_layout)
         main_layout.addWidget(sampling_group)
         
@@ -448,6 +621,12 @@ class AccuracyAssessmentDialog(QDialog):
         self.validate_button.clicked.connect(self.run_validation)
         button_layout.addWidget(self.validate_button)
         
+        self.cancel_button = QPushButton("⏹ İptal / Cancel")
+        self.cancel_button.setStyleSheet("QPushButton { background-color: #e74c3c; color: white; font-weight: bold; padding: 12px; border-radius: 6px; }")
+        self.cancel_button.setVisible(False)
+        self.cancel_button.clicked.connect(self.cancel_task)
+        button_layout.addWidget(self.cancel_button)
+        
         main_layout.addLayout(button_layout)
         
         # İlerleme çubuğu
@@ -495,12 +674,21 @@ class AccuracyAssessmentDialog(QDialog):
         main_layout.addWidget(results_group)
         
         self.setLayout(main_layout)
-        
+    
     def on_sampling_method_changed(self):
         """Örnekleme metoduna göre UI'yi ayarla"""
-        is_csv = self.csv_radio.isChecked()
-        self.csv_widget.setVisible(is_csv)
-        self.points_spin.setEnabled(not is_csv)
+        is_point_layer = self.point_layer_radio.isChecked()
+        is_csv = self.csv_radio.isChecked() or is_point_layer
+        is_exhaustive = self.exhaustive_radio.isChecked()
+        self.csv_widget.setVisible(self.csv_radio.isChecked())
+        self.point_layer_widget.setVisible(is_point_layer)
+        self.points_spin.setEnabled(not is_csv and not is_exhaustive)
+        self.workers_spin.setEnabled(is_exhaustive)
+        self.dedupe_check.setEnabled(not is_exhaustive)
+        self.min_distance_spin.setEnabled(not is_exhaustive)
+        self.allocation_combo.setEnabled(self.stratified_radio.isChecked())
+        self.min_per_class_spin.setEnabled(self.stratified_radio.isChecked())
+        self.reservoir_check.setEnabled(self.stratified_radio.isChecked())
         
         # CSV seçildiğinde referans harita gereksiz
         self.reference_combo.setEnabled(not is_csv)
@@ -508,7 +696,7 @@ class AccuracyAssessmentDialog(QDialog):
             ref_label_text = "Referans Harita / Reference Map: (CSV'den alınacak / From CSV)"
         else:
             ref_label_text = "Referans Harita / Reference Map:"
-        
+    
     def browse_csv_file(self):
         """CSV dosyası seç"""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -549,99 +737,60 @@ class AccuracyAssessmentDialog(QDialog):
                                 "Her satır en az 4 sütun içermelidir / Each row must have at least 4 columns")
                             self.csv_path_edit.clear()
                             return
-                            
+                
                 QMessageBox.information(self, "Başarılı / Success",
                     "✓ CSV dosyası başarıyla yüklendi!\n"
                     "✓ CSV file loaded successfully!")
-                    
+            
             except Exception as e:
                 QMessageBox.critical(self, "Hata / Error",
                     f"CSV dosyası okunamadı / Cannot read CSV file:\n{str(e)}")
                 self.csv_path_edit.clear()
     
-    def load_points_from_csv(self, csv_path, reference_layer):
-        """CSV dosyasından noktaları yükle"""
-        from qgis.core import QgsCoordinateReferenceSystem, QgsCoordinateTransform
-        
-        points = []
-        reference_values_from_csv = []
-        point_ids = []
-        
-        try:
-            with open(csv_path, 'r', encoding='utf-8') as f:
-                # Başlık satırını oku
-                header = f.readline().strip().split(',')
-                headers = [h.strip().lower() for h in header]
-                
-                # Sütun indekslerini bul
-                id_idx = headers.index('id')
-                x_idx = headers.index('x')
-                y_idx = headers.index('y')
-                ref_val_idx = headers.index('reference_value')
-                
-                # Koordinat dönüşümü için CRS tanımla
-                wgs84 = QgsCoordinateReferenceSystem("EPSG:4326")  # WGS 84
-                layer_crs = reference_layer.crs()
-                
-                # Dönüşüm gerekli mi kontrol et
-                needs_transform = (wgs84.authid() != layer_crs.authid())
-                if needs_transform:
-                    transform = QgsCoordinateTransform(wgs84, layer_crs, QgsProject.instance())
-                
-                ref_extent = reference_layer.extent()
-                
-                # Veri satırlarını oku
-                for line_num, line in enumerate(f, start=2):
-                    line = line.strip()
-                    if not line:
-                        continue
-                        
-                    parts = line.split(',')
-                    if len(parts) < 4:
-                        continue
-                    
-                    try:
-                        point_id = parts[id_idx].strip()
-                        x = float(parts[x_idx].strip())
-                        y = float(parts[y_idx].strip())
-                        
-                        # Reference value
-                        ref_val_str = parts[ref_val_idx].strip()
-                        ref_val = float(ref_val_str)
-                        
-                        # WGS 84 koordinatından nokta oluştur
-                        point_geom = QgsPointXY(x, y)
-                        
-                        # Gerekirse proje CRS'ine dönüştür
-                        if needs_transform:
-                            point_geom = transform.transform(point_geom)
-                        
-                        # Piksel koordinatlarına dönüştür
-                        pixel_x = int((point_geom.x() - ref_extent.xMinimum()) / reference_layer.rasterUnitsPerPixelX())
-                        pixel_y = int((ref_extent.yMaximum() - point_geom.y()) / reference_layer.rasterUnitsPerPixelY())
-                        
-                        # Sınırlar içinde mi?
-                        if 0 <= pixel_x < reference_layer.width() and 0 <= pixel_y < reference_layer.height():
-                            points.append({
-                                'x': pixel_x,
-                                'y': pixel_y,
-                                'coord_x': point_geom.x(),
-                                'coord_y': point_geom.y(),
-                                'id': point_id,
-                                'ref_value': ref_val  # CSV'den gelen referans değerini sakla
-                            })
-                            reference_values_from_csv.append(ref_val)
-                            point_ids.append(point_id)
-                        
-                    except (ValueError, IndexError) as e:
-                        self.result_text.append(f"   ⚠ Satır {line_num} atlandı / Line {line_num} skipped: {str(e)}\n")
-                        continue
-                
-                return points, reference_values_from_csv, point_ids
-                
-        except Exception as e:
-            raise Exception(f"CSV dosyası yüklenirken hata / Error loading CSV: {str(e)}")
+    def browse_point_layer(self):
+        """Nokta katmanı dosyası seç (projeye eklenmeden listeye alınır)"""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Nokta Katmanı Seçin / Select Point Layer",
+            "",
+            "Vektör / Vector (*.gpkg *.fgb *.shp *.geojson *.sqlite);;All Files (*.*)"
+        )
+        if not file_path:
+            return
         
+        layer = QgsVectorLayer(file_path, os.path.splitext(os.path.basename(file_path))[0], 'ogr')
+        if not layer.isValid() or layer.geometryType() != QgsWkbTypes.PointGeometry:
+            QMessageBox.warning(self, "Uyarı / Warning",
+                "Dosya geçerli bir nokta katmanı değil!\n"
+                "The file is not a valid point layer!")
+            return
+        self.point_layer_combo.addItem(f"{layer.name()} ({file_path})", layer)
+        self.point_layer_combo.setCurrentIndex(self.point_layer_combo.count() - 1)
+    
+    def on_point_layer_changed(self):
+        """Seçilen nokta katmanının alanlarını listele"""
+        self.point_value_combo.clear()
+        self.point_id_combo.clear()
+        self.point_id_combo.addItem("(nesne kimliği / feature id)", "")
+        layer = self.point_layer_combo.currentData()
+        if layer is None:
+            return
+        for field in layer.fields():
+            self.point_value_combo.addItem(field.name(), field.name())
+            self.point_id_combo.addItem(field.name(), field.name())
+        # CSV biçimindeki alan adları varsa önceden seçilir
+        for combo, name in ((self.point_value_combo, 'reference_value'), (self.point_id_combo, 'id')):
+            index = combo.findData(name)
+            if index >= 0:
+                combo.setCurrentIndex(index)
+    
+    def load_point_layers(self):
+        """Nokta katmanı listesini projedeki nokta katmanlarıyla doldur"""
+        self.point_layer_combo.clear()
+        for layer in QgsProject.instance().mapLayers().values():
+            if isinstance(layer, QgsVectorLayer) and layer.geometryType() == QgsWkbTypes.PointGeometry:
+                self.point_layer_combo.addItem(layer.name(), layer)
+    
     def load_raster_layers(self, combo):
         """Raster katmanlarını yükle"""
         combo.clear()
@@ -650,100 +799,50 @@ class AccuracyAssessmentDialog(QDialog):
         
         for layer in raster_layers:
             combo.addItem(layer.name(), layer)
+    
+    def load_batch_layers(self):
+        """Toplu karşılaştırma listesini raster katmanlarıyla doldur (işaretsiz)"""
+        self.batch_list.clear()
+        for layer in QgsProject.instance().mapLayers().values():
+            if isinstance(layer, QgsRasterLayer):
+                item = QListWidgetItem(layer.name())
+                item.setData(Qt.UserRole, layer)
+                item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+                item.setCheckState(Qt.Unchecked)
+                self.batch_list.addItem(item)
+    
+    def batch_layers(self, classified_layer):
+        """İşaretlenen toplu karşılaştırma haritaları (ana harita hariç)"""
+        layers = []
+        for i in range(self.batch_list.count()):
+            item = self.batch_list.item(i)
+            layer = item.data(Qt.UserRole)
+            if item.checkState() == Qt.Checked and layer is not None and layer.id() != classified_layer.id():
+                layers.append(layer)
+        return layers
+    
+    def run_validation(self):
+        """Doğrulama analizini başlat - uzun aşamalar arka plan görevinde çalışır"""
+        try:
+            point_layer = None
             
-    def generate_sampling_points(self, reference_layer, n_points, method):
-        """Örnekleme noktaları oluştur"""
-        extent = reference_layer.extent()
-        provider = reference_layer.dataProvider()
-        
-        points = []
-        max_attempts = n_points * 100
-        attempts = 0
-        
-        if method == 'random':
-            while len(points) < n_points and attempts < max_attempts:
-                x = random.uniform(extent.xMinimum(), extent.xMaximum())
-                y = random.uniform(extent.yMinimum(), extent.yMaximum())
-                
-                # Piksel koordinatlarına dönüştür
-                pixel_x = int((x - extent.xMinimum()) / reference_layer.rasterUnitsPerPixelX())
-                pixel_y = int((extent.yMaximum() - y) / reference_layer.rasterUnitsPerPixelY())
-                
-                # Raster sınırları içinde mi kontrol et
-                if 0 <= pixel_x < reference_layer.width() and 0 <= pixel_y < reference_layer.height():
-                    points.append({
-                        'x': pixel_x,
-                        'y': pixel_y,
-                        'coord_x': x,
-                        'coord_y': y
-                    })
-                    
-                attempts += 1
+            # CSV veya nokta katmanı kullanılıyorsa sadece classified harita yeterli
+            if self.point_layer_radio.isChecked():
+                classified_layer = self.classified_combo.currentData()
+                layer = self.point_layer_combo.currentData()
                 
-        elif method == 'systematic':
-            # Grid tabanlı sistematik örnekleme
-            grid_size = int(np.sqrt(n_points))
-            x_step = reference_layer.width() / grid_size
-            y_step = reference_layer.height() / grid_size
-            
-            for i in range(grid_size):
-                for j in range(grid_size):
-                    if len(points) >= n_points:
-                        break
-                        
-                    pixel_x = int(i * x_step + x_step / 2)
-                    pixel_y = int(j * y_step + y_step / 2)
-                    
-                    if 0 <= pixel_x < reference_layer.width() and 0 <= pixel_y < reference_layer.height():
-                        x = extent.xMinimum() + pixel_x * reference_layer.rasterUnitsPerPixelX()
-                        y = extent.yMaximum() - pixel_y * reference_layer.rasterUnitsPerPixelY()
-                        
-                        points.append({
-                            'x': pixel_x,
-                            'y': pixel_y,
-                            'coord_x': x,
-                            'coord_y': y
-                        })
-                        
-        elif method == 'stratified':
-            # Basit katmanlı örnekleme (her sınıftan eşit)
-            # Bu metod için önce referans raster'ı okuyup sınıfları bul
-            reference_data = provider.block(1, extent, reference_layer.width(), reference_layer.height())
-            reference_array = np.zeros((reference_layer.height(), reference_layer.width()))
-            
-            for y in range(reference_layer.height()):
-                for x in range(reference_layer.width()):
-                    reference_array[y, x] = reference_data.value(y, x)
-                    
-            unique_classes = np.unique(reference_array[~np.isnan(reference_array)])
-            points_per_class = n_points // len(unique_classes)
-            
-            for class_val in unique_classes:
-                class_points = np.argwhere(reference_array == class_val)
+                if not classified_layer or layer is None:
+                    QMessageBox.warning(self, "Uyarı / Warning",
+                        "Lütfen sınıflandırılmış haritayı ve nokta katmanını seçin!\n"
+                        "Please select the classified map and the point layer!")
+                    return
                 
-                if len(class_points) > 0:
-                    n_sample = min(points_per_class, len(class_points))
-                    sampled_indices = np.random.choice(len(class_points), n_sample, replace=False)
-                    
-                    for idx in sampled_indices:
-                        pixel_y, pixel_x = class_points[idx]
-                        x = extent.xMinimum() + pixel_x * reference_layer.rasterUnitsPerPixelX()
-                        y = extent.yMaximum() - pixel_y * reference_layer.rasterUnitsPerPixelY()
-                        
-                        points.append({
-                            'x': int(pixel_x),
-                            'y': int(pixel_y),
-                            'coord_x': float(x),
-                            'coord_y': float(y)
-                        })
-                        
-        return points
-        
-    def run_validation(self):
-        """Doğrulama analizini çalıştır"""
-        try:
-            # CSV kullanılıyorsa sadece classified harita yeterli
-            if self.csv_radio.isChecked():
+                reference_layer = None
+                csv_path = None
+                # Nesne kaynağı ana iş parçacığında oluşturulur; okuma arka planda yapılır
+                point_layer = PointLayerSource.from_layer(layer, self.point_value_combo.currentData(),
+                                                          self.point_id_combo.currentData())
+            elif self.csv_radio.isChecked():
                 classified_layer = self.classified_combo.currentData()
                 
                 if not classified_layer:
@@ -751,507 +850,185 @@ class AccuracyAssessmentDialog(QDialog):
                         "Lütfen sınıflandırılmış haritayı seçin!\n"
                         "Please select the classified map!")
                     return
-                    
-                reference_layer = None  # CSV'de gerek yok
-            else:
-                # Harita kontrolü
-                reference_layer = self.reference_combo.currentData()
-                classified_layer = self.classified_combo.currentData()
                 
-                if not reference_layer or not classified_layer:
-                    QMessageBox.warning(self, "Uyarı / Warning", 
-                        "Lütfen her iki haritayı da seçin!\n"
-                        "Please select both maps!")
-                    return
+                reference_layer = None  # CSV'de gerek yok
                 
-            # İlerleme göster
-            self.progress_bar.setVisible(True)
-            self.progress_bar.setValue(0)
-            self.result_text.clear()
-            self.result_text.append("⏳ Analiz başlatılıyor...\n⏳ Starting analysis...\n")
-            QApplication.processEvents()
-            
-            # Örnekleme noktalarını oluştur veya CSV'den yükle
-            self.progress_bar.setValue(10)
-            
-            csv_reference_values = None
-            point_ids = None
-            
-            if self.csv_radio.isChecked():
-                # CSV'den noktaları yükle
                 csv_path = self.csv_path_edit.text()
                 if not csv_path:
                     QMessageBox.warning(self, "Uyarı / Warning",
                         "Lütfen CSV dosyası seçin!\n"
                         "Please select a CSV file!")
-                    self.progress_bar.setVisible(False)
-                    return
-                
-                self.result_text.append("📍 CSV'den noktalar yükleniyor...\n📍 Loading points from CSV...\n")
-                QApplication.processEvents()
-                
-                # CSV yükleme için classified layer kullan
-                self.sampled_points, csv_reference_values, point_ids = self.load_points_from_csv(csv_path, classified_layer)
-                
-                if not self.sampled_points:
-                    QMessageBox.critical(self, "Hata / Error", 
-                        "CSV'den nokta yüklenemedi!\n"
-                        "Could not load points from CSV!")
-                    self.progress_bar.setVisible(False)
                     return
-                    
-                self.result_text.append(f"✓ {len(self.sampled_points)} nokta CSV'den yüklendi\n"
-                                      f"✓ {len(self.sampled_points)} points loaded from CSV\n")
             else:
-                # Raster'dan örnekleme yap
-                self.result_text.append("📍 Örnekleme noktaları oluşturuluyor...\n📍 Generating sampling points...\n")
-                QApplication.processEvents()
-                
-                n_points = self.points_spin.value()
-                method_id = self.method_group.checkedId()
-                method = {1: 'random', 2: 'stratified', 3: 'systematic'}[method_id]
-                
-                self.sampled_points = self.generate_sampling_points(reference_layer, n_points, method)
+                # Harita kontrolü
+                reference_layer = self.reference_combo.currentData()
+                classified_layer = self.classified_combo.currentData()
+                csv_path = None
                 
-                if not self.sampled_points:
-                    QMessageBox.critical(self, "Hata / Error", 
-                        "Örnekleme noktaları oluşturulamadı!\n"
-                        "Could not generate sampling points!")
-                    self.progress_bar.setVisible(False)
+                if not reference_layer or not classified_layer:
+                    QMessageBox.warning(self, "Uyarı / Warning", 
+                        "Lütfen her iki haritayı da seçin!\n"
+                        "Please select both maps!")
                     return
-                    
-                self.result_text.append(f"✓ {len(self.sampled_points)} nokta oluşturuldu\n"
-                                      f"✓ {len(self.sampled_points)} points generated\n")
-            QApplication.processEvents()
-            
-            # Raster verilerini oku
-            self.progress_bar.setValue(30)
-            self.result_text.append("\n📊 Raster verileri okunuyor...\n📊 Reading raster data...\n")
-            QApplication.processEvents()
             
-            # Sınıflandırılmış harita her zaman gerekli
-            classified_provider = classified_layer.dataProvider()
-            class_extent = classified_layer.extent()
-            
-            classified_data_block = classified_provider.block(1, class_extent, classified_layer.width(), classified_layer.height())
-            classified_data = np.zeros((classified_layer.height(), classified_layer.width()))
-            
-            for y in range(classified_layer.height()):
-                for x in range(classified_layer.width()):
-                    classified_data[y, x] = classified_data_block.value(y, x)
-            
-            # Referans harita sadece CSV kullanılmıyorsa gerekli
-            if not self.csv_radio.isChecked():
-                reference_provider = reference_layer.dataProvider()
-                ref_extent = reference_layer.extent()
-                
-                reference_data_block = reference_provider.block(1, ref_extent, reference_layer.width(), reference_layer.height())
-                reference_data = np.zeros((reference_layer.height(), reference_layer.width()))
-                
-                for y in range(reference_layer.height()):
-                    for x in range(reference_layer.width()):
-                        reference_data[y, x] = reference_data_block.value(y, x)
-            
-            self.progress_bar.setValue(50)
-            
-            # Noktalardaki değerleri al
-            if csv_reference_values is not None:
-                # CSV'den referans değerleri kullan
-                reference_values = []
-                classified_values = []
-                valid_points = []
-                
-                class_extent = classified_layer.extent()
-                
-                for i, point in enumerate(self.sampled_points):
-                    coord_x = point['coord_x']
-                    coord_y = point['coord_y']
-                    
-                    # Sınıflandırılmış raster için piksel konumu
-                    class_pixel_x = int((coord_x - class_extent.xMinimum()) / classified_layer.rasterUnitsPerPixelX())
-                    class_pixel_y = int((class_extent.yMaximum() - coord_y) / classified_layer.rasterUnitsPerPixelY())
-                    
-                    # Sınırlar içinde mi?
-                    if (0 <= class_pixel_x < classified_layer.width() and 
-                        0 <= class_pixel_y < classified_layer.height()):
-                        
-                        class_val = classified_data[class_pixel_y, class_pixel_x]
-                        ref_val = csv_reference_values[i]
-                        
-                        # NoData kontrolü
-                        is_ref_valid = not (np.isnan(ref_val) or ref_val == -9999 or ref_val is None)
-                        is_class_valid = not (np.isnan(class_val) or class_val == -9999 or class_val is None)
-                        
-                        if is_ref_valid and is_class_valid:
-                            reference_values.append(ref_val)
-                            classified_values.append(class_val)
-                            valid_points.append(point)
-                
-                self.sampled_points = valid_points
-                self.result_text.append(f"✓ CSV referans değerleri kullanıldı\n"
-                                      f"✓ Using CSV reference values\n")
-                
-            else:
-                # Her iki raster'dan da değerleri al
-                reference_values = []
-                classified_values = []
-                
-                ref_extent = reference_layer.extent()
-                class_extent = classified_layer.extent()
-                
-                valid_points = []
-                
-                for point in self.sampled_points:
-                    # Koordinatları kullanarak her raster için ayrı piksel konumu hesapla
-                    coord_x = point['coord_x']
-                    coord_y = point['coord_y']
-                    
-                    # Referans raster için piksel konumu
-                    ref_pixel_x = int((coord_x - ref_extent.xMinimum()) / reference_layer.rasterUnitsPerPixelX())
-                    ref_pixel_y = int((ref_extent.yMaximum() - coord_y) / reference_layer.rasterUnitsPerPixelY())
-                    
-                    # Sınıflandırılmış raster için piksel konumu
-                    class_pixel_x = int((coord_x - class_extent.xMinimum()) / classified_layer.rasterUnitsPerPixelX())
-                    class_pixel_y = int((class_extent.yMaximum() - coord_y) / classified_layer.rasterUnitsPerPixelY())
-                    
-                    # Her iki raster'da da geçerli mi kontrol et
-                    if (0 <= ref_pixel_x < reference_layer.width() and 
-                        0 <= ref_pixel_y < reference_layer.height() and
-                        0 <= class_pixel_x < classified_layer.width() and 
-                        0 <= class_pixel_y < classified_layer.height()):
-                        
-                        ref_val = reference_data[ref_pixel_y, ref_pixel_x]
-                        class_val = classified_data[class_pixel_y, class_pixel_x]
-                        
-                        # NoData değerlerini atla (-9999, NaN, None)
-                        is_ref_valid = not (np.isnan(ref_val) or ref_val == -9999 or ref_val is None)
-                        is_class_valid = not (np.isnan(class_val) or class_val == -9999 or class_val is None)
-                        
-                        if is_ref_valid and is_class_valid:
-                            reference_values.append(ref_val)
-                            classified_values.append(class_val)
-                            valid_points.append(point)
-                
-                self.sampled_points = valid_points
-            
-            if len(reference_values) == 0:
-                QMessageBox.critical(self, "Hata / Error", 
-                    "Geçerli örnekleme noktası bulunamadı!\n"
-                    "No valid sampling points found!\n"
-                    "Raster haritalarının extent ve CRS değerlerini kontrol edin.")
-                self.progress_bar.setVisible(False)
-                return
-            
-            self.result_text.append(f"✓ {len(reference_values)} geçerli nokta kullanılıyor\n"
-                                  f"✓ Using {len(reference_values)} valid points\n")
-            QApplication.processEvents()
-            
-            # Sınıf eşleştirme dialogunu aç - TÜM raster'dan benzersiz değerleri al
-            self.result_text.append("\n🔍 Tüm sınıf değerleri okunuyor...\n🔍 Reading all class values...\n")
-            QApplication.processEvents()
-            
-            # CSV kullanılıyorsa, sadece CSV'deki ve classified'daki değerleri kullan
-            if csv_reference_values is not None:
-                # CSV'den benzersiz referans değerleri
-                ref_unique_values = set(reference_values)
-                
-                # Sınıflandırılmış haritadan tüm benzersiz değerleri al
-                class_unique_values = set()
-                for y in range(classified_layer.height()):
-                    for x in range(classified_layer.width()):
-                        val = classified_data[y, x]
-                        if not (np.isnan(val) or val == -9999 or val is None):
-                            class_unique_values.add(val)
-            else:
-                # Referans haritasından tüm benzersiz değerleri al
-                ref_unique_values = set()
-                for y in range(reference_layer.height()):
-                    for x in range(reference_layer.width()):
-                        val = reference_data[y, x]
-                        if not (np.isnan(val) or val == -9999 or val is None):
-                            ref_unique_values.add(val)
-                
-                # Sınıflandırılmış haritadan tüm benzersiz değerleri al
-                class_unique_values = set()
-                for y in range(classified_layer.height()):
-                    for x in range(classified_layer.width()):
-                        val = classified_data[y, x]
-                        if not (np.isnan(val) or val == -9999 or val is None):
-                            class_unique_values.add(val)
-            
-            self.result_text.append(f"✓ Referans: {len(ref_unique_values)} benzersiz sınıf\n")
-            self.result_text.append(f"✓ Reference: {len(ref_unique_values)} unique classes\n")
-            self.result_text.append(f"✓ Sınıflandırılmış: {len(class_unique_values)} benzersiz sınıf\n")
-            self.result_text.append(f"✓ Classified: {len(class_unique_values)} unique classes\n")
-            QApplication.processEvents()
-            
-            self.result_text.append("\n🔄 Sınıf eşleştirme bekleniyor...\n🔄 Waiting for class mapping...\n")
-            QApplication.processEvents()
-            
-            mapping_dialog = ClassMappingDialog(list(ref_unique_values), list(class_unique_values), self)
-            if mapping_dialog.exec_() != QDialog.Accepted:
-                self.progress_bar.setVisible(False)
-                self.result_text.append("\n❌ Analiz iptal edildi\n❌ Analysis cancelled\n")
-                return
-                
-            reference_mapping, classified_mapping, class_names = mapping_dialog.get_mappings()
-            
-            # ÖNEMLİ DÜZELTME: Kategorileri dönüştür ve TÜM sınıfları dahil et
-            self.progress_bar.setValue(60)
-            self.result_text.append("\n🔢 Sınıf kategorileri uygulanıyor...\n🔢 Applying class categories...\n")
-            QApplication.processEvents()
-            
-            # Tüm benzersiz kategorileri topla (hem referans hem sınıflandırılmış)
-            all_categories = sorted(set(list(reference_mapping.values()) + list(classified_mapping.values())))
-            
-            # Değerleri kategorilere dönüştür
-            reference_categories = []
-            classified_categories = []
-            
-            for ref_val, class_val in zip(reference_values, classified_values):
-                if ref_val in reference_mapping and class_val in classified_mapping:
-                    reference_categories.append(reference_mapping[ref_val])
-                    classified_categories.append(classified_mapping[class_val])
-            
-            # Karmaşıklık matrisi için sınıf etiketlerini hazırla
-            sorted_categories = sorted(all_categories)
-            category_labels = [class_names.get(cat, f"Kategori_{cat}") for cat in sorted_categories]
-            
-            self.result_text.append(f"✓ Toplam {len(all_categories)} kategori tanımlandı\n")
-            self.result_text.append(f"✓ Total {len(all_categories)} categories defined\n")
-            for cat in sorted_categories:
-                self.result_text.append(f"  - Kategori {cat}: {class_names.get(cat, f'Kategori_{cat}')}\n")
-            QApplication.processEvents()
-            
-            # Metrikleri hesapla
-            self.progress_bar.setValue(80)
-            self.result_text.append("\n📈 Metrikler hesaplanıyor...\n📈 Calculating metrics...\n")
-            QApplication.processEvents()
-            
-            # DÜZELTME: labels parametresi ile tüm kategorileri dahil et
-            cm = confusion_matrix(reference_categories, classified_categories, labels=sorted_categories)
-            overall_accuracy = accuracy_score(reference_categories, classified_categories)
-            kappa = cohen_kappa_score(reference_categories, classified_categories)
-            
-            # F1, Precision, Recall - zero_division parametresi ile sıfır bölme hatalarını önle
-            f1_macro = f1_score(reference_categories, classified_categories, 
-                               labels=sorted_categories, average='macro', zero_division=0)
-            f1_weighted = f1_score(reference_categories, classified_categories, 
-                                  labels=sorted_categories, average='weighted', zero_division=0)
-            precision_macro = precision_score(reference_categories, classified_categories, 
-                                             labels=sorted_categories, average='macro', zero_division=0)
-            recall_macro = recall_score(reference_categories, classified_categories, 
-                                       labels=sorted_categories, average='macro', zero_division=0)
-            
-            # R², RMSE, MAE, Bias - Regresyon metrikleri (ham piksel değerleri üzerinden)
-            ref_arr = np.array(reference_values, dtype=float)
-            cls_arr = np.array(classified_values, dtype=float)
-            
-            r2 = r2_score(ref_arr, cls_arr)
-            rmse = np.sqrt(mean_squared_error(ref_arr, cls_arr))
-            mae = mean_absolute_error(ref_arr, cls_arr)
-            bias = float(np.mean(cls_arr - ref_arr))
-            
-            # Kategorik değerler üzerinden de hesapla (sınıf bazlı)
-            ref_cat_arr = np.array(reference_categories, dtype=float)
-            cls_cat_arr = np.array(classified_categories, dtype=float)
-            
-            r2_cat = r2_score(ref_cat_arr, cls_cat_arr)
-            rmse_cat = np.sqrt(mean_squared_error(ref_cat_arr, cls_cat_arr))
-            mae_cat = mean_absolute_error(ref_cat_arr, cls_cat_arr)
-            bias_cat = float(np.mean(cls_cat_arr - ref_cat_arr))
-            
-            # Detaylı sınıf raporu
-            class_report = classification_report(
-                reference_categories, 
-                classified_categories,
-                labels=sorted_categories,
-                target_names=category_labels,
-                zero_division=0,
-                output_dict=True
-            )
-            
-            self.progress_bar.setValue(90)
-            
-            # Sonuçları kaydet
-            self.validation_results = {
-                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'reference_map': 'CSV Data' if csv_reference_values is not None else reference_layer.name(),
-                'classified_map': classified_layer.name(),
-                'n_points': len(reference_categories),
-                'sampling_method': 'CSV File' if csv_reference_values is not None else method,
-                'overall_accuracy': float(overall_accuracy),
-                'kappa': float(kappa),
-                'f1_macro': float(f1_macro),
-                'f1_weighted': float(f1_weighted),
-                'precision_macro': float(precision_macro),
-                'recall_macro': float(recall_macro),
-                'r2': float(r2),
-                'rmse': float(rmse),
-                'mae': float(mae),
-                'bias': float(bias),
-                'r2_cat': float(r2_cat),
-                'rmse_cat': float(rmse_cat),
-                'mae_cat': float(mae_cat),
-                'bias_cat': float(bias_cat),
-                'confusion_matrix': cm.tolist(),
-                'class_names': category_labels,
-                'class_report': class_report,
-                'all_categories': sorted_categories
+            # Toplu karşılaştırma haritaları aynı koordinatlarla örneklenir
+            batch_layers = self.batch_layers(classified_layer)
+            for layer in batch_layers:
+                if layer.crs() != classified_layer.crs():
+                    raise ValueError(f"{layer.name()}: CRS sınıflandırılmış haritadan farklı / "
+                                     f"CRS differs from the classified map")
+            
+            # Tüm piksel modunda rasterlar aynı ızgarada olmalı
+            exhaustive = self.exhaustive_radio.isChecked()
+            if exhaustive:
+                for layer in [classified_layer] + batch_layers:
+                    check_alignment(reference_layer, layer)
+            
+            bands = parse_bands(self.bands_edit.text(),
+                                min(layer.bandCount() for layer in [classified_layer] + batch_layers))
+            
+            method_id = self.method_group.checkedId()
+            method = {1: 'random', 2: 'stratified', 3: 'systematic', 4: 'CSV File', 5: 'exhaustive',
+                      6: 'Point Layer'}[method_id]
+            
+            # Arka plan görevine yalnızca iş parçacığı güvenli kopyalar aktarılır;
+            # raster okumaları bu çalıştırmaya ait sayaçta toplanır
+            reads = TimeCounter()
+            params = {
+                'csv_path': csv_path,
+                'point_layer': point_layer,
+                'exhaustive': exhaustive,
+                'method': method,
+                'n_points': self.points_spin.value(),
+                'workers': self.workers_spin.value(),
+                'bands': bands,
+                'allocation': self.allocation_combo.currentData(),
+                'min_per_class': self.min_per_class_spin.value(),
+                'reservoir': self.reservoir_check.isChecked(),
+                'dedupe': self.dedupe_check.isChecked(),
+                'min_distance': self.min_distance_spin.value(),
+                'trace_memory': trace_memory_enabled(),
+                'seed': None,
+                'reference': RasterSource(reference_layer, reads) if reference_layer else None,
+                'classified': RasterSource(classified_layer, reads),
+                'batch': [RasterSource(layer, reads) for layer in batch_layers],
+                'raster_reads': reads,
+                'transform_context': QgsProject.instance().transformContext(),
             }
-            
-            # Sonuçları görüntüle
-            self.display_results()
-            
-            self.progress_bar.setValue(100)
-            self.export_button.setEnabled(True)
-            self.save_points_button.setEnabled(True)
-            
-            QMessageBox.information(self, "Başarılı / Success", 
-                "✓ Doğrulama analizi tamamlandı!\n"
-                "✓ Validation analysis completed!")
-            
+        
         except Exception as e:
             QMessageBox.critical(self, "Hata / Error", 
                 f"Analiz sırasında hata oluştu / Error during analysis:\n{str(e)}")
-        finally:
-            self.progress_bar.setVisible(False)
-            
-    def display_results(self):
-        """Sonuçları göster"""
-        results = self.validation_results
-        
-        output = "=" * 80 + "\n"
-        output += "RASTER ACCURACY ASSESSMENT RESULTS / RASTER DOĞRULAMA ANALİZİ SONUÇLARI\n"
-        output += "=" * 80 + "\n\n"
-        
-        output += f"📅 Analiz Tarihi / Analysis Date: {results['timestamp']}\n"
-        output += f"📍 Nokta Sayısı / Number of Points: {results['n_points']}\n"
-        output += f"🎯 Örnekleme Metodu / Sampling Method: {results['sampling_method'].upper()}\n\n"
-        
-        output += "-" * 80 + "\n"
-        output += "PRIMARY METRICS / TEMEL METRİKLER\n"
-        output += "-" * 80 + "\n"
-        output += f"Overall Accuracy (OA)       : {results['overall_accuracy']:.4f} ({results['overall_accuracy']*100:.2f}%)\n"
-        output += f"Cohen's Kappa (κ)           : {results['kappa']:.4f}\n"
-        output += f"F1-Score (Macro)            : {results['f1_macro']:.4f}\n"
-        output += f"F1-Score (Weighted)         : {results['f1_weighted']:.4f}\n"
-        output += f"Precision (Macro)           : {results['precision_macro']:.4f}\n"
-        output += f"Recall (Macro)              : {results['recall_macro']:.4f}\n\n"
-        
-        # Kappa yorumlama
-        kappa_val = results['kappa']
-        if kappa_val < 0:
-            kappa_interp = "Poor (Zayıf)"
-        elif kappa_val < 0.20:
-            kappa_interp = "Slight (Hafif)"
-        elif kappa_val < 0.40:
-            kappa_interp = "Fair (Orta)"
-        elif kappa_val < 0.60:
-            kappa_interp = "Moderate (İyi)"
-        elif kappa_val < 0.80:
-            kappa_interp = "Substantial (Çok İyi)"
-        else:
-            kappa_interp = "Almost Perfect (Mükemmel)"
-            
-        output += f"Kappa Interpretation        : {kappa_interp}\n\n"
-        
-        # Regresyon istatistikleri - ham piksel değerleri
-        output += "-" * 80 + "\n"
-        output += "REGRESSION STATISTICS (Raw Pixel Values) / REGRESYON İSTATİSTİKLERİ (Ham Piksel)\n"
-        output += "-" * 80 + "\n"
-        output += f"R² (Coeff. of Determination): {results['r2']:.4f}\n"
-        output += f"RMSE (Root Mean Sq. Error) : {results['rmse']:.4f}\n"
-        output += f"MAE  (Mean Absolute Error)  : {results['mae']:.4f}\n"
-        output += f"Bias (Mean Error)           : {results['bias']:.4f}"
-        bias_dir = " (Overestimation / Fazla Tahmin)" if results['bias'] > 0 else " (Underestimation / Az Tahmin)" if results['bias'] < 0 else " (No Bias / Sapma Yok)"
-        output += f"{bias_dir}\n\n"
-        
-        # Regresyon istatistikleri - kategorik değerler
-        output += "-" * 80 + "\n"
-        output += "REGRESSION STATISTICS (Category Values) / REGRESYON İSTATİSTİKLERİ (Kategori)\n"
-        output += "-" * 80 + "\n"
-        output += f"R² (Coeff. of Determination): {results['r2_cat']:.4f}\n"
-        output += f"RMSE (Root Mean Sq. Error) : {results['rmse_cat']:.4f}\n"
-        output += f"MAE  (Mean Absolute Error)  : {results['mae_cat']:.4f}\n"
-        output += f"Bias (Mean Error)           : {results['bias_cat']:.4f}"
-        bias_dir_cat = " (Overestimation / Fazla Tahmin)" if results['bias_cat'] > 0 else " (Underestimation / Az Tahmin)" if results['bias_cat'] < 0 else " (No Bias / Sapma Yok)"
-        output += f"{bias_dir_cat}\n\n"
-        output += "-" * 80 + "\n"
-        
-        # Karmaşıklık matrisini tablo olarak göster
-        cm = np.array(results['confusion_matrix'])
-        class_names = results['class_names']
-        
-        # Başlık satırı
-        header = "Reference \\ Predicted".ljust(25)
-        for name in class_names:
-            header += f"{name[:12]:>14}"
-        output += header + "\n"
-        output += "-" * 80 + "\n"
-        
-        # Matris satırları
-        for i, row in enumerate(cm):
-            line = f"{class_names[i][:23]:23}  "
-            for val in row:
-                line += f"{val:>14}"
-            output += line + "\n"
-            
-        output += "\n"
-        
-        output += "-" * 80 + "\n"
-        output += "PER-CLASS METRICS / SINIF BAZLI METRİKLER\n"
-        output += "-" * 80 + "\n"
-        
-        # Her sınıf için detaylı metrikler
-        class_report = results['class_report']
-        
-        output += f"{'Class/Sınıf':<25} {'Precision':<12} {'Recall':<12} {'F1-Score':<12} {'Support':<10}\n"
-        output += "-" * 80 + "\n"
-        
-        for class_name in class_names:
-            if class_name in class_report:
-                metrics = class_report[class_name]
-                output += f"{class_name:<25} "
-                output += f"{metrics['precision']:<12.4f} "
-                output += f"{metrics['recall']:<12.4f} "
-                output += f"{metrics['f1-score']:<12.4f} "
-                output += f"{int(metrics['support']):<10}\n"
-                
-        output += "\n"
-        
-        # Producer's ve User's Accuracy
-        output += "-" * 80 + "\n"
-        output += "PRODUCER'S & USER'S ACCURACY / ÜRETİCİ VE KULLANICI DOĞRULUĞU\n"
-        output += "-" * 80 + "\n"
-        
-        output += f"{'Class/Sınıf':<25} {'Producer Acc.':<15} {'User Acc.':<15}\n"
-        output += "-" * 80 + "\n"
-        
-        for i, class_name in enumerate(class_names):
-            # Producer's Accuracy = Recall
-            # User's Accuracy = Precision
-            if class_name in class_report:
-                producer_acc = class_report[class_name]['recall']
-                user_acc = class_report[class_name]['precision']
-                
-                output += f"{class_name:<25} "
-                output += f"{producer_acc:<15.4f} "
-                output += f"{user_acc:<15.4f}\n"
-                
-        output += "\n"
-        output += "=" * 80 + "\n"
+            return
+        
+        # Raster blok önbelleğinin bellek sınırı
+        RASTER_CACHE.set_budget(self.cache_spin.value() * 1024 * 1024)
+        
+        # İlerleme göster
+        self.result_text.clear()
+        self.result_text.append("⏳ Analiz başlatılıyor...\n⏳ Starting analysis...\n")
+        self.export_button.setEnabled(False)
+        self.save_points_button.setEnabled(False)
+        
+        self.start_task("Doğrulama: örnekleme / Validation: sampling",
+                        lambda task: prepare_validation(task, params),
+                        self.on_preparation_finished)
+    
+    def start_task(self, description, function, on_finished):
+        """Bir doğrulama aşamasını görev yöneticisinde başlat"""
+        self.task = ValidationTask(description, function, on_finished)
+        self.task.progressChanged.connect(lambda value: self.progress_bar.setValue(int(value)))
+        self.task.message.connect(self.result_text.append)
+        
+        self.progress_bar.setVisible(True)
+        self.validate_button.setEnabled(False)
+        self.cancel_button.setVisible(True)
+        
+        QgsApplication.taskManager().addTask(self.task)
+    
+    def cancel_task(self):
+        """Çalışan doğrulama görevini iptal et"""
+        if self.task is not None:
+            self.task.cancel()
+    
+    def end_task(self, success, exception):
+        """Görev bittiğinde arayüzü sıfırla; görev başarılıysa True döndür"""
+        self.task = None
+        self.progress_bar.setVisible(False)
+        self.validate_button.setEnabled(True)
+        self.cancel_button.setVisible(False)
+        
+        if exception is not None:
+            QMessageBox.critical(self, "Hata / Error", 
+                f"Analiz sırasında hata oluştu / Error during analysis:\n{str(exception)}")
+            return False
+        if not success:
+            self.result_text.append("\n❌ Analiz iptal edildi\n❌ Analysis cancelled\n")
+            return False
+        return True
+    
+    def on_preparation_finished(self, success, state, exception):
+        """Örnekleme bitti - sınıf eşleştirmeyi ana iş parçacığında sor, sonra metrikleri başlat"""
+        if not self.end_task(success, exception):
+            return
         
-        self.result_text.setPlainText(output)
+        self.samples = state['samples']
+        self.profiler = state['profiler']
         
+        self.result_text.append("\n🔄 Sınıf eşleştirme bekleniyor...\n🔄 Waiting for class mapping...\n")
+        
+        # Kullanıcı beklemesi de bir aşama olarak ölçülür (bellek izlenmez)
+        with self.profiler.stage('mapping', trace_memory=False):
+            mapping_dialog = ClassMappingDialog(list(state['ref_value_counts']), list(state['class_value_counts']),
+                                                self, reference_counts=state['ref_value_counts'],
+                                                classified_counts=state['class_value_counts'])
+            accepted = mapping_dialog.exec_() == QDialog.Accepted
+            mappings = mapping_dialog.get_mappings() if accepted else None
+        if not accepted:
+            self.result_text.append("\n❌ Analiz iptal edildi\n❌ Analysis cancelled\n")
+            return
+        
+        self.start_task("Doğrulama: metrikler / Validation: metrics",
+                        lambda task: compute_validation(task, state, mappings),
+                        lambda success, results, exception: self.on_validation_finished(
+                            success, results, exception, state['samples']))
+        self.progress_bar.setValue(60)
+    
+    def on_validation_finished(self, success, results, exception, samples=None):
+        """Metrikler hazır - sonuçları ana iş parçacığında göster"""
+        if not self.end_task(success, exception):
+            return
+        
+        self.validation_results = results
+        self.samples = samples
+        
+        # Sonuçları görüntüle
+        self.display_results()
+        
+        self.export_button.setEnabled(True)
+        self.save_points_button.setEnabled(self.samples is not None and len(self.samples) > 0)
+        
+        QMessageBox.information(self, "Başarılı / Success", 
+            "✓ Doğrulama analizi tamamlandı!\n"
+            "✓ Validation analysis completed!")
+    
+    def display_results(self):
+        """Sonuçları göster"""
+        self.result_text.setPlainText(text_report(self.validation_results))
+    
+    def update_performance(self):
+        """Aşama ölçümlerini sonuçlara yeniden yaz ve raporu tazele"""
+        self.validation_results['performance'] = self.profiler.as_dict()
+        self.display_results()
+    
     def save_validation_points(self):
         """Doğrulama noktalarını shapefile olarak kaydet"""
-        if not self.sampled_points or not self.validation_results:
+        if self.samples is None or not len(self.samples) or not self.validation_results:
             QMessageBox.warning(self, "Uyarı / Warning", 
                 "Önce doğrulama analizi yapmalısınız!\n"
                 "You must run validation analysis first!")
             return
-            
+        
         try:
             file_path, _ = QFileDialog.getSaveFileName(
                 self, "Noktaları Kaydet / Save Points", 
@@ -1261,14 +1038,6 @@ class AccuracyAssessmentDialog(QDialog):
             
             if not file_path:
                 return
-                
-            # Katman oluştur
-            fields = [
-                QgsField("point_id", QVariant.Int),
-                QgsField("ref_value", QVariant.Double),
-                QgsField("class_value", QVariant.Double),
-                QgsField("match", QVariant.String)
-            ]
             
             # CRS'i classified layer'dan al
             classified_layer = self.classified_combo.currentData()
@@ -1277,102 +1046,22 @@ class AccuracyAssessmentDialog(QDialog):
             # Vector layer oluştur
             vector_layer = QgsVectorLayer(f"Point?crs={crs.authid()}", "validation_points", "memory")
             provider = vector_layer.dataProvider()
-            provider.addAttributes(fields)
+            provider.addAttributes(point_fields(self.samples).toList())
             vector_layer.updateFields()
             
-            # Noktaları ekle
-            features = []
-            
-            # CSV kullanıldı mı kontrol et
-            is_csv = self.validation_results['reference_map'] == 'CSV Data'
-            
-            if is_csv:
-                # CSV kullanıldıysa, sadece classified layer'ı oku
-                class_extent = classified_layer.extent()
-                classified_provider = classified_layer.dataProvider()
-                classified_data_block = classified_provider.block(1, class_extent, classified_layer.width(), classified_layer.height())
-                classified_data = np.zeros((classified_layer.height(), classified_layer.width()))
-                
-                for y in range(classified_layer.height()):
-                    for x in range(classified_layer.width()):
-                        classified_data[y, x] = classified_data_block.value(y, x)
-                
-                # Noktaları ekle - referans değerleri validation_results'tan al
-                for i, point in enumerate(self.sampled_points):
-                    feature = QgsFeature()
-                    feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(point['coord_x'], point['coord_y'])))
-                    
-                    coord_x = point['coord_x']
-                    coord_y = point['coord_y']
-                    
-                    class_pixel_x = int((coord_x - class_extent.xMinimum()) / classified_layer.rasterUnitsPerPixelX())
-                    class_pixel_y = int((class_extent.yMaximum() - coord_y) / classified_layer.rasterUnitsPerPixelY())
-                    
-                    class_val = classified_data[class_pixel_y, class_pixel_x]
-                    
-                    # Referans değeri point'in kendisinde saklı olabilir veya sırayla alınabilir
-                    ref_val = point.get('ref_value', i+1)  # Varsayılan değer
-                    
-                    match = "Yes" if abs(ref_val - class_val) < 0.001 else "No"
-                    
-                    feature.setAttributes([i+1, float(ref_val), float(class_val), match])
-                    features.append(feature)
-            else:
-                # Normal raster-raster durumu
-                reference_layer = self.reference_combo.currentData()
-                
-                ref_extent = reference_layer.extent()
-                class_extent = classified_layer.extent()
-                
-                reference_provider = reference_layer.dataProvider()
-                classified_provider = classified_layer.dataProvider()
-                
-                reference_data_block = reference_provider.block(1, ref_extent, reference_layer.width(), reference_layer.height())
-                classified_data_block = classified_provider.block(1, class_extent, classified_layer.width(), classified_layer.height())
-                
-                reference_data = np.zeros((reference_layer.height(), reference_layer.width()))
-                classified_data = np.zeros((classified_layer.height(), classified_layer.width()))
+            with self.profiler.stage('export'):
+                # Noktaları ekle - değerler ve kategoriler örnek tablosundan okunur
+                provider.addFeatures(list(point_features(self.samples, vector_layer.fields())))
                 
-                for y in range(reference_layer.height()):
-                    for x in range(reference_layer.width()):
-                        reference_data[y, x] = reference_data_block.value(y, x)
-                        
-                for y in range(classified_layer.height()):
-                    for x in range(classified_layer.width()):
-                        classified_data[y, x] = classified_data_block.value(y, x)
-                
-                # Noktaları ekle - normal raster durumu
-                for i, point in enumerate(self.sampled_points):
-                    feature = QgsFeature()
-                    feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(point['coord_x'], point['coord_y'])))
-                    
-                    # Koordinatları kullanarak değerleri al
-                    coord_x = point['coord_x']
-                    coord_y = point['coord_y']
-                    
-                    ref_pixel_x = int((coord_x - ref_extent.xMinimum()) / reference_layer.rasterUnitsPerPixelX())
-                    ref_pixel_y = int((ref_extent.yMaximum() - coord_y) / reference_layer.rasterUnitsPerPixelY())
-                    
-                    class_pixel_x = int((coord_x - class_extent.xMinimum()) / classified_layer.rasterUnitsPerPixelX())
-                    class_pixel_y = int((class_extent.yMaximum() - coord_y) / classified_layer.rasterUnitsPerPixelY())
-                    
-                    ref_val = reference_data[ref_pixel_y, ref_pixel_x]
-                    class_val = classified_data[class_pixel_y, class_pixel_x]
-                    match = "Yes" if abs(ref_val - class_val) < 0.001 else "No"
-                    
-                    feature.setAttributes([i+1, float(ref_val), float(class_val), match])
-                    features.append(feature)
-                
-            provider.addFeatures(features)
-            
-            # Dosyaya kaydet
-            error = QgsVectorFileWriter.writeAsVectorFormat(
-                vector_layer,
-                file_path,
-                "UTF-8",
-                crs,
-                "ESRI Shapefile"
-            )
+                # Dosyaya kaydet
+                error = QgsVectorFileWriter.writeAsVectorFormat(
+                    vector_layer,
+                    file_path,
+                    "UTF-8",
+                    crs,
+                    "ESRI Shapefile"
+                )
+            self.update_performance()
             
             if error[0] == QgsVectorFileWriter.NoError:
                 # QGIS'e ekle
@@ -1385,11 +1074,11 @@ class AccuracyAssessmentDialog(QDialog):
             else:
                 QMessageBox.critical(self, "Hata / Error", 
                     f"Noktalar kaydedilirken hata oluştu / Error saving points:\n{error[1]}")
-                    
+        
         except Exception as e:
             QMessageBox.critical(self, "Hata / Error", 
                 f"Noktalar kaydedilirken hata oluştu / Error saving points:\n{str(e)}")
-            
+    
     def export_results(self):
         """Sonuçları dosyaya aktar"""
         try:
@@ -1401,215 +1090,33 @@ class AccuracyAssessmentDialog(QDialog):
             
             if not file_path:
                 return
+            
+            # Rapor önceki dışa aktarmaların sürelerini içerir; bu dışa aktarma sonrakilere eklenir
+            with self.profiler.stage('export'):
+                if file_path.endswith('.json'):
+                    with open(file_path, 'w', encoding='utf-8') as f:
+                        json.dump(self.validation_results, f, indent=2, ensure_ascii=False)
                 
-            if file_path.endswith('.json'):
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(self.validation_results, f, indent=2, ensure_ascii=False)
-                    
-            elif file_path.endswith('.html'):
-                html_content = self.generate_html_report()
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(html_content)
-                    
-            else:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(self.result_text.toPlainText())
-                    
+                elif file_path.endswith('.html'):
+                    html_content = html_report(self.validation_results)
+                    with open(file_path, 'w', encoding='utf-8') as f:
+                        f.write(html_content)
+                
+                else:
+                    with open(file_path, 'w', encoding='utf-8') as f:
+                        f.write(self.result_text.toPlainText())
+            self.update_performance()
+            
             QMessageBox.information(self, "Başarılı / Success", 
                 f"Rapor başarıyla kaydedildi!\n"
                 f"Report saved successfully!\n\n{file_path}")
-                
+        
         except Exception as e:
             QMessageBox.critical(self, "Hata / Error", 
                 f"Rapor kaydedilirken hata oluştu / Error saving report:\n{str(e)}")
-                
-    def generate_html_report(self):
-        """HTML raporu oluştur"""
-        results = self.validation_results
-        
-        html = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>Raster Accuracy Assessment Report</title>
-    <style>
-        body {{ 
-            font-family: 'Segoe UI', Arial, sans-serif; 
-            margin: 40px; 
-            background: #f5f5f5;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            padding: 30px;
-            border-radius: 10px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        h1 {{ 
-            color: #2c3e50; 
-            border-bottom: 4px solid #3498db; 
-            padding-bottom: 10px;
-        }}
-        h2 {{ 
-            color: #34495e; 
-            margin-top: 30px;
-            border-left: 5px solid #3498db;
-            padding-left: 15px;
-        }}
-        .metric {{ 
-            background: #ecf0f1; 
-            padding: 15px; 
-            margin: 15px 0; 
-            border-radius: 8px;
-            border-left: 5px solid #3498db;
-        }}
-        .metric-value {{
-            font-size: 1.3em;
-            font-weight: bold;
-            color: #2c3e50;
-        }}
-        table {{ 
-            border-collapse: collapse; 
-            width: 100%; 
-            margin: 20px 0;
-            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-        }}
-        th, td {{ 
-            border: 1px solid #ddd; 
-            padding: 12px; 
-            text-align: center; 
-        }}
-        th {{ 
-            background-color: #3498db; 
-            color: white;
-            font-weight: bold;
-        }}
-        tr:nth-child(even) {{ background-color: #f9f9f9; }}
-        tr:hover {{ background-color: #f5f5f5; }}
-        .footer {{
-            margin-top: 40px;
-            padding-top: 20px;
-            border-top: 2px solid #ecf0f1;
-            color: #7f8c8d;
-            font-size: 0.9em;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>🌍 Raster Accuracy Assessment Report</h1>
-        <p><strong>Analysis Date:</strong> {results['timestamp']}</p>
-        
-        <h2>📊 Primary Metrics / Temel Metrikler</h2>
-        <div class="metric">
-            <p><strong>Overall Accuracy (OA):</strong> 
-            <span class="metric-value">{results['overall_accuracy']:.4f} ({results['overall_accuracy']*100:.2f}%)</span></p>
-        </div>
-        <div class="metric">
-            <p><strong>Cohen's Kappa (κ):</strong> 
-            <span class="metric-value">{results['kappa']:.4f}</span></p>
-        </div>
-        <div class="metric">
-            <p><strong>F1-Score (Macro):</strong> 
-            <span class="metric-value">{results['f1_macro']:.4f}</span></p>
-            <p><strong>F1-Score (Weighted):</strong> 
-            <span class="metric-value">{results['f1_weighted']:.4f}</span></p>
-        </div>
-        <div class="metric">
-            <p><strong>Precision (Macro):</strong> {results['precision_macro']:.4f}</p>
-            <p><strong>Recall (Macro):</strong> {results['recall_macro']:.4f}</p>
-        </div>
-        
-        <h2>📐 Regression Statistics / Regresyon İstatistikleri</h2>
-        <div class="metric">
-            <p><em>Ham Piksel Değerleri / Raw Pixel Values</em></p>
-            <p><strong>R² (Determination Coeff.):</strong> <span class="metric-value">{results['r2']:.4f}</span></p>
-            <p><strong>RMSE (Root Mean Sq. Error):</strong> <span class="metric-value">{results['rmse']:.4f}</span></p>
-            <p><strong>MAE (Mean Absolute Error):</strong> <span class="metric-value">{results['mae']:.4f}</span></p>
-            <p><strong>Bias (Mean Error):</strong> <span class="metric-value">{results['bias']:.4f}</span>
-            {"&nbsp;⬆ Overestimation" if results['bias'] > 0 else "&nbsp;⬇ Underestimation" if results['bias'] < 0 else "&nbsp;✓ No Bias"}</p>
-        </div>
-        <div class="metric">
-            <p><em>Kategori Değerleri / Category Values</em></p>
-            <p><strong>R²:</strong> <span class="metric-value">{results['r2_cat']:.4f}</span></p>
-            <p><strong>RMSE:</strong> <span class="metric-value">{results['rmse_cat']:.4f}</span></p>
-            <p><strong>MAE:</strong> <span class="metric-value">{results['mae_cat']:.4f}</span></p>
-            <p><strong>Bias:</strong> <span class="metric-value">{results['bias_cat']:.4f}</span>
-            {"&nbsp;⬆ Overestimation" if results['bias_cat'] > 0 else "&nbsp;⬇ Underestimation" if results['bias_cat'] < 0 else "&nbsp;✓ No Bias"}</p>
-        </div>
-        
-        <h2>📋 Confusion Matrix / Karmaşıklık Matrisi</h2>
-        <table>
-            <tr>
-                <th>Reference \\ Predicted</th>
-"""
-        
-        class_names = results['class_names']
-        cm = np.array(results['confusion_matrix'])
-        
-        for name in class_names:
-            html += f"<th>{name}</th>"
-        html += "</tr>\n"
-        
-        for i, row in enumerate(cm):
-            html += f"<tr><th>{class_names[i]}</th>"
-            for val in row:
-                html += f"<td>{val}</td>"
-            html += "</tr>\n"
-                
-        html += """
-        </table>
-        
-        <h2>💡 Quality Assessment / Kalite Değerlendirmesi</h2>
-        <p>Detailed analysis results are available in the complete report.</p>
-        
-        <div class="footer">
-            <p>Generated by QGIS Raster Accuracy Assessment Plugin</p>
-        </div>
-    </div>
-</body>
-</html>
-"""
-        
-        return html
-
-
-class AccuracyAssessmentPlugin:
-    """QGIS Plugin Sınıfı"""
-    def __init__(self, iface):
-        self.iface = iface
-        self.dialog = None
-        self.action = None
-        
-    def initGui(self):
-        """Plugin GUI'sini başlat"""
-        self.action = QAction("Raster Doğrulama Analizi", self.iface.mainWindow())
-        self.action.setToolTip("Raster Accuracy Assessment / Doğrulama Analizi")
-        self.action.triggered.connect(self.run)
-        self.iface.addPluginToMenu("&Accuracy Assessment", self.action)
-        self.iface.addToolBarIcon(self.action)
-        
-    def unload(self):
-        """Plugin'i kaldır"""
-        self.iface.removePluginMenu("&Accuracy Assessment", self.action)
-        self.iface.removeToolBarIcon(self.action)
-        
-    def run(self):
-        """Plugin'i çalıştır"""
-        if self.dialog is None:
-            self.dialog = AccuracyAssessmentDialog()
-        
-        # Harita listesini güncelle
-        self.dialog.load_raster_layers(self.dialog.reference_combo)
-        self.dialog.load_raster_layers(self.dialog.classified_combo)
-        
-        self.dialog.show()
-        self.dialog.raise_()
-        self.dialog.activateWindow()
 
 
 def classFactory(iface):
     """QGIS plugin factory"""
-    return AccuracyAssessmentPlugin(iface)
\ No newline at end of file
+    from .plugin import AccuracyAssessmentPlugin
+    return AccuracyAssessmentPlugin(iface)
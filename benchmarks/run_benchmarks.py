@@ -0,0 +1,366 @@
+# -*- coding: utf-8 -*-
+"""
+Doğrulama hattı kıyaslamaları
+Sentetik raster çiftleri üzerinde her aşamanın süresini ölçer ve sonuçları JSON olarak yazar;
+--compare ile önceki bir sürümün sonuçlarına göre yavaşlayan aşamalar raporlanır.
+Arayüz gerektirmez: yalnızca yerel QGIS/GDAL kurulumu yeterlidir.
+
+Kullanım / Usage:
+    python benchmarks/run_benchmarks.py --sizes 1000,5000 --classes 2,20 --output results.json
+    python benchmarks/run_benchmarks.py --compare baseline.json --output results.json
+
+50000 x 50000 piksellik senaryolar ondalıklı tipte sıkıştırmasız ~10 GB disk alanı ister;
+üretilen rasterlar --workdir altında saklanır ve sonraki çalıştırmalarda yeniden kullanılır.
+"""
+
+import argparse
+import csv
+from datetime import datetime
+import importlib
+import json
+import os
+import platform
+import re
+import statistics
+import sys
+import tempfile
+import time
+
+# QGIS uygulaması ekransız çalışır
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import numpy as np
+from osgeo import gdal
+from qgis.core import (Qgis, QgsApplication, QgsCoordinateReferenceSystem, QgsCoordinateTransform,
+                       QgsPointXY, QgsProcessingFeedback, QgsProject, QgsRasterLayer, QgsVectorFileWriter,
+                       QgsVectorLayer)
+
+import synthetic
+
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+PLUGIN_DIR = os.path.dirname(BENCHMARK_DIR)
+
+DEFAULT_SIZES = (1000, 5000, 10000, 50000)
+DEFAULT_CLASSES = (2, 20, 200)
+DEFAULT_TYPES = ('int', 'float')
+DEFAULT_POINTS = 5000
+# Tam kapsamlı karşılaştırmanın ölçüleceği en büyük raster kenarı
+DEFAULT_EXHAUSTIVE_MAX = 10000
+# Karşılaştırmada bu kadar göreli yavaşlama gerileme sayılır
+DEFAULT_TOLERANCE = 0.2
+# Bu süreden (saniye) kısa farklar ölçüm gürültüsü sayılır
+NOISE_FLOOR = 0.05
+# Sonuç dosyası biçim sürümü
+RESULT_FORMAT = 1
+
+
+def load_plugin():
+    """Eklenti modüllerini paket olarak yükle (dizin adı paket adıdır)"""
+    sys.path.insert(0, os.path.dirname(PLUGIN_DIR))
+    package = os.path.basename(PLUGIN_DIR)
+    return {name: importlib.import_module(f"{package}.{name}")
+            for name in ('pipeline', 'raster_io', 'raster_cache', 'validation_task', 'core')}
+
+
+def plugin_version():
+    """metadata.txt içindeki sürüm"""
+    with open(os.path.join(PLUGIN_DIR, 'metadata.txt'), encoding='utf-8') as f:
+        match = re.search(r'^version=(.+)$', f.read(), re.MULTILINE)
+    return match.group(1).strip() if match else None
+
+
+def environment():
+    """Sonuçları karşılaştırılabilir kılan ortam bilgisi"""
+    return {
+        'plugin_version': plugin_version(),
+        'qgis': Qgis.QGIS_VERSION,
+        'gdal': gdal.__version__,
+        'numpy': np.__version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+class Stopwatch:
+    """Aşama sürelerini toplar; her ölçümden önce raster önbelleği boşaltılır"""
+    def __init__(self, repeat, cache):
+        self.repeat = repeat
+        self.cache = cache
+        self.stages = {}
+    
+    def run(self, stage, function, *args, **kwargs):
+        """function'ı repeat kez çalıştır, süreleri kaydet ve son sonucu döndür"""
+        runs = []
+        for _ in range(self.repeat):
+            self.cache.clear()
+            started = time.perf_counter()
+            result = function(*args, **kwargs)
+            runs.append(time.perf_counter() - started)
+        self.stages[stage] = {'min': min(runs), 'median': statistics.median(runs), 'runs': runs}
+        print(f"    {stage:<34} {min(runs):10.3f} s", flush=True)
+        return result
+
+
+def full_scan(modules, layer):
+    """Raster'ı karo karo oku (saf okuma hızı)"""
+    raster_io = modules['raster_io']
+    provider = layer.dataProvider()
+    n_valid = 0
+    for row, col, win_h, win_w in modules['core'].iter_windows(layer.width(), layer.height()):
+        _, valid = raster_io.read_valid_block(
+            provider, 1, raster_io.pixel_window_extent(layer, row, col, win_h, win_w), win_w, win_h, cache=None)
+        n_valid += int(np.count_nonzero(valid))
+    return n_valid
+
+
+def write_points_csv(path, samples, layer):
+    """Örnek noktalarını WGS 84 koordinatlı CSV olarak yaz (load_points_from_csv girdisi)"""
+    transform = QgsCoordinateTransform(layer.crs(), QgsCoordinateReferenceSystem("EPSG:4326"),
+                                       QgsProject.instance())
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['id', 'x', 'y', 'reference_value'])
+        for point_id, (x, y, value) in enumerate(zip(samples.coord_x.tolist(), samples.coord_y.tolist(),
+                                                     samples.reference_values.tolist()), start=1):
+            point = transform.transform(QgsPointXY(x, y))
+            writer.writerow([point_id, repr(point.x()), repr(point.y()), value])
+
+
+def save_validation_points(modules, samples, crs, path):
+    """Noktaları iletişim kutusundaki gibi bellek katmanı üzerinden Shapefile'a yaz"""
+    pipeline = modules['pipeline']
+    vector_layer = QgsVectorLayer(f"Point?crs={crs.authid()}", "validation_points", "memory")
+    provider = vector_layer.dataProvider()
+    provider.addAttributes(pipeline.point_fields(samples).toList())
+    vector_layer.updateFields()
+    provider.addFeatures(list(pipeline.point_features(samples, vector_layer.fields())))
+    error = QgsVectorFileWriter.writeAsVectorFormat(vector_layer, path, "UTF-8", crs, "ESRI Shapefile")
+    if error[0] != QgsVectorFileWriter.NoError:
+        raise RuntimeError(f"Noktalar yazılamadı / Could not write points: {error[1]}")
+
+
+def run_validation(modules, reference_layer, classified_layer, n_points, method='random', csv_path=None,
+                   seed=0, trace_memory=False):
+    """prepare_validation + compute_validation (Processing algoritmasıyla aynı yol)"""
+    pipeline = modules['pipeline']
+    raster_io = modules['raster_io']
+    reads = modules['core'].TimeCounter()
+    params = {
+        'csv_path': csv_path,
+        'exhaustive': method == 'exhaustive',
+        'method': 'CSV File' if csv_path else method,
+        'n_points': n_points,
+        'workers': 1,
+        'bands': [1],
+        'allocation': 'proportional',
+        'min_per_class': 0,
+        'reservoir': False,
+        'seed': seed,
+        'reference': None if csv_path else raster_io.RasterSource(reference_layer, reads),
+        'classified': raster_io.RasterSource(classified_layer, reads),
+        'batch': [],
+        'transform_context': QgsProject.instance().transformContext(),
+        'trace_memory': trace_memory,
+        'raster_reads': reads,
+    }
+    task = modules['validation_task'].FeedbackTask(QgsProcessingFeedback())
+    state = pipeline.prepare_validation(task, params)
+    mappings = pipeline.identical_mappings(list(state['ref_value_counts']), list(state['class_value_counts']))
+    return state, pipeline.compute_validation(task, state, mappings)
+
+
+def assess_samples(modules, ref_values, class_values):
+    """Eşleştirme ve metrik aşamaları: (kategoriler, sonuç sözlüğü)"""
+    core = modules['core']
+    mappings = modules['pipeline'].identical_mappings(np.unique(ref_values).tolist(),
+                                                      np.unique(class_values).tolist())
+    reference_mapping, classified_mapping, class_names = mappings
+    categories = sorted(set(reference_mapping.values()) | set(classified_mapping.values()))
+    return categories, class_names, (core.CompiledMapping(reference_mapping)(ref_values),
+                                     core.CompiledMapping(classified_mapping)(class_values))
+
+
+def compute_metrics(modules, ref_values, class_values, ref_categories, class_categories, categories,
+                    class_names):
+    """Karmaşıklık matrisi, regresyon toplamları ve metrik sözlüğü"""
+    core = modules['core']
+    cm = core.confusion_matrix_from_labels(ref_categories, class_categories, categories)
+    labels = [class_names.get(cat, f"Kategori_{cat}") for cat in categories]
+    band_result = core.band_metrics('classified', 1, cm, core.regression_sums(ref_values, class_values),
+                                    int(cm.sum()), labels, categories)
+    return core.assemble_results([band_result], 'reference', 'random', [1], ['classified'])
+
+
+def render_reports(modules, results):
+    """Metin, HTML ve JSON raporlarını üret"""
+    core = modules['core']
+    return core.text_report(results), core.html_report(results), json.dumps(results, indent=2, ensure_ascii=False)
+
+
+def run_case(modules, size, n_classes, data_type, args):
+    """Bir senaryonun tüm aşamalarını ölç"""
+    pipeline = modules['pipeline']
+    raster_io = modules['raster_io']
+    print(f"  {size}x{size} px, {n_classes} sınıf / classes, {data_type}", flush=True)
+    
+    started = time.perf_counter()
+    reference_path, classified_path = synthetic.generate_pair(args.workdir, size, n_classes, data_type,
+                                                              seed=args.seed, compress=not args.no_compress)
+    generate_seconds = time.perf_counter() - started
+    
+    reference_layer = QgsRasterLayer(reference_path, 'reference', 'gdal')
+    classified_layer = QgsRasterLayer(classified_path, 'classified', 'gdal')
+    if not (reference_layer.isValid() and classified_layer.isValid()):
+        raise RuntimeError(f"Rasterlar açılamadı / Could not open rasters: {reference_path}")
+    
+    watch = Stopwatch(args.repeat, modules['raster_cache'].RASTER_CACHE)
+    
+    # Örnekleme
+    for method, reservoir in (('random', False), ('systematic', False), ('stratified', False),
+                              ('stratified', True)):
+        stage = 'generate_sampling_points.' + ('reservoir' if reservoir else method)
+        watch.run(stage, pipeline.generate_sampling_points, reference_layer, classified_layer, args.points,
+                  method, reservoir=reservoir, seed=args.seed)
+    samples = pipeline.generate_sampling_points(reference_layer, classified_layer, args.points, 'random',
+                                                seed=args.seed)
+    
+    # Okuma, değer çıkarma ve benzersiz değer taraması
+    watch.run('raster_read', full_scan, modules, classified_layer)
+    ref_values, ref_valid = watch.run('extraction.reference', raster_io.sample_pixels, reference_layer,
+                                      samples.rows, samples.cols)
+    class_values, class_valid = watch.run('extraction.classified', raster_io.sample_pixel_bands,
+                                          classified_layer, samples.rows, samples.cols, [1])
+    watch.run('unique_scan', lambda: (raster_io.unique_value_counts(reference_layer),
+                                      raster_io.unique_value_counts(classified_layer)))
+    
+    # Eşleştirme, metrikler ve raporlar
+    valid = ref_valid & class_valid[:, 0]
+    ref_values = ref_values[valid].astype(np.float64)
+    class_values = class_values[valid, 0].astype(np.float64)
+    categories, class_names, (ref_categories, class_categories) = watch.run(
+        'mapping', assess_samples, modules, ref_values, class_values)
+    results = watch.run('metrics', compute_metrics, modules, ref_values, class_values, ref_categories,
+                        class_categories, categories, class_names)
+    watch.run('report', render_reports, modules, results)
+    
+    # Uçtan uca doğrulama ve nokta girdi/çıktısı
+    state, validation = watch.run('run_validation', run_validation, modules, reference_layer, classified_layer,
+                                  args.points, seed=args.seed, trace_memory=args.trace_memory)
+    if size <= args.exhaustive_max_size:
+        watch.run('run_validation.exhaustive', run_validation, modules, reference_layer, classified_layer,
+                  args.points, method='exhaustive')
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, 'points.csv')
+        write_points_csv(csv_path, state['samples'], reference_layer)
+        watch.run('load_points_from_csv', pipeline.load_points_from_csv, csv_path, classified_layer)
+        watch.run('save_validation_points', save_validation_points, modules, state['samples'],
+                  classified_layer.crs(), os.path.join(tmp, 'points.shp'))
+    
+    return {
+        'size': size,
+        'classes': n_classes,
+        'dtype': data_type,
+        'points': args.points,
+        'generate_seconds': generate_seconds,
+        'stages': watch.stages,
+        'validation_performance': validation['performance'],
+    }
+
+
+def compare_results(current, baseline, tolerance=DEFAULT_TOLERANCE):
+    """Her aşamanın en kısa süresini öncekiyle karşılaştır; gerilemelerin listesini döndür"""
+    previous = {(case['size'], case['classes'], case['dtype'], stage): timing['min']
+                for case in baseline['cases'] for stage, timing in case['stages'].items()}
+    regressions = []
+    for case in current['cases']:
+        for stage, timing in case['stages'].items():
+            before = previous.get((case['size'], case['classes'], case['dtype'], stage))
+            if before is None:
+                continue
+            after = timing['min']
+            if after > before * (1 + tolerance) and after - before > NOISE_FLOOR:
+                regressions.append({'size': case['size'], 'classes': case['classes'], 'dtype': case['dtype'],
+                                    'stage': stage, 'before': before, 'after': after})
+    return regressions
+
+
+def parse_list(text, cast=int):
+    """'1000,5000' biçimindeki listeyi ayrıştır"""
+    return [cast(item) for item in text.split(',') if item.strip()]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Doğrulama hattı kıyaslamaları / Validation pipeline benchmarks")
+    parser.add_argument('--sizes', type=parse_list, default=list(DEFAULT_SIZES),
+                        help="Raster kenarları (piksel) / Raster edge lengths in pixels")
+    parser.add_argument('--classes', type=parse_list, default=list(DEFAULT_CLASSES),
+                        help="Sınıf sayıları / Class counts")
+    parser.add_argument('--types', type=lambda text: parse_list(text, str), default=list(DEFAULT_TYPES),
+                        help="Veri tipleri (int, float) / Data types")
+    parser.add_argument('--points', type=int, default=DEFAULT_POINTS, help="Örnek sayısı / Number of samples")
+    parser.add_argument('--repeat', type=int, default=1, help="Her aşamanın tekrar sayısı / Runs per stage")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--trace-memory', action='store_true',
+                        help="Doğrulama aşamalarında bellek tepe değerini ölç (süreleri uzatır) / "
+                             "Measure peak memory of validation stages (slows timings)")
+    parser.add_argument('--exhaustive-max-size', type=int, default=DEFAULT_EXHAUSTIVE_MAX,
+                        help="Tüm piksel karşılaştırmasının ölçüleceği en büyük kenar / "
+                             "Largest edge length for the all-pixels run")
+    parser.add_argument('--workdir', default=os.path.join(tempfile.gettempdir(), 'accuracy_assessment_benchmarks'),
+                        help="Sentetik rasterların dizini / Directory for synthetic rasters")
+    parser.add_argument('--no-compress', action='store_true',
+                        help="Rasterları sıkıştırmadan yaz / Write uncompressed")
+    parser.add_argument('--output', default=f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    parser.add_argument('--compare', help="Önceki sonuç dosyası / Previous results file")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="Gerileme eşiği (göreli) / Relative regression threshold")
+    args = parser.parse_args(argv)
+    unknown = set(args.types) - set(synthetic.DATA_TYPES)
+    if unknown:
+        parser.error(f"Bilinmeyen veri tipi / Unknown data type: {', '.join(sorted(unknown))}")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    
+    QgsApplication.setPrefixPath(os.environ.get('QGIS_PREFIX_PATH', '/usr'), True)
+    app = QgsApplication([], False)
+    app.initQgis()
+    try:
+        modules = load_plugin()
+        report = {
+            'format': RESULT_FORMAT,
+            'created': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'environment': environment(),
+            'settings': {key: value for key, value in vars(args).items() if key not in ('output', 'compare')},
+            'cases': [],
+        }
+        for size in args.sizes:
+            for n_classes in args.classes:
+                for data_type in args.types:
+                    report['cases'].append(run_case(modules, size, n_classes, data_type, args))
+                    # Uzun çalıştırmalarda ara sonuçlar kaybolmasın
+                    with open(args.output, 'w', encoding='utf-8') as f:
+                        json.dump(report, f, indent=2)
+        print(f"✓ Sonuçlar / Results: {args.output}")
+        
+        if args.compare:
+            with open(args.compare, encoding='utf-8') as f:
+                regressions = compare_results(report, json.load(f), args.tolerance)
+            for item in regressions:
+                print(f"✗ {item['size']}px {item['classes']}c {item['dtype']} {item['stage']}: "
+                      f"{item['before']:.3f} s -> {item['after']:.3f} s")
+            if regressions:
+                return 1
+            print("✓ Gerileme yok / No regressions")
+        return 0
+    finally:
+        app.exitQgis()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
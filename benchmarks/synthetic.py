@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+Sentetik raster üretimi
+Kıyaslama için referans ve sınıflandırılmış GeoTIFF çiftlerini GDAL ile şerit şerit yazar;
+bellek kullanımı raster boyutuyla değil şerit boyutuyla sınırlıdır
+"""
+
+import os
+
+import numpy as np
+from osgeo import gdal, osr
+
+
+# Sınıf lekelerinin kenarı (piksel); sınıflar bu boyutta bloklar halinde dağılır
+PATCH_SIZE = 64
+# Tek seferde yazılan satır sayısı
+STRIP_ROWS = 512
+# Sınıflandırılmış haritada rastgele sınıfa atanan piksel oranı
+DEFAULT_ERROR_RATE = 0.15
+# NoData lekesi oranı
+NODATA_RATE = 0.02
+# Piksel boyutu (metre) ve sol üst köşe - UTM 35N içinde
+PIXEL_SIZE = 10.0
+ORIGIN = (500000.0, 4200000.0)
+EPSG = 32635
+
+# Veri tipi -> (GDAL tipi, NoData değeri)
+DATA_TYPES = {
+    'int': (gdal.GDT_UInt16, 0),
+    'float': (gdal.GDT_Float32, -9999.0),
+}
+
+
+def class_values(n_classes, data_type):
+    """Sınıf değerlerini döndür: tam sayı tipinde 1..K, ondalıklı tipte 0.5, 1.5, ..."""
+    values = np.arange(1, n_classes + 1, dtype=np.float64)
+    return values if data_type == 'int' else values - 0.5
+
+
+def raster_paths(workdir, size, n_classes, data_type):
+    """Bir senaryo için (referans, sınıflandırılmış) dosya yollarını döndür"""
+    stem = f"{size}px_{n_classes}c_{data_type}"
+    return (os.path.join(workdir, f"reference_{stem}.tif"),
+            os.path.join(workdir, f"classified_{stem}.tif"))
+
+
+def generate_pair(workdir, size, n_classes, data_type, error_rate=DEFAULT_ERROR_RATE, seed=0,
+                  compress=True):
+    """size x size piksellik referans/sınıflandırılmış raster çiftini üret
+    
+    Dosyalar zaten varsa yeniden yazılmaz. Referans, PATCH_SIZE kenarlı
+    sınıf lekelerinden oluşur; sınıflandırılmış harita aynı lekelerde
+    error_rate oranında pikselin rastgele bir sınıfa atanmasıyla elde
+    edilir. Üretim deterministiktir (seed ve şerit numarası).
+    (referans yolu, sınıflandırılmış yolu) döndürür.
+    """
+    reference_path, classified_path = raster_paths(workdir, size, n_classes, data_type)
+    if os.path.exists(reference_path) and os.path.exists(classified_path):
+        return reference_path, classified_path
+    os.makedirs(workdir, exist_ok=True)
+    
+    gdal_type, nodata = DATA_TYPES[data_type]
+    values = class_values(n_classes, data_type)
+    rng = np.random.default_rng(seed)
+    
+    # Leke ızgarası: her leke bir sınıf ya da NoData
+    n_patches = (size + PATCH_SIZE - 1) // PATCH_SIZE
+    patches = values[rng.integers(0, n_classes, (n_patches, n_patches))]
+    patches[rng.random((n_patches, n_patches)) < NODATA_RATE] = nodata
+    patch_cols = np.arange(size) // PATCH_SIZE
+    
+    try:
+        datasets = [_create(path, size, gdal_type, nodata, compress)
+                    for path in (reference_path, classified_path)]
+        for strip_no, row0 in enumerate(range(0, size, STRIP_ROWS)):
+            rows = min(STRIP_ROWS, size - row0)
+            reference = patches[(np.arange(row0, row0 + rows) // PATCH_SIZE)[:, np.newaxis], patch_cols]
+            
+            # Şerit başına ayrı tohum: sonuç şerit boyutundan bağımsız olarak yeniden üretilebilir
+            strip_rng = np.random.default_rng([seed, strip_no])
+            classified = reference.copy()
+            wrong = (strip_rng.random(reference.shape) < error_rate) & (reference != nodata)
+            classified[wrong] = values[strip_rng.integers(0, n_classes, np.count_nonzero(wrong))]
+            
+            for dataset, data in zip(datasets, (reference, classified)):
+                dataset.GetRasterBand(1).WriteArray(data, 0, row0)
+        for dataset in datasets:
+            dataset.FlushCache()
+    except BaseException:
+        # Yarım kalan dosyalar sonraki çalıştırmada hazır sanılmasın
+        datasets = None
+        for path in (reference_path, classified_path):
+            if os.path.exists(path):
+                os.remove(path)
+        raise
+    return reference_path, classified_path
+
+
+def _create(path, size, gdal_type, nodata, compress):
+    """Karolu GeoTIFF oluştur"""
+    options = ['TILED=YES', 'BLOCKXSIZE=256', 'BLOCKYSIZE=256', 'BIGTIFF=IF_SAFER']
+    if compress:
+        options.append('COMPRESS=DEFLATE')
+    dataset = gdal.GetDriverByName('GTiff').Create(path, size, size, 1, gdal_type, options=options)
+    if dataset is None:
+        raise RuntimeError(f"Raster oluşturulamadı / Could not create raster: {path}")
+    dataset.SetGeoTransform((ORIGIN[0], PIXEL_SIZE, 0.0, ORIGIN[1], 0.0, -PIXEL_SIZE))
+    srs = osr.SpatialReference()
+    srs.ImportFromEPSG(EPSG)
+    dataset.SetProjection(srs.ExportToWkt())
+    dataset.GetRasterBand(1).SetNoDataValue(nodata)
+    return dataset
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+"""
+Doğrulama çekirdeği
+Örnekleyici, nokta ayrıştırıcı, değer çıkarıcı, sınıf eşleştirici, metrik motoru, rapor modeli ve aşama ölçümü;
+yalnızca NumPy kullanır, QGIS veya Qt içe aktarmaz. Raster okuma ve koordinat dönüşümleri üst paketteki modüllerde kalır
+"""
+
+from .extractor import (DEFAULT_TILE_SIZE, NoDataSpec, extract_pixels, iter_windows, merge_value_counts,
+                        tile_value_counts, valid_mask)
+from .mapping import UNMAPPED, CompiledMapping, category_index_mapping
+from .metrics import (REGRESSION_KEYS, accuracy_metrics, compare_tiles, confusion_matrix_from_labels,
+                      regression_from_sums, regression_sums)
+from .points import CSV_COLUMNS, RejectedRows, csv_column_indices, parse_point_chunks, thin_points, unique_pixel_mask
+from .profiler import StageProfiler, TimeCounter
+from .report import BAND_SUMMARY_KEYS, assemble_results, band_metrics, html_report, text_report
+from .sample_table import SampleTable
+from .sampler import ALLOCATIONS, Reservoir, allocate_samples, split_sample, stratum_std
+
+__all__ = [
+    'ALLOCATIONS', 'BAND_SUMMARY_KEYS', 'CSV_COLUMNS', 'DEFAULT_TILE_SIZE', 'REGRESSION_KEYS', 'UNMAPPED',
+    'CompiledMapping', 'NoDataSpec', 'RejectedRows', 'Reservoir', 'SampleTable', 'StageProfiler', 'TimeCounter',
+    'accuracy_metrics', 'allocate_samples', 'assemble_results', 'band_metrics', 'category_index_mapping',
+    'compare_tiles', 'confusion_matrix_from_labels', 'csv_column_indices', 'extract_pixels', 'html_report',
+    'iter_windows', 'merge_value_counts', 'parse_point_chunks', 'regression_from_sums', 'regression_sums',
+    'split_sample', 'stratum_std', 'text_report', 'thin_points', 'tile_value_counts', 'unique_pixel_mask',
+    'valid_mask',
+]
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+Değer çıkarıcı
+Karo pencereleri, NoData maskeleri, noktalardaki piksel değerleri ve benzersiz değer sayımı;
+okuma bir geri çağırma fonksiyonuna bırakılır, modül yalnızca NumPy kullanır
+"""
+
+import numpy as np
+
+
+# Tüm raster taramalarında kullanılan karo kenarı (piksel); bellek kullanımını sınırlar
+DEFAULT_TILE_SIZE = 2048
+
+
+class NoDataSpec:
+    """Bir bandın NoData tanımı: kaynak NoData değeri ve kullanıcı NoData aralıkları
+    
+    ranges, (alt, üst, alt dahil, üst dahil) demetlerinden oluşur.
+    """
+    def __init__(self, value=None, ranges=()):
+        self.value = value
+        self.ranges = list(ranges)
+    
+    @classmethod
+    def from_provider(cls, provider, band=1):
+        """Sağlayıcının NoData ayarlarından oluştur"""
+        value = None
+        if provider.sourceHasNoDataValue(band) and provider.useSourceNoDataValue(band):
+            value = provider.sourceNoDataValue(band)
+        
+        ranges = []
+        for nodata_range in provider.userNoDataValues(band):
+            # QgsRasterRange.bounds(): 0 = iki uç dahil, 1 = üst dahil, 2 = alt dahil, 3 = hariç
+            bounds = nodata_range.bounds() if hasattr(nodata_range, 'bounds') else 0
+            ranges.append((nodata_range.min(), nodata_range.max(), bounds in (0, 2), bounds in (0, 1)))
+        return cls(value, ranges)
+    
+    def fingerprint(self):
+        """Önbellek anahtarlarında kullanılacak hashable özet"""
+        value = self.value
+        if value is not None:
+            value = 'nan' if np.isnan(value) else float(value)
+        return value, tuple(tuple(nodata_range) for nodata_range in self.ranges)
+    
+    def valid(self, data):
+        """NoData olmayan pikselleri işaretleyen boolean maske"""
+        data = np.asarray(data)
+        valid = ~np.isnan(data) if data.dtype.kind == 'f' else np.ones(data.shape, dtype=bool)
+        if self.value is not None and not np.isnan(self.value):
+            valid &= data != self.value
+        for low, high, include_low, include_high in self.ranges:
+            above = data >= low if include_low else data > low
+            below = data <= high if include_high else data < high
+            valid &= ~(above & below)
+        return valid
+
+
+def valid_mask(data, nodata=None):
+    """NaN olmayan ve verilen NoData tanımına uymayan değerleri işaretle"""
+    if nodata is None:
+        nodata = NoDataSpec()
+    return nodata.valid(data)
+
+
+def iter_windows(width, height, tile_size=DEFAULT_TILE_SIZE):
+    """Raster'ı (satır, sütun, yükseklik, genişlik) karo pencerelerine böl"""
+    for row in range(0, height, tile_size):
+        for col in range(0, width, tile_size):
+            yield row, col, min(tile_size, height - row), min(tile_size, width - col)
+
+
+def count_windows(width, height, tile_size=DEFAULT_TILE_SIZE):
+    """Karo penceresi sayısını döndür"""
+    return ((height + tile_size - 1) // tile_size) * ((width + tile_size - 1) // tile_size)
+
+
+def extract_pixels(read_window, rows, cols, n_bands, dtype, shape, block_shape, progress_callback=None):
+    """Piksel değerlerini yalnızca noktaların düştüğü blokları okuyarak al
+    
+    read_window(satır, sütun, yükseklik, genişlik) bir pencere için bant
+    başına (dizi, geçerlilik maskesi) listesi döndürmelidir. shape raster
+    (yükseklik, genişlik), block_shape okuma bloğu boyutudur. (nokta x bant)
+    boyutlu (değerler, geçerlilik maskesi) döndürür.
+    Noktalar bloklara göre gruplanır ve her blok bir kez okunur; maliyet
+    raster boyutuyla değil nokta sayısıyla ölçeklenir.
+    """
+    rows = np.asarray(rows, dtype=np.int64)
+    cols = np.asarray(cols, dtype=np.int64)
+    values = np.empty((len(rows), n_bands), dtype=dtype)
+    valid = np.zeros((len(rows), n_bands), dtype=bool)
+    if len(rows) == 0:
+        return values, valid
+    
+    height, width = shape
+    block_h, block_w = block_shape
+    blocks_per_row = (width + block_w - 1) // block_w
+    
+    # Noktaları blok numarasına göre grupla
+    block_ids = (rows // block_h) * blocks_per_row + cols // block_w
+    order = np.argsort(block_ids, kind='stable')
+    sorted_ids = block_ids[order]
+    starts = np.flatnonzero(np.r_[True, sorted_ids[1:] != sorted_ids[:-1]])
+    ends = np.r_[starts[1:], len(order)]
+    
+    for block_no, (start, end) in enumerate(zip(starts, ends), start=1):
+        idx = order[start:end]
+        row0 = int(rows[idx[0]] // block_h * block_h)
+        col0 = int(cols[idx[0]] // block_w * block_w)
+        win_h = min(block_h, height - row0)
+        win_w = min(block_w, width - col0)
+        
+        for band_no, (data, data_valid) in enumerate(read_window(row0, col0, win_h, win_w)):
+            values[idx, band_no] = data[rows[idx] - row0, cols[idx] - col0]
+            valid[idx, band_no] = data_valid[rows[idx] - row0, cols[idx] - col0]
+        
+        if progress_callback is not None:
+            progress_callback(block_no / len(starts))
+    
+    return values, valid
+
+
+def tile_value_counts(data):
+    """Bir karodaki benzersiz değerleri ve sayılarını döndür (NaN hariç)"""
+    data = data.ravel()
+    if data.dtype.kind == 'f':
+        data = data[~np.isnan(data)]
+    
+    # Tek baytlık tiplerde bincount np.unique'ten çok daha hızlı
+    if data.dtype == np.uint8:
+        counts = np.bincount(data, minlength=256)
+        values = np.flatnonzero(counts)
+        return values, counts[values]
+    if data.dtype == np.int8:
+        counts = np.bincount(data.astype(np.int16) + 128, minlength=256)
+        values = np.flatnonzero(counts)
+        return values - 128, counts[values]
+    
+    return np.unique(data, return_counts=True)
+
+
+def merge_value_counts(totals, values, counts):
+    """Karo sonuçlarını {değer: sayı} sözlüğünde birleştir"""
+    for value, count in zip(values.tolist(), counts.tolist()):
+        totals[value] = totals.get(value, 0) + count
+    return totals
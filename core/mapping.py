@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Sınıf eşleştirme
+Değer -> kategori sözlüklerini tek vektörel çağrıyla uygulanan arama tablolarına derler
+"""
+
+import numpy as np
+
+
+# Eşleştirilmemiş değerler için kategori işareti
+UNMAPPED = -1
+# Tam sayı değerleri için doğrudan arama tablosunun en büyük boyutu
+MAX_LUT_SIZE = 1 << 20
+
+
+class CompiledMapping:
+    """Değer -> kategori eşleştirmesinin derlenmiş biçimi
+    
+    Çağrıldığında bir değer dizisini aynı şekilde bir int64 kategori
+    dizisine dönüştürür; eşleştirmede olmayan değerler (NaN dahil)
+    unmapped olur. Tam sayı rasterlarında doğrudan arama tablosu (LUT),
+    diğerlerinde sıralı anahtarlar üzerinde np.searchsorted kullanılır.
+    """
+    def __init__(self, mapping, unmapped=UNMAPPED):
+        self.unmapped = unmapped
+        items = sorted((float(value), int(category)) for value, category in mapping.items())
+        self.keys = np.array([value for value, _ in items], dtype=np.float64)
+        self.categories = np.array([category for _, category in items], dtype=np.int64)
+        self._tables = {}
+        
+        # Tüm anahtarlar tam sayıysa ve aralık dar ise ofsetli LUT
+        self._lut = None
+        self._lut_offset = 0
+        if len(self.keys) and np.all(self.keys == np.round(self.keys)):
+            low, high = int(self.keys[0]), int(self.keys[-1])
+            if high - low < MAX_LUT_SIZE:
+                self._lut = np.full(high - low + 1, unmapped, dtype=np.int64)
+                self._lut[self.keys.astype(np.int64) - low] = self.categories
+                self._lut_offset = low
+    
+    def __len__(self):
+        return len(self.keys)
+    
+    def __call__(self, values):
+        values = np.asarray(values)
+        if values.dtype.kind in 'iu' and values.dtype.itemsize <= 2:
+            return self._dtype_table(values.dtype)[self._table_index(values)]
+        if values.dtype.kind in 'iu' and self._lut is not None:
+            return self._apply_lut(values)
+        return self._apply_sorted(values)
+    
+    def _dtype_table(self, dtype):
+        """8/16 bit tam sayı tipinin tüm değer aralığını kapsayan tablo"""
+        table = self._tables.get(dtype)
+        if table is None:
+            info = np.iinfo(dtype)
+            table = self._apply_sorted(np.arange(info.min, info.max + 1, dtype=np.int64))
+            self._tables[dtype] = table
+        return table
+    
+    @staticmethod
+    def _table_index(values):
+        if values.dtype.kind == 'u':
+            return values
+        return values.astype(np.int32) - np.iinfo(values.dtype).min
+    
+    def _apply_lut(self, values):
+        index = values.astype(np.int64) - self._lut_offset
+        inside = (index >= 0) & (index < len(self._lut))
+        result = np.full(values.shape, self.unmapped, dtype=np.int64)
+        result[inside] = self._lut[index[inside]]
+        return result
+    
+    def _apply_sorted(self, values):
+        if not len(self.keys):
+            return np.full(values.shape, self.unmapped, dtype=np.int64)
+        values = values.astype(np.float64, copy=False)
+        position = np.minimum(np.searchsorted(self.keys, values), len(self.keys) - 1)
+        found = self.keys[position] == values
+        return np.where(found, self.categories[position], self.unmapped)
+
+
+def category_index_mapping(mapping, categories):
+    """Değer -> kategori eşleştirmesini değer -> kategori sırası (0..K-1) olarak derle"""
+    category_index = {cat: i for i, cat in enumerate(categories)}
+    return CompiledMapping({value: category_index[cat] for value, cat in mapping.items()
+                            if cat in category_index})
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+Doğruluk metrikleri
+Tüm sınıflandırma metriklerini yalnızca K x K karmaşıklık matrisinden O(K²) sürede hesaplar
+"""
+
+import numpy as np
+
+from .mapping import category_index_mapping
+
+# Regresyon toplamlarının sırası
+REGRESSION_KEYS = ('n', 'sum_ref', 'sum_ref2', 'sum_err', 'sum_err2', 'sum_abs_err')
+
+
+def confusion_matrix_from_labels(reference_categories, classified_categories, categories):
+    """Kategori listelerinden karmaşıklık matrisi oluştur (satır: referans, sütun: tahmin)
+    
+    categories dışındaki etiketler hesaba katılmaz.
+    """
+    k = len(categories)
+    category_index = category_index_mapping({cat: cat for cat in categories}, categories)
+    ref_idx = category_index(np.asarray(reference_categories))
+    class_idx = category_index(np.asarray(classified_categories))
+    valid = (ref_idx >= 0) & (class_idx >= 0)
+    return np.bincount(ref_idx[valid] * k + class_idx[valid], minlength=k * k).reshape(k, k)
+
+
+def _safe_divide(numerator, denominator):
+    """Sıfıra bölmede 0 döndüren eleman bazlı bölme (zero_division=0)"""
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+    result = np.zeros_like(numerator)
+    np.divide(numerator, denominator, out=result, where=denominator != 0)
+    return result
+
+
+def accuracy_metrics(cm, class_names):
+    """Karmaşıklık matrisinden tüm sınıflandırma metriklerini hesapla
+    
+    Dönen sözlük validation_results ile aynı anahtarları kullanır;
+    'class_report' sklearn classification_report(output_dict=True)
+    ile aynı yapıdadır.
+    """
+    cm = np.asarray(cm, dtype=np.int64)
+    total = int(cm.sum())
+    diagonal = np.diag(cm).astype(np.float64)
+    support = cm.sum(axis=1)          # referans (satır) toplamları
+    predicted = cm.sum(axis=0)        # tahmin (sütun) toplamları
+    
+    overall_accuracy = float(diagonal.sum() / total) if total else 0.0
+    
+    # Cohen's Kappa: gözlenen ve beklenen uyum
+    if total:
+        expected = float(np.dot(support, predicted)) / total ** 2
+        kappa = (overall_accuracy - expected) / (1 - expected) if expected != 1 else 1.0
+    else:
+        kappa = 0.0
+    
+    # Sınıf bazlı metrikler - precision = kullanıcı, recall = üretici doğruluğu
+    precision = _safe_divide(diagonal, predicted)
+    recall = _safe_divide(diagonal, support)
+    f1 = _safe_divide(2 * diagonal, support + predicted)
+    
+    weights = _safe_divide(support, support.sum())
+    
+    class_report = {}
+    for i, name in enumerate(class_names):
+        class_report[name] = {
+            'precision': float(precision[i]),
+            'recall': float(recall[i]),
+            'f1-score': float(f1[i]),
+            'support': int(support[i])
+        }
+    class_report['accuracy'] = overall_accuracy
+    class_report['macro avg'] = {
+        'precision': float(precision.mean()) if len(class_names) else 0.0,
+        'recall': float(recall.mean()) if len(class_names) else 0.0,
+        'f1-score': float(f1.mean()) if len(class_names) else 0.0,
+        'support': total
+    }
+    class_report['weighted avg'] = {
+        'precision': float(np.dot(weights, precision)),
+        'recall': float(np.dot(weights, recall)),
+        'f1-score': float(np.dot(weights, f1)),
+        'support': total
+    }
+    
+    return {
+        'overall_accuracy': overall_accuracy,
+        'kappa': float(kappa),
+        'f1_macro': class_report['macro avg']['f1-score'],
+        'f1_weighted': class_report['weighted avg']['f1-score'],
+        'precision_macro': class_report['macro avg']['precision'],
+        'recall_macro': class_report['macro avg']['recall'],
+        'producers_accuracy': {name: float(recall[i]) for i, name in enumerate(class_names)},
+        'users_accuracy': {name: float(precision[i]) for i, name in enumerate(class_names)},
+        'class_report': class_report
+    }
+
+
+def regression_sums(reference_values, classified_values):
+    """Regresyon toplamlarını REGRESSION_KEYS sırasıyla dizi olarak döndür"""
+    ref_vals = np.asarray(reference_values, dtype=np.float64)
+    err = np.asarray(classified_values, dtype=np.float64) - ref_vals
+    return np.array([len(ref_vals), ref_vals.sum(), np.dot(ref_vals, ref_vals),
+                     err.sum(), np.dot(err, err), np.abs(err).sum()], dtype=np.float64)
+
+
+def compare_tiles(ref_tile, class_tile, reference_index, classified_index, k, valid=None):
+    """Bir karo çifti için kısmi karmaşıklık matrisi (düz) ve regresyon toplamlarını döndür
+    
+    reference_index ve classified_index, değerleri kategori sırasına
+    (0..K-1) dönüştüren derlenmiş eşleştirmelerdir. valid verilirse
+    yalnızca işaretli pikseller (ör. iki raster'da da NoData olmayanlar)
+    karşılaştırılır.
+    """
+    ref_tile = ref_tile.ravel()
+    class_tile = class_tile.ravel()
+    
+    ref_idx = reference_index(ref_tile)
+    class_idx = classified_index(class_tile)
+    compared = (ref_idx >= 0) & (class_idx >= 0)
+    if valid is not None:
+        compared &= valid.ravel()
+    
+    cm = np.bincount(ref_idx[compared] * k + class_idx[compared], minlength=k * k)
+    
+    # Ham piksel değerleri için regresyon toplamları (REGRESSION_KEYS sırasıyla)
+    return cm, regression_sums(ref_tile[compared], class_tile[compared])
+
+
+def category_regression_sums(cm, categories):
+    """Kategori değerleri için regresyon toplamlarını karmaşıklık matrisinden hesapla"""
+    cm = np.asarray(cm, dtype=np.float64)
+    values = np.asarray(categories, dtype=np.float64)
+    support = cm.sum(axis=1)
+    err = values[np.newaxis, :] - values[:, np.newaxis]    # err[i, j] = tahmin_j - referans_i
+    return np.array([cm.sum(), np.dot(support, values), np.dot(support, values ** 2),
+                     (cm * err).sum(), (cm * err ** 2).sum(), (cm * np.abs(err)).sum()], dtype=np.float64)
+
+
+def regression_from_sums(sums):
+    """Biriktirilmiş toplamlardan R², RMSE, MAE ve Bias hesapla
+    
+    sums, REGRESSION_KEYS anahtarlı bir sözlük ya da aynı sırada bir dizi olabilir.
+    """
+    if not isinstance(sums, dict):
+        sums = dict(zip(REGRESSION_KEYS, np.asarray(sums, dtype=np.float64).tolist()))
+    
+    n = sums['n']
+    if n == 0:
+        return 0.0, 0.0, 0.0, 0.0
+    
+    ss_res = sums['sum_err2']
+    ss_tot = sums['sum_ref2'] - sums['sum_ref'] ** 2 / n
+    # Toplamlardan çıkarma yuvarlama hatası bırakabilir; göreli olarak sıfıra yakınsa sabit say
+    if ss_tot > 1e-12 * max(sums['sum_ref2'], 1.0):
+        r2 = 1.0 - ss_res / ss_tot
+    else:
+        # Sabit referans: sklearn.r2_score ile aynı davranış
+        r2 = 1.0 if ss_res == 0 else 0.0
+    
+    rmse = float(np.sqrt(ss_res / n))
+    mae = sums['sum_abs_err'] / n
+    bias = sums['sum_err'] / n
+    return float(r2), rmse, float(mae), float(bias)
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+Nokta tablosu ayrıştırıcı ve seyreltici
+CSV satırlarını ve nokta katmanı nesnelerini parça parça NumPy dizilerine dönüştürür ve atlananları
+nedenleriyle sayar; bellek kullanımı dosya boyutuyla değil parça boyutuyla sınırlıdır. Aynı pikseldeki
+ve birbirine çok yakın noktalar vektörel olarak elenir
+"""
+
+import numpy as np
+
+
+# Gerekli CSV sütunları (başlık satırında, büyük/küçük harf duyarsız)
+CSV_COLUMNS = ('id', 'x', 'y', 'reference_value')
+# Tek seferde ayrıştırılan satır sayısı
+CSV_CHUNK_ROWS = 100000
+# Ayrıntısı günlüğe yazılan en fazla atlanan satır
+MAX_REPORTED_ROWS = 10
+# Atlanan satırın günlükteki etiketi; nokta katmanlarında nesne kimliği kullanılır
+ROW_LABEL = "Satır {0} / Line {0}"
+FEATURE_LABEL = "Nesne {0} / Feature {0}"
+
+# Atlanma nedenleri -> günlük etiketi
+REJECT_REASONS = {
+    'missing_columns': "eksik sütun / missing columns",
+    'invalid_number': "geçersiz sayı / invalid number",
+    'invalid_geometry': "geçersiz geometri / invalid geometry",
+    'transform_failed': "CRS dönüşümü başarısız / CRS transform failed",
+    'outside_raster': "raster dışında / outside raster",
+}
+
+
+class RejectedRows:
+    """Atlanan satırların neden bazında sayısı ve ilk birkaçının ayrıntısı"""
+    def __init__(self, max_reported=MAX_REPORTED_ROWS, label=ROW_LABEL):
+        self.counts = {reason: 0 for reason in REJECT_REASONS}
+        self.examples = []
+        self.max_reported = max_reported
+        self.label = label
+    
+    def add(self, reason, line_numbers):
+        """line_numbers satırlarını reason nedeniyle atlanmış say"""
+        line_numbers = np.asarray(line_numbers).ravel()
+        self.counts[reason] += len(line_numbers)
+        for line_num in line_numbers[:max(self.max_reported - len(self.examples), 0)].tolist():
+            self.examples.append((line_num, reason))
+    
+    @property
+    def total(self):
+        return sum(self.counts.values())
+    
+    def summary(self):
+        """Günlük için çok satırlı özet; atlanan satır yoksa boş metin"""
+        if not self.total:
+            return ""
+        text = f"   ⚠ {self.total} satır atlandı / rows skipped: " + ", ".join(
+            f"{REJECT_REASONS[reason]} {count}" for reason, count in self.counts.items() if count) + "\n"
+        for line_num, reason in self.examples:
+            text += f"   ⚠ {self.label.format(line_num)}: {REJECT_REASONS[reason]}\n"
+        if self.total > len(self.examples):
+            text += f"   ... +{self.total - len(self.examples)}\n"
+        return text
+
+
+def csv_column_indices(header):
+    """Başlık satırından CSV_COLUMNS sırasıyla sütun indislerini döndür"""
+    headers = [name.strip().lower() for name in header]
+    missing = [name for name in CSV_COLUMNS if name not in headers]
+    if missing:
+        raise ValueError(f"CSV'de gerekli sütunlar eksik / Missing required CSV columns: {', '.join(missing)}")
+    return [headers.index(name) for name in CSV_COLUMNS]
+
+
+def parse_point_chunks(rows, columns, rejected, chunk_rows=CSV_CHUNK_ROWS):
+    """(satır numarası, alanlar) çiftlerini parça parça ayrıştır
+    
+    Her parça için (satır numaraları, kimlikler, x, y, referans değerleri)
+    dizileri üretir. Boş satırlar sessizce, eksik sütunlu veya sayıya
+    dönüşmeyen satırlar rejected'a kaydedilerek atlanır.
+    """
+    chunk = []
+    for item in rows:
+        chunk.append(item)
+        if len(chunk) >= chunk_rows:
+            yield _parse_chunk(chunk, columns, rejected)
+            chunk = []
+    if chunk:
+        yield _parse_chunk(chunk, columns, rejected)
+
+
+def _parse_chunk(chunk, columns, rejected):
+    id_idx, x_idx, y_idx, ref_idx = columns
+    n_columns = max(columns) + 1
+    
+    complete = [(line_num, fields) for line_num, fields in chunk if len(fields) >= n_columns]
+    short = [line_num for line_num, fields in chunk if fields and len(fields) < n_columns]
+    if short:
+        rejected.add('missing_columns', short)
+    
+    line_numbers = np.array([line_num for line_num, _ in complete], dtype=np.int64)
+    ids = np.array([fields[id_idx].strip() for _, fields in complete], dtype=str)
+    values = [[fields[idx] for _, fields in complete] for idx in (x_idx, y_idx, ref_idx)]
+    try:
+        # Hızlı yol: tüm parça tek dönüşümde
+        xs, ys, refs = (np.array(column, dtype=np.float64) for column in values)
+        parsed = np.ones(len(complete), dtype=bool)
+    except ValueError:
+        xs, ys, refs, parsed = _parse_numbers_by_row(values)
+    
+    # Koordinatı sayı olmayan satırlar da geçersizdir; referans NaN ise NoData sayılır
+    bad = ~parsed | ~np.isfinite(xs) | ~np.isfinite(ys)
+    if bad.any():
+        rejected.add('invalid_number', line_numbers[bad])
+        keep = ~bad
+        line_numbers, ids, xs, ys, refs = line_numbers[keep], ids[keep], xs[keep], ys[keep], refs[keep]
+    return line_numbers, ids, xs, ys, refs
+
+
+def _parse_numbers_by_row(values):
+    """Hatalı değer içeren parçayı satır satır ayrıştır; (x, y, ref, başarılı maskesi) döndür"""
+    n = len(values[0])
+    parsed = np.ones(n, dtype=bool)
+    arrays = [np.full(n, np.nan) for _ in values]
+    for row in range(n):
+        try:
+            numbers = [float(column[row]) for column in values]
+        except ValueError:
+            parsed[row] = False
+            continue
+        for array, number in zip(arrays, numbers):
+            array[row] = number
+    return arrays[0], arrays[1], arrays[2], parsed
+
+
+def unique_pixel_mask(rows, cols, width):
+    """Her pikseldeki ilk noktanın maskesi
+    
+    Piksel doğrusal indisle (satır * genişlik + sütun) tek geçişte
+    gruplanır; sıradaki ilk nokta tutulur. Raster dışındaki noktalar
+    (negatif indis) elenmez.
+    """
+    rows = np.asarray(rows, dtype=np.int64)
+    cols = np.asarray(cols, dtype=np.int64)
+    keep = (rows < 0) | (cols < 0)
+    inside = np.flatnonzero(~keep)
+    _, first = np.unique(rows[inside] * width + cols[inside], return_index=True)
+    keep[inside[first]] = True
+    return keep
+
+
+def thin_points(xs, ys, min_distance):
+    """Birbirine min_distance'tan yakın noktaları seyrelt; tutulacakların maskesini döndür
+    
+    Komşular ikili uzaklık matrisi yerine ızgara karmasıyla bulunur:
+    kenarı min_distance / √2 olan hücrede tutulan en fazla bir nokta
+    olabilir ve yalnızca ±2 hücre uzaklıktaki noktalar karşılaştırılır.
+    Her turda henüz karara bağlanmamış noktalardan hücre başına ilki aday
+    olur; adaylar sırayla açgözlü seçilir (önce gelen tutulur), tutulan
+    noktalara yakın kalanlar atılır. Sonuçta tutulan noktalar arası
+    uzaklık en az min_distance'tır ve atılan her nokta bir tutulan noktaya
+    yakındır. Bellek ve süre nokta sayısıyla doğrusal artar.
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    keep = np.zeros(len(xs), dtype=bool)
+    if not len(xs) or not min_distance > 0:
+        keep[:] = True
+        return keep
+    
+    cell = min_distance / np.sqrt(2.0)
+    cell_x = np.floor((xs - xs.min()) / cell).astype(np.int64)
+    cell_y = np.floor((ys - ys.min()) / cell).astype(np.int64)
+    # ±2 hücre kaydırılan anahtarlar başka bir sütunun hücresine denk gelmesin
+    stride = int(cell_y.max()) + 5
+    keys = cell_x * stride + cell_y
+    
+    def close_pairs(points, others):
+        """points ile others arasında min_distance'tan yakın (points, others) indis çiftleri"""
+        other_keys = keys[others]
+        order = np.argsort(other_keys)
+        sorted_keys = other_keys[order]
+        # Sıralı aranan anahtarlarla searchsorted önbellek dostu çalışır
+        points = points[np.argsort(keys[points], kind='stable')]
+        point_keys = keys[points]
+        point_index, other_index = [], []
+        for dx in range(-2, 3):
+            for dy in range(-2, 3):
+                # Köşe hücreler en az min_distance uzaktadır
+                if abs(dx) == 2 and abs(dy) == 2:
+                    continue
+                target = point_keys + dx * stride + dy
+                pos = np.minimum(np.searchsorted(sorted_keys, target), len(sorted_keys) - 1)
+                found = np.flatnonzero(sorted_keys[pos] == target)
+                a, b = points[found], others[order[pos[found]]]
+                close = (xs[a] - xs[b]) ** 2 + (ys[a] - ys[b]) ** 2 < min_distance ** 2
+                point_index.append(a[close])
+                other_index.append(b[close])
+        return np.concatenate(point_index), np.concatenate(other_index)
+    
+    undecided = np.arange(len(xs))
+    while len(undecided):
+        # Aynı hücredeki noktalar birbirine yakındır: hücre başına ilk nokta aday olur
+        _, first = np.unique(keys[undecided], return_index=True)
+        candidates = undecided[np.sort(first)]
+        
+        # Çiftler önce gelen noktaya göre sıralanınca her noktanın durumu kendi çiftlerinden önce kesinleşir
+        earlier, later = close_pairs(candidates, candidates)
+        forward = earlier < later
+        earlier, later = earlier[forward], later[forward]
+        pair_order = np.argsort(earlier, kind='stable')
+        dropped = set()
+        for i, j in zip(earlier[pair_order].tolist(), later[pair_order].tolist()):
+            if i not in dropped:
+                dropped.add(j)
+        keep[candidates] = True
+        keep[list(dropped)] = False
+        
+        # Tutulan noktalara yakın kalanlar atılır; geri kalanlar sonraki turda değerlendirilir
+        undecided = undecided[~keep[undecided]]
+        if len(undecided):
+            near, _ = close_pairs(undecided, np.flatnonzero(keep))
+            undecided = np.setdiff1d(undecided, near)
+    return keep
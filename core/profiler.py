@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""
+Aşama ölçümü
+Doğrulama aşamalarının süresini, Python/NumPy bellek tepe değerini ve paylaşılan sayaçları
+(ör. raster okuma süresi) kaydeder; sonuçlar rapora eklenecek sözlük olarak döner
+"""
+
+from contextlib import contextmanager
+import sys
+import threading
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:    # Windows
+    resource = None
+
+
+MB = 1024 * 1024
+
+
+class TimeCounter:
+    """Birden çok iş parçacığından beslenebilen süre ve adet sayacı"""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.seconds = 0.0
+        self.count = 0
+    
+    def add(self, seconds, count=1):
+        with self._lock:
+            self.seconds += seconds
+            self.count += count
+    
+    def snapshot(self):
+        """(süre, adet) döndür"""
+        with self._lock:
+            return self.seconds, self.count
+
+
+def process_peak_memory():
+    """Sürecin şimdiye kadarki en yüksek bellek kullanımı (bayt); ölçülemiyorsa None"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux kilobayt, macOS bayt döndürür
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class StageProfiler:
+    """Doğrulama aşamalarının süre ve bellek ölçümleri
+    
+    Her aşama stage() bağlamında çalıştırılır; aynı adlı aşamalar
+    toplanır. trace_memory True ise bellek tepe değeri tracemalloc ile
+    yalnızca aşama süresince izlenir ve aşama başındaki kullanıma göre
+    artışı gösterir; QGIS/GDAL'ın C++ tarafındaki ayırmalar buna dahil
+    değildir (süreç tepe değerine bakınız). tracemalloc süreçteki tüm
+    ayırmaları yavaşlattığından varsayılan olarak kapalıdır ve yalnızca
+    hata ayıklama veya kıyaslama için açılmalıdır. counters, ad -> TimeCounter sözlüğüdür; her aşama için
+    sayaçlardaki artış kaydedilir. log verilirse her aşama sonunda bir
+    satır yazılır.
+    """
+    def __init__(self, counters=None, log=None, trace_memory=False):
+        self.counters = dict(counters or {})
+        self.log = log
+        self.trace_memory = trace_memory
+        self.stages = {}
+    
+    @contextmanager
+    def stage(self, name, trace_memory=None):
+        """Bir aşamayı ölç; trace_memory=False ise bellek izlenmez (ör. kullanıcı beklemesi)"""
+        trace = self.trace_memory if trace_memory is None else trace_memory
+        # İç içe aşamalarda izleme dıştaki aşamaya aittir
+        owns_trace = trace and not tracemalloc.is_tracing()
+        if owns_trace:
+            tracemalloc.start()
+        counters_before = {key: counter.snapshot() for key, counter in self.counters.items()}
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - started
+            peak = None
+            if owns_trace:
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            deltas = {}
+            for key, counter in self.counters.items():
+                counter_seconds, counter_count = counter.snapshot()
+                deltas[key] = (counter_seconds - counters_before[key][0], counter_count - counters_before[key][1])
+            self._record(name, seconds, peak, deltas)
+    
+    def _record(self, name, seconds, peak, deltas):
+        entry = self.stages.setdefault(name, {'seconds': 0.0, 'calls': 0, 'peak_bytes': None,
+                                              'counters': {key: [0.0, 0] for key in self.counters}})
+        entry['seconds'] += seconds
+        entry['calls'] += 1
+        if peak is not None:
+            entry['peak_bytes'] = max(entry['peak_bytes'] or 0, peak)
+        for key, (counter_seconds, counter_count) in deltas.items():
+            entry['counters'][key][0] += counter_seconds
+            entry['counters'][key][1] += counter_count
+        
+        if self.log is not None:
+            line = f"⏱ {name}: {seconds:.3f} s"
+            if peak is not None:
+                line += f", tepe bellek / peak memory {peak / MB:.1f} MB"
+            for key, (counter_seconds, counter_count) in deltas.items():
+                if counter_count:
+                    line += f", {key} {counter_seconds:.3f} s ({counter_count})"
+            self.log(line + "\n")
+    
+    def as_dict(self):
+        """Aşama ölçümlerini JSON'a yazılabilir sözlük olarak döndür"""
+        stages = []
+        for name, entry in self.stages.items():
+            stage = {
+                'stage': name,
+                'seconds': round(entry['seconds'], 6),
+                'calls': entry['calls'],
+                'peak_memory_mb': None if entry['peak_bytes'] is None else round(entry['peak_bytes'] / MB, 3),
+            }
+            for key, (counter_seconds, counter_count) in entry['counters'].items():
+                stage[f'{key}_seconds'] = round(counter_seconds, 6)
+                stage[f'{key}_count'] = counter_count
+            stages.append(stage)
+        
+        peaks = [stage['peak_memory_mb'] for stage in stages if stage['peak_memory_mb'] is not None]
+        process_peak = process_peak_memory()
+        performance = {
+            'stages': stages,
+            'total_seconds': round(sum(stage['seconds'] for stage in stages), 6),
+            'peak_memory_mb': max(peaks) if peaks else None,
+            'process_peak_memory_mb': None if process_peak is None else round(process_peak / MB, 3),
+        }
+        for key in self.counters:
+            performance[f'{key}_seconds'] = round(sum(stage[f'{key}_seconds'] for stage in stages), 6)
+            performance[f'{key}_count'] = sum(stage[f'{key}_count'] for stage in stages)
+        return performance
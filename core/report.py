@@ -0,0 +1,430 @@
+# -*- coding: utf-8 -*-
+"""
+Doğrulama raporları
+Metrik sözlüklerinden sonuç modelini oluşturur, düz metin ve HTML rapor olarak biçimlendirir (arayüzden bağımsız)
+"""
+
+from datetime import datetime
+
+import numpy as np
+
+from .metrics import accuracy_metrics, category_regression_sums, regression_from_sums
+
+
+# Çok bantlı / toplu değerlendirmede karşılaştırma tablosunda gösterilen anahtarlar
+BAND_SUMMARY_KEYS = ('classified_map', 'band', 'n_points', 'overall_accuracy', 'kappa', 'f1_macro', 'r2', 'rmse')
+
+
+def band_metrics(map_name, band, cm, raw_sums, n_valid, category_labels, categories):
+    """Bir harita bandının karmaşıklık matrisi ve regresyon toplamlarından metrik sözlüğü"""
+    # OA, Kappa, F1, Precision, Recall ve sınıf raporu - yalnızca matristen
+    metrics = accuracy_metrics(cm, category_labels)
+    
+    # R², RMSE, MAE, Bias - ham piksel ve kategori değerleri üzerinden
+    r2, rmse, mae, bias = regression_from_sums(raw_sums)
+    r2_cat, rmse_cat, mae_cat, bias_cat = regression_from_sums(category_regression_sums(cm, categories))
+    
+    return {
+        'classified_map': map_name,
+        'band': band,
+        'n_points': n_valid,
+        'overall_accuracy': metrics['overall_accuracy'],
+        'kappa': metrics['kappa'],
+        'f1_macro': metrics['f1_macro'],
+        'f1_weighted': metrics['f1_weighted'],
+        'precision_macro': metrics['precision_macro'],
+        'recall_macro': metrics['recall_macro'],
+        'r2': float(r2),
+        'rmse': float(rmse),
+        'mae': float(mae),
+        'bias': float(bias),
+        'r2_cat': float(r2_cat),
+        'rmse_cat': float(rmse_cat),
+        'mae_cat': float(mae_cat),
+        'bias_cat': float(bias_cat),
+        'confusion_matrix': cm.tolist(),
+        'class_names': category_labels,
+        'class_report': metrics['class_report'],
+        'producers_accuracy': metrics['producers_accuracy'],
+        'users_accuracy': metrics['users_accuracy'],
+        'all_categories': categories
+    }
+
+
+def assemble_results(band_results, reference_name, sampling_method, bands, classified_maps):
+    """Harita/bant metrik sözlüklerinden sonuç sözlüğünü oluştur
+    
+    Üst düzey anahtarlar ilk değerlendirmeye (ana haritanın ilk bandı)
+    aittir; birden çok değerlendirme varsa band_results ve summary eklenir.
+    """
+    results = {
+        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'reference_map': reference_name,
+        'sampling_method': sampling_method,
+    }
+    results.update(band_results[0])
+    results['bands'] = bands
+    results['classified_maps'] = classified_maps
+    if len(band_results) > 1:
+        results['band_results'] = band_results
+        results['summary'] = [{key: result[key] for key in BAND_SUMMARY_KEYS} for result in band_results]
+    return results
+
+
+def text_report(results):
+    """Sonuçları düz metin rapor olarak biçimlendir"""
+    output = "=" * 80 + "\n"
+    output += "RASTER ACCURACY ASSESSMENT RESULTS / RASTER DOĞRULAMA ANALİZİ SONUÇLARI\n"
+    output += "=" * 80 + "\n\n"
+    
+    output += f"📅 Analiz Tarihi / Analysis Date: {results['timestamp']}\n"
+    output += f"📍 Nokta Sayısı / Number of Points: {results['n_points']}\n"
+    output += f"🎯 Örnekleme Metodu / Sampling Method: {results['sampling_method'].upper()}\n\n"
+    
+    # Çok bantlı / toplu değerlendirmede karşılaştırma tablosu; ayrıntılar ana haritanın ilk bandı içindir
+    if 'summary' in results:
+        output += "-" * 80 + "\n"
+        output += "COMPARISON / KARŞILAŞTIRMA\n"
+        output += "-" * 80 + "\n"
+        output += (f"{'Map/Harita':<20} {'Band':<6} {'Points':<10} {'OA':<8} {'Kappa':<8} "
+                   f"{'F1 Macro':<9} {'R²':<8} {'RMSE':<8}\n")
+        output += "-" * 80 + "\n"
+        for row in results['summary']:
+            output += (f"{row['classified_map'][:19]:<20} {row['band']:<6} {row['n_points']:<10} "
+                       f"{row['overall_accuracy']:<8.4f} {row['kappa']:<8.4f} {row['f1_macro']:<9.4f} "
+                       f"{row['r2']:<8.4f} {row['rmse']:<8.4f}\n")
+        output += (f"\nAyrıntılar {results['classified_map']} bant {results['band']} içindir / "
+                   f"Details below are for {results['classified_map']} band {results['band']}\n\n")
+    
+    output += "-" * 80 + "\n"
+    output += "PRIMARY METRICS / TEMEL METRİKLER\n"
+    output += "-" * 80 + "\n"
+    output += f"Overall Accuracy (OA)       : {results['overall_accuracy']:.4f} ({results['overall_accuracy']*100:.2f}%)\n"
+    output += f"Cohen's Kappa (κ)           : {results['kappa']:.4f}\n"
+    output += f"F1-Score (Macro)            : {results['f1_macro']:.4f}\n"
+    output += f"F1-Score (Weighted)         : {results['f1_weighted']:.4f}\n"
+    output += f"Precision (Macro)           : {results['precision_macro']:.4f}\n"
+    output += f"Recall (Macro)              : {results['recall_macro']:.4f}\n\n"
+    
+    # Kappa yorumlama
+    kappa_val = results['kappa']
+    if kappa_val < 0:
+        kappa_interp = "Poor (Zayıf)"
+    elif kappa_val < 0.20:
+        kappa_interp = "Slight (Hafif)"
+    elif kappa_val < 0.40:
+        kappa_interp = "Fair (Orta)"
+    elif kappa_val < 0.60:
+        kappa_interp = "Moderate (İyi)"
+    elif kappa_val < 0.80:
+        kappa_interp = "Substantial (Çok İyi)"
+    else:
+        kappa_interp = "Almost Perfect (Mükemmel)"
+    
+    output += f"Kappa Interpretation        : {kappa_interp}\n\n"
+    
+    # Regresyon istatistikleri - ham piksel değerleri
+    output += "-" * 80 + "\n"
+    output += "REGRESSION STATISTICS (Raw Pixel Values) / REGRESYON İSTATİSTİKLERİ (Ham Piksel)\n"
+    output += "-" * 80 + "\n"
+    output += f"R² (Coeff. of Determination): {results['r2']:.4f}\n"
+    output += f"RMSE (Root Mean Sq. Error) : {results['rmse']:.4f}\n"
+    output += f"MAE  (Mean Absolute Error)  : {results['mae']:.4f}\n"
+    output += f"Bias (Mean Error)           : {results['bias']:.4f}"
+    bias_dir = " (Overestimation / Fazla Tahmin)" if results['bias'] > 0 else " (Underestimation / Az Tahmin)" if results['bias'] < 0 else " (No Bias / Sapma Yok)"
+    output += f"{bias_dir}\n\n"
+    
+    # Regresyon istatistikleri - kategorik değerler
+    output += "-" * 80 + "\n"
+    output += "REGRESSION STATISTICS (Category Values) / REGRESYON İSTATİSTİKLERİ (Kategori)\n"
+    output += "-" * 80 + "\n"
+    output += f"R² (Coeff. of Determination): {results['r2_cat']:.4f}\n"
+    output += f"RMSE (Root Mean Sq. Error) : {results['rmse_cat']:.4f}\n"
+    output += f"MAE  (Mean Absolute Error)  : {results['mae_cat']:.4f}\n"
+    output += f"Bias (Mean Error)           : {results['bias_cat']:.4f}"
+    bias_dir_cat = " (Overestimation / Fazla Tahmin)" if results['bias_cat'] > 0 else " (Underestimation / Az Tahmin)" if results['bias_cat'] < 0 else " (No Bias / Sapma Yok)"
+    output += f"{bias_dir_cat}\n\n"
+    output += "-" * 80 + "\n"
+    
+    # Karmaşıklık matrisini tablo olarak göster
+    cm = np.array(results['confusion_matrix'])
+    class_names = results['class_names']
+    
+    # Başlık satırı
+    header = "Reference \\ Predicted".ljust(25)
+    for name in class_names:
+        header += f"{name[:12]:>14}"
+    output += header + "\n"
+    output += "-" * 80 + "\n"
+    
+    # Matris satırları
+    for i, row in enumerate(cm):
+        line = f"{class_names[i][:23]:23}  "
+        for val in row:
+            line += f"{val:>14}"
+        output += line + "\n"
+    
+    output += "\n"
+    
+    output += "-" * 80 + "\n"
+    output += "PER-CLASS METRICS / SINIF BAZLI METRİKLER\n"
+    output += "-" * 80 + "\n"
+    
+    # Her sınıf için detaylı metrikler
+    class_report = results['class_report']
+    
+    output += f"{'Class/Sınıf':<25} {'Precision':<12} {'Recall':<12} {'F1-Score':<12} {'Support':<10}\n"
+    output += "-" * 80 + "\n"
+    
+    for class_name in class_names:
+        if class_name in class_report:
+            metrics = class_report[class_name]
+            output += f"{class_name:<25} "
+            output += f"{metrics['precision']:<12.4f} "
+            output += f"{metrics['recall']:<12.4f} "
+            output += f"{metrics['f1-score']:<12.4f} "
+            output += f"{int(metrics['support']):<10}\n"
+    
+    output += "\n"
+    
+    # Producer's ve User's Accuracy
+    output += "-" * 80 + "\n"
+    output += "PRODUCER'S & USER'S ACCURACY / ÜRETİCİ VE KULLANICI DOĞRULUĞU\n"
+    output += "-" * 80 + "\n"
+    
+    output += f"{'Class/Sınıf':<25} {'Producer Acc.':<15} {'User Acc.':<15}\n"
+    output += "-" * 80 + "\n"
+    
+    for i, class_name in enumerate(class_names):
+        # Producer's Accuracy = Recall
+        # User's Accuracy = Precision
+        if class_name in class_report:
+            producer_acc = class_report[class_name]['recall']
+            user_acc = class_report[class_name]['precision']
+            
+            output += f"{class_name:<25} "
+            output += f"{producer_acc:<15.4f} "
+            output += f"{user_acc:<15.4f}\n"
+    
+    output += "\n"
+    
+    # Aşama süreleri ve bellek tepe değerleri
+    if 'performance' in results:
+        performance = results['performance']
+        # Bellek izleme kapalıysa (varsayılan) aşama bellek sütunu gösterilmez
+        traced = performance['peak_memory_mb'] is not None
+        output += "-" * 80 + "\n"
+        output += "PERFORMANCE / PERFORMANS\n"
+        output += "-" * 80 + "\n"
+        output += f"{'Stage/Aşama':<16} {'Time (s)':<12} "
+        output += f"{'Peak MB':<12} " if traced else ""
+        output += f"{'Raster read (s)':<17} {'Reads':<8}\n"
+        output += "-" * 80 + "\n"
+        for stage in performance['stages']:
+            output += f"{stage['stage']:<16} {stage['seconds']:<12.3f} "
+            output += f"{_memory(stage['peak_memory_mb']):<12} " if traced else ""
+            output += f"{stage.get('raster_read_seconds', 0.0):<17.3f} {stage.get('raster_read_count', 0):<8}\n"
+        output += "-" * 80 + "\n"
+        output += f"Toplam süre / Total time     : {performance['total_seconds']:.3f} s\n"
+        if traced:
+            output += f"Tepe bellek / Peak memory    : {_memory(performance['peak_memory_mb'])} MB\n"
+        output += f"Süreç tepe belleği / Process : {_memory(performance['process_peak_memory_mb'])} MB\n\n"
+    
+    output += "=" * 80 + "\n"
+    
+    return output
+
+
+def _memory(value):
+    """Bellek değerini (MB) biçimlendir; ölçülmediyse '-'"""
+    return "-" if value is None else f"{value:.1f}"
+
+
+def html_report(results):
+    """Sonuçları HTML rapor olarak biçimlendir"""
+    html = f"""
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <title>Raster Accuracy Assessment Report</title>
+    <style>
+        body {{ 
+            font-family: 'Segoe UI', Arial, sans-serif; 
+            margin: 40px; 
+            background: #f5f5f5;
+        }}
+        .container {{
+            max-width: 1200px;
+            margin: 0 auto;
+            background: white;
+            padding: 30px;
+            border-radius: 10px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        }}
+        h1 {{ 
+            color: #2c3e50; 
+            border-bottom: 4px solid #3498db; 
+            padding-bottom: 10px;
+        }}
+        h2 {{ 
+            color: #34495e; 
+            margin-top: 30px;
+            border-left: 5px solid #3498db;
+            padding-left: 15px;
+        }}
+        .metric {{ 
+            background: #ecf0f1; 
+            padding: 15px; 
+            margin: 15px 0; 
+            border-radius: 8px;
+            border-left: 5px solid #3498db;
+        }}
+        .metric-value {{
+            font-size: 1.3em;
+            font-weight: bold;
+            color: #2c3e50;
+        }}
+        table {{ 
+            border-collapse: collapse; 
+            width: 100%; 
+            margin: 20px 0;
+            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
+        }}
+        th, td {{ 
+            border: 1px solid #ddd; 
+            padding: 12px; 
+            text-align: center; 
+        }}
+        th {{ 
+            background-color: #3498db; 
+            color: white;
+            font-weight: bold;
+        }}
+        tr:nth-child(even) {{ background-color: #f9f9f9; }}
+        tr:hover {{ background-color: #f5f5f5; }}
+        .footer {{
+            margin-top: 40px;
+            padding-top: 20px;
+            border-top: 2px solid #ecf0f1;
+            color: #7f8c8d;
+            font-size: 0.9em;
+        }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>🌍 Raster Accuracy Assessment Report</h1>
+        <p><strong>Analysis Date:</strong> {results['timestamp']}</p>
+        
+        <h2>📊 Primary Metrics / Temel Metrikler</h2>
+        <div class="metric">
+            <p><strong>Overall Accuracy (OA):</strong> 
+            <span class="metric-value">{results['overall_accuracy']:.4f} ({results['overall_accuracy']*100:.2f}%)</span></p>
+        </div>
+        <div class="metric">
+            <p><strong>Cohen's Kappa (κ):</strong> 
+            <span class="metric-value">{results['kappa']:.4f}</span></p>
+        </div>
+        <div class="metric">
+            <p><strong>F1-Score (Macro):</strong> 
+            <span class="metric-value">{results['f1_macro']:.4f}</span></p>
+            <p><strong>F1-Score (Weighted):</strong> 
+            <span class="metric-value">{results['f1_weighted']:.4f}</span></p>
+        </div>
+        <div class="metric">
+            <p><strong>Precision (Macro):</strong> {results['precision_macro']:.4f}</p>
+            <p><strong>Recall (Macro):</strong> {results['recall_macro']:.4f}</p>
+        </div>
+        
+        <h2>📐 Regression Statistics / Regresyon İstatistikleri</h2>
+        <div class="metric">
+            <p><em>Ham Piksel Değerleri / Raw Pixel Values</em></p>
+            <p><strong>R² (Determination Coeff.):</strong> <span class="metric-value">{results['r2']:.4f}</span></p>
+            <p><strong>RMSE (Root Mean Sq. Error):</strong> <span class="metric-value">{results['rmse']:.4f}</span></p>
+            <p><strong>MAE (Mean Absolute Error):</strong> <span class="metric-value">{results['mae']:.4f}</span></p>
+            <p><strong>Bias (Mean Error):</strong> <span class="metric-value">{results['bias']:.4f}</span>
+            {"&nbsp;⬆ Overestimation" if results['bias'] > 0 else "&nbsp;⬇ Underestimation" if results['bias'] < 0 else "&nbsp;✓ No Bias"}</p>
+        </div>
+        <div class="metric">
+            <p><em>Kategori Değerleri / Category Values</em></p>
+            <p><strong>R²:</strong> <span class="metric-value">{results['r2_cat']:.4f}</span></p>
+            <p><strong>RMSE:</strong> <span class="metric-value">{results['rmse_cat']:.4f}</span></p>
+            <p><strong>MAE:</strong> <span class="metric-value">{results['mae_cat']:.4f}</span></p>
+            <p><strong>Bias:</strong> <span class="metric-value">{results['bias_cat']:.4f}</span>
+            {"&nbsp;⬆ Overestimation" if results['bias_cat'] > 0 else "&nbsp;⬇ Underestimation" if results['bias_cat'] < 0 else "&nbsp;✓ No Bias"}</p>
+        </div>
+        
+        <h2>📋 Confusion Matrix / Karmaşıklık Matrisi</h2>
+        <table>
+            <tr>
+                <th>Reference \\ Predicted</th>
+"""
+
+    class_names = results['class_names']
+    cm = np.array(results['confusion_matrix'])
+    
+    for name in class_names:
+        html += f"<th>{name}</th>"
+    html += "</tr>\n"
+    
+    for i, row in enumerate(cm):
+        html += f"<tr><th>{class_names[i]}</th>"
+        for val in row:
+            html += f"<td>{val}</td>"
+        html += "</tr>\n"
+    html += "        </table>\n"
+    
+    # Çok bantlı / toplu değerlendirmede karşılaştırma tablosu
+    if 'summary' in results:
+        html += f"""
+        <h2>🗂 Comparison / Karşılaştırma</h2>
+        <p>Yukarıdaki ayrıntılar {results['classified_map']} bant {results['band']} içindir /
+        Details above are for {results['classified_map']} band {results['band']}</p>
+        <table>
+            <tr><th>Map</th><th>Band</th><th>Points</th><th>OA</th><th>Kappa</th><th>F1 Macro</th><th>R²</th><th>RMSE</th></tr>
+"""
+        for row in results['summary']:
+            html += (f"<tr><td>{row['classified_map']}</td><td>{row['band']}</td><td>{row['n_points']}</td>"
+                     f"<td>{row['overall_accuracy']:.4f}</td>"
+                     f"<td>{row['kappa']:.4f}</td><td>{row['f1_macro']:.4f}</td><td>{row['r2']:.4f}</td>"
+                     f"<td>{row['rmse']:.4f}</td></tr>\n")
+        html += "        </table>\n"
+    
+    # Aşama süreleri ve bellek tepe değerleri
+    if 'performance' in results:
+        performance = results['performance']
+        # Bellek izleme kapalıysa (varsayılan) aşama bellek sütunu gösterilmez
+        traced = performance['peak_memory_mb'] is not None
+        html += """
+        <h2>⏱ Performance / Performans</h2>
+        <table>
+            <tr><th>Stage</th><th>Time (s)</th>"""
+        html += "<th>Peak MB</th>" if traced else ""
+        html += "<th>Raster read (s)</th><th>Reads</th></tr>\n"
+        for stage in performance['stages']:
+            html += f"<tr><td>{stage['stage']}</td><td>{stage['seconds']:.3f}</td>"
+            html += f"<td>{_memory(stage['peak_memory_mb'])}</td>" if traced else ""
+            html += (f"<td>{stage.get('raster_read_seconds', 0.0):.3f}</td>"
+                     f"<td>{stage.get('raster_read_count', 0)}</td></tr>\n")
+        html += f"<tr><th>Total</th><th>{performance['total_seconds']:.3f}</th>"
+        html += f"<th>{_memory(performance['peak_memory_mb'])}</th>" if traced else ""
+        html += (f"<th>{performance.get('raster_read_seconds', 0.0):.3f}</th>"
+                 f"<th>{performance.get('raster_read_count', 0)}</th></tr>\n")
+        html += "        </table>\n"
+        html += (f"        <p>Süreç tepe belleği / Process peak memory: "
+                 f"{_memory(performance['process_peak_memory_mb'])} MB</p>\n")
+    
+    html += """
+        <h2>💡 Quality Assessment / Kalite Değerlendirmesi</h2>
+        <p>Detailed analysis results are available in the complete report.</p>
+        
+        <div class="footer">
+            <p>Generated by QGIS Raster Accuracy Assessment Plugin</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+    return html
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+Örnek tablosu
+Doğrulama noktalarını nokta başına sözlük yerine sütun bazlı NumPy dizilerinde tutar
+"""
+
+import numpy as np
+
+from .mapping import UNMAPPED
+
+
+class SampleTable:
+    """Doğrulama noktalarının sütun bazlı tablosu
+    
+    Her sütun nokta sayısı uzunluğunda bir NumPy dizisidir: harita
+    koordinatları, örnekleme ızgarasındaki piksel indisleri, isteğe bağlı
+    nokta kimlikleri, ham referans/sınıflandırılmış değerler (okunmadıysa
+    NaN), eşleştirilmiş kategoriler (eşleşmeyenler UNMAPPED) ve uyum bayrağı.
+    """
+    __slots__ = ('coord_x', 'coord_y', 'rows', 'cols', 'ids', 'reference_values', 'classified_values',
+                 'reference_categories', 'classified_categories', 'match')
+    
+    def __init__(self, coord_x, coord_y, rows=None, cols=None, ids=None,
+                 reference_values=None, classified_values=None):
+        self.coord_x = np.asarray(coord_x, dtype=np.float64)
+        self.coord_y = np.asarray(coord_y, dtype=np.float64)
+        n = len(self.coord_x)
+        self.rows = self._column(rows, n, np.int64, -1)
+        self.cols = self._column(cols, n, np.int64, -1)
+        self.ids = None if ids is None else np.asarray(ids)
+        self.reference_values = self._column(reference_values, n, np.float64, np.nan)
+        self.classified_values = self._column(classified_values, n, np.float64, np.nan)
+        self.reference_categories = np.full(n, UNMAPPED, dtype=np.int64)
+        self.classified_categories = np.full(n, UNMAPPED, dtype=np.int64)
+        self.match = np.zeros(n, dtype=bool)
+    
+    @staticmethod
+    def _column(values, n, dtype, fill):
+        if values is None:
+            return np.full(n, fill, dtype=dtype)
+        return np.asarray(values, dtype=dtype)
+    
+    def __len__(self):
+        return len(self.coord_x)
+    
+    def subset(self, index):
+        """Seçilen satırlardan (maske veya indis dizisi) yeni tablo döndür"""
+        table = SampleTable.__new__(SampleTable)
+        for name in self.__slots__:
+            column = getattr(self, name)
+            setattr(table, name, None if column is None else column[index])
+        return table
+    
+    def set_categories(self, reference_categories, classified_categories):
+        """Eşleştirilmiş kategorileri kaydet ve uyum bayrağını güncelle"""
+        self.reference_categories = np.asarray(reference_categories, dtype=np.int64)
+        self.classified_categories = np.asarray(classified_categories, dtype=np.int64)
+        self.match = ((self.reference_categories == self.classified_categories) &
+                      (self.reference_categories != UNMAPPED))
+    
+    def mapped(self):
+        """Her iki kategorisi de eşleştirilmiş noktaların maskesi"""
+        return (self.reference_categories != UNMAPPED) & (self.classified_categories != UNMAPPED)
+    
+    @property
+    def nbytes(self):
+        """Tablonun bellek kullanımı (bayt)"""
+        return sum(getattr(self, name).nbytes for name in self.__slots__ if getattr(self, name) is not None)
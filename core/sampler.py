@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+Örnekleyici
+Örnek sayılarının gruplara ve sınıflara dağıtımı ile akış (rezervuar) örneklemesi;
+yalnızca NumPy dizileri üzerinde çalışır
+"""
+
+import numpy as np
+
+
+# NumPy hipergeometrik örnekleyicisinin kabul ettiği en büyük toplam
+HYPERGEOMETRIC_LIMIT = 10 ** 9
+# Katmanlı örneklemede örnek dağıtım yöntemleri
+ALLOCATIONS = ('equal', 'proportional', 'neyman')
+# Rezervuar dizisinin başlangıç boyutu; küçük sınıflar kapasite kadar yer ayırmaz
+RESERVOIR_INITIAL_SIZE = 1024
+
+
+def split_sample(rng, sizes, n):
+    """n örneği, boyutları sizes olan gruplar arasında iadesiz rastgele dağıt
+    
+    Sonuç, toplam popülasyondan iadesiz n eleman çekip grup başına
+    saymakla aynı dağılıma sahiptir.
+    """
+    sizes = np.asarray(sizes, dtype=np.int64)
+    total = int(sizes.sum())
+    if n > total:
+        raise ValueError(f"Yeterli geçerli piksel yok / Not enough valid pixels: {total} < {n}")
+    if total < HYPERGEOMETRIC_LIMIT:
+        return rng.multivariate_hypergeometric(sizes, n)
+    
+    # Çok büyük popülasyonlar: genel sıra numaralarını çekip gruplara ata
+    ranks = rng.choice(total, n, replace=False)
+    groups = np.searchsorted(np.cumsum(sizes), ranks, side='right')
+    return np.bincount(groups, minlength=len(sizes))
+
+
+def stratum_std(sizes, agreements):
+    """Sınıf başına doğruluk göstergesinin standart sapması: sqrt(p(1-p))
+    
+    p, sınıftaki pikseller içinde sınıflandırılmış değeri referans sınıfıyla
+    eşleşenlerin oranıdır (agreements / sizes). Boş sınıflar için 0 döner.
+    """
+    sizes = np.asarray(sizes, dtype=np.float64)
+    agreements = np.asarray(agreements, dtype=np.float64)
+    p = np.divide(agreements, sizes, out=np.zeros_like(agreements), where=sizes > 0)
+    return np.sqrt(np.clip(p * (1.0 - p), 0.0, None))
+
+
+def allocate_samples(sizes, n_total, method='proportional', min_per_class=0, std=None):
+    """Toplam n_total örneği sınıflara dağıt; toplam tam olarak n_total olur
+    
+    equal: sınıflara eşit, proportional: sınıf boyutuyla orantılı,
+    neyman: boyut x standart sapma (std, bkz. stratum_std) ile orantılı. Her sınıf en az
+    min_per_class örnek alır (sınıf boyutunu aşmadan) ve hiçbir sınıf
+    boyutundan fazla örnek almaz.
+    """
+    sizes = np.asarray(sizes, dtype=np.int64)
+    if method not in ALLOCATIONS:
+        raise ValueError(f"Bilinmeyen dağıtım yöntemi / Unknown allocation method: {method}")
+    if n_total > sizes.sum():
+        raise ValueError(f"Yeterli geçerli piksel yok / Not enough valid pixels: {sizes.sum()} < {n_total}")
+    
+    lower = np.minimum(min_per_class, sizes)
+    if lower.sum() > n_total:
+        raise ValueError(f"Sınıf başına en az {min_per_class} örnek için toplam yetersiz\n"
+                         f"Total is too small for {min_per_class} samples per class: "
+                         f"{lower.sum()} > {n_total}")
+    
+    if method == 'equal':
+        weights = (sizes > 0).astype(np.float64)
+    elif method == 'neyman' and std is not None and np.dot(sizes, std) > 0:
+        weights = sizes * np.asarray(std, dtype=np.float64)
+    else:
+        weights = sizes.astype(np.float64)
+    
+    # Sınırlara takılan sınıfları sabitleyip kalanı serbest sınıflara yeniden dağıt
+    target = np.zeros(len(sizes), dtype=np.float64)
+    fixed = sizes == 0
+    while True:
+        free = ~fixed
+        if not free.any():
+            break
+        free_weights = weights[free] if weights[free].sum() > 0 else np.ones(free.sum())
+        target[free] = (n_total - target[fixed].sum()) * free_weights / free_weights.sum()
+        over = free & (target > sizes)
+        under = free & (target < lower)
+        if not over.any() and not under.any():
+            break
+        target[over] = sizes[over]
+        target[under] = lower[under]
+        fixed |= over | under
+    
+    return _round_to_total(target, lower, sizes, n_total)
+
+
+def _round_to_total(target, lower, upper, total):
+    """Hedefleri [lower, upper] sınırları içinde toplamı total olan tam sayılara yuvarla
+    (en büyük kalan yöntemi)"""
+    base = np.clip(np.floor(target), lower, upper).astype(np.int64)
+    remainder = target - np.floor(target)
+    diff = total - int(base.sum())
+    while diff != 0:
+        if diff > 0:
+            candidates = np.flatnonzero(base < upper)
+            candidates = candidates[np.argsort(-remainder[candidates], kind='stable')][:diff]
+            base[candidates] += 1
+        else:
+            candidates = np.flatnonzero(base > lower)
+            candidates = candidates[np.argsort(remainder[candidates], kind='stable')][:-diff]
+            base[candidates] -= 1
+        diff = total - int(base.sum())
+    return base
+
+
+class Reservoir:
+    """Algorithm L ile akıştan sabit boyutlu iadesiz örneklem (Li, 1994)
+    
+    Doldurulduktan sonra her elemana bakılmaz; bir sonraki değiştirmeye
+    kadar atlanacak eleman sayısı geometrik dağılımdan çekilir. Toplam
+    değiştirme sayısı O(k log(N/k)) olduğundan maliyet akış uzunluğuna
+    değil örneklem boyutuna bağlıdır. Dizi doldukça ikiye katlanarak
+    büyür; bellek kapasiteyle değil görülen eleman sayısıyla (en fazla
+    kapasite) orantılıdır.
+    """
+    def __init__(self, capacity, rng):
+        self.capacity = capacity
+        self.rng = rng
+        self.items = np.empty(min(capacity, RESERVOIR_INITIAL_SIZE), dtype=np.int64)
+        self.seen = 0
+        self._w = 1.0
+        self._next = 0
+    
+    def _uniform(self):
+        """(0, 1] aralığında rastgele sayı"""
+        return 1.0 - self.rng.random()
+    
+    def _skip(self):
+        """Bir sonraki değiştirilecek elemana olan uzaklık"""
+        return int(np.floor(np.log(self._uniform()) / np.log1p(-self._w))) + 1 if self._w < 1 else 1
+    
+    def extend(self, values):
+        """Akışa bir grup eleman ekle"""
+        values = np.asarray(values, dtype=np.int64)
+        start = 0
+        
+        # Doldurma aşaması
+        if self.seen < self.capacity:
+            start = min(self.capacity - self.seen, len(values))
+            if self.seen + start > len(self.items):
+                grown = np.empty(min(self.capacity, max(2 * len(self.items), self.seen + start)), dtype=np.int64)
+                grown[:self.seen] = self.items[:self.seen]
+                self.items = grown
+            self.items[self.seen:self.seen + start] = values[:start]
+            self.seen += start
+            if self.seen == self.capacity:
+                self._w = np.exp(np.log(self._uniform()) / self.capacity)
+                self._next = self.seen - 1 + self._skip()
+        
+        if self.capacity == 0:
+            self.seen += len(values)
+            return
+        if self.seen < self.capacity:
+            return
+        
+        # values[i] akıştaki (first + i). elemandır
+        first = self.seen - start
+        end = first + len(values)
+        while self._next < end:
+            self.items[self.rng.integers(self.capacity)] = values[self._next - first]
+            self._w *= np.exp(np.log(self._uniform()) / self.capacity)
+            self._next += self._skip()
+        self.seen = end
+    
+    def sample(self):
+        """Şimdiye kadar görülen elemanlardan örneklem"""
+        return self.items[:min(self.seen, self.capacity)]
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+Tam kapsamlı (wall-to-wall) karşılaştırma
+Hizalı iki raster'ı karo karo okuyup tüm piksellerden karmaşıklık matrisi oluşturur
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import os
+import queue
+
+import numpy as np
+
+from .core.extractor import DEFAULT_TILE_SIZE, iter_windows
+from .core.mapping import category_index_mapping
+from .core.metrics import REGRESSION_KEYS, compare_tiles
+from .raster_io import layer_reads, pixel_window_extent, read_valid_block
+
+
+# Piksel hizalaması için kapsam toleransı (piksel boyutunun oranı)
+ALIGNMENT_TOLERANCE = 1e-6
+# Varsayılan işçi sayısı
+DEFAULT_WORKERS = os.cpu_count() or 1
+
+
+def check_alignment(reference_layer, classified_layer):
+    """İki raster'ın aynı piksel ızgarasında olup olmadığını kontrol et"""
+    if reference_layer.crs() != classified_layer.crs():
+        raise ValueError("Rasterların CRS'leri farklı / Rasters have different CRS")
+    
+    if (reference_layer.width() != classified_layer.width() or
+            reference_layer.height() != classified_layer.height()):
+        raise ValueError(
+            f"Raster boyutları farklı / Raster sizes differ: "
+            f"{reference_layer.width()}x{reference_layer.height()} - "
+            f"{classified_layer.width()}x{classified_layer.height()}")
+    
+    ref_extent = reference_layer.extent()
+    class_extent = classified_layer.extent()
+    tolerance = ALIGNMENT_TOLERANCE * max(reference_layer.rasterUnitsPerPixelX(),
+                                          reference_layer.rasterUnitsPerPixelY())
+    if (abs(ref_extent.xMinimum() - class_extent.xMinimum()) > tolerance or
+            abs(ref_extent.yMaximum() - class_extent.yMaximum()) > tolerance or
+            abs(ref_extent.xMaximum() - class_extent.xMaximum()) > tolerance or
+            abs(ref_extent.yMinimum() - class_extent.yMinimum()) > tolerance):
+        raise ValueError("Raster kapsamları hizalı değil / Raster extents are not aligned")
+
+
+def exhaustive_confusion_matrix(reference_layer, classified_layer, reference_mapping,
+                                classified_mapping, categories, tile_size=DEFAULT_TILE_SIZE,
+                                workers=1, progress_callback=None):
+    """Tüm pikselleri karşılaştırarak karmaşıklık matrisi ve regresyon toplamlarını döndür
+    
+    Sınıflandırılmış raster'ın 1. bandı kullanılır; ayrıntılar için
+    exhaustive_band_matrices'e bakınız.
+    """
+    return exhaustive_band_matrices(reference_layer, classified_layer, reference_mapping, classified_mapping,
+                                    categories, [1], tile_size, workers, progress_callback)[0]
+
+
+def exhaustive_band_matrices(reference_layer, classified_layer, reference_mapping, classified_mapping,
+                             categories, classified_bands, tile_size=DEFAULT_TILE_SIZE, workers=1,
+                             progress_callback=None):
+    """Sınıflandırılmış raster'ın her bandı için (karmaşıklık matrisi, regresyon toplamları) listesi döndür
+    
+    Tüm bantlar tek geçişte değerlendirilir; ayrıntılar için
+    exhaustive_batch_matrices'e bakınız.
+    """
+    return exhaustive_batch_matrices(reference_layer, [classified_layer], reference_mapping, classified_mapping,
+                                     categories, classified_bands, tile_size, workers, progress_callback)[0]
+
+
+def exhaustive_batch_matrices(reference_layer, classified_layers, reference_mapping, classified_mapping,
+                              categories, classified_bands=(1,), tile_size=DEFAULT_TILE_SIZE, workers=1,
+                              progress_callback=None):
+    """Birden çok sınıflandırılmış raster'ı tek referansla karşılaştır
+    
+    Her sınıflandırılmış raster için bant başına (karmaşıklık matrisi,
+    regresyon toplamları) listelerinin listesini döndürür. Tüm haritalar
+    ve bantlar tek geçişte değerlendirilir: her karoda referans bir kez,
+    ardından her haritanın seçili bantları aynı pencere için okunur.
+    
+    Eşleştirmeler bir kez arama tablosuna derlenir; her piksel çifti
+    ref_kat * K + sınıf_kat olarak kodlanır ve np.bincount ile toplanır.
+    Her karonun sonucu hemen toplama eklenir; bellek kullanımı karo
+    boyutuyla sınırlıdır. Eşleştirmede bulunmayan değerler ve NoData
+    pikselleri hesaba katılmaz.
+    
+    workers > 1 ise karolar bir iş parçacığı havuzunda işlenir; her iş
+    parçacığı kendi sağlayıcı kopyasını kullanır. Kısmi sonuçlar karo
+    sırasıyla toplandığından sonuç seri çalıştırmayla birebir aynıdır.
+    """
+    for classified_layer in classified_layers:
+        check_alignment(reference_layer, classified_layer)
+    
+    k = len(categories)
+    reference_index = category_index_mapping(reference_mapping, categories)
+    classified_index = category_index_mapping(classified_mapping, categories)
+    windows = list(iter_windows(reference_layer.width(), reference_layer.height(), tile_size))
+    
+    layers = [reference_layer] + list(classified_layers)
+    
+    def process(window, providers):
+        row, col, win_h, win_w = window
+        ref_tile, ref_valid = read_valid_block(
+            providers[0], 1, pixel_window_extent(reference_layer, row, col, win_h, win_w), win_w, win_h,
+            cache=None, reads=layer_reads(reference_layer))
+        results = []
+        for classified_layer, class_provider in zip(classified_layers, providers[1:]):
+            class_extent = pixel_window_extent(classified_layer, row, col, win_h, win_w)
+            for band in classified_bands:
+                class_tile, class_valid = read_valid_block(class_provider, band, class_extent, win_w, win_h,
+                                                           cache=None, reads=layer_reads(classified_layer))
+                results.append(compare_tiles(ref_tile, class_tile, reference_index, classified_index, k,
+                                             ref_valid & class_valid))
+        return results
+    
+    # Karo sonuçları hesaplandıkça toplanır (harita x bant sırasıyla)
+    n_results = len(classified_layers) * len(classified_bands)
+    cms = np.zeros((n_results, k * k), dtype=np.int64)
+    totals = np.zeros((n_results, len(REGRESSION_KEYS)), dtype=np.float64)
+    
+    def add(tile_results):
+        for result_no, (tile_cm, tile_sums) in enumerate(tile_results):
+            cms[result_no] += tile_cm
+            totals[result_no] += tile_sums
+    
+    if workers <= 1:
+        providers = [layer.dataProvider() for layer in layers]
+        for tile_no, window in enumerate(windows, start=1):
+            add(process(window, providers))
+            if progress_callback is not None:
+                progress_callback(tile_no / len(windows))
+    else:
+        _process_parallel(windows, process, layers, workers, add, progress_callback)
+    
+    results = []
+    for cm, band_totals in zip(cms, totals):
+        sums = dict(zip(REGRESSION_KEYS, band_totals.tolist()))
+        sums['n'] = int(sums['n'])
+        results.append((cm.reshape(k, k), sums))
+    n_bands = len(classified_bands)
+    return [results[i:i + n_bands] for i in range(0, n_results, n_bands)]
+
+
+def _process_parallel(windows, process, layers, workers, add, progress_callback):
+    """Karoları iş parçacığı havuzunda işle; sonuçları karo sırasıyla add'e ver
+    
+    Aynı anda en fazla 2 * workers karo işlenir veya sırasını bekler;
+    bellek kullanımı karo sayısından bağımsızdır. Biten karolar önceki
+    karolar toplanana dek bekletildiğinden ondalıklı toplamlar seri
+    çalıştırmayla birebir aynıdır.
+    """
+    # QGIS sağlayıcıları iş parçacığı güvenli değildir: her işçiye ayrı kopya
+    provider_pool = queue.Queue()
+    for _ in range(workers):
+        provider_pool.put([layer.dataProvider().clone() for layer in layers])
+    
+    def run(window):
+        providers = provider_pool.get()
+        try:
+            return process(window, providers)
+        finally:
+            provider_pool.put(providers)
+    
+    max_ahead = 2 * workers
+    running = {}
+    finished = {}
+    next_submit = next_add = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            while next_add < len(windows):
+                while next_submit < len(windows) and next_submit < next_add + max_ahead:
+                    running[executor.submit(run, windows[next_submit])] = next_submit
+                    next_submit += 1
+                
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    finished[running.pop(future)] = future.result()
+                
+                # Toplama karo sırasıyla yapılır
+                while next_add in finished:
+                    add(finished.pop(next_add))
+                    next_add += 1
+                    if progress_callback is not None:
+                        progress_callback(next_add / len(windows))
+        except BaseException:
+            # İptal veya hata: bekleyen karoları başlatma
+            for future in running:
+                future.cancel()
+            raise
@@ -0,0 +1,645 @@
+# -*- coding: utf-8 -*-
+"""
+Doğrulama hattı
+Örnekleme, nokta değerleri, benzersiz sınıf taraması ve metrik hesaplarını arayüzden bağımsız yürütür;
+iletişim kutusu ve Processing algoritması aynı fonksiyonları kullanır
+"""
+
+import csv
+import json
+import os
+
+import numpy as np
+from qgis.PyQt.QtCore import QVariant
+from qgis.core import (NULL, QgsCoordinateReferenceSystem, QgsCoordinateTransform, QgsCsException, QgsFeature,
+                       QgsFeatureRequest, QgsField, QgsFields, QgsGeometry, QgsPointXY, QgsProject,
+                       QgsSettings, QgsVectorLayerFeatureSource, QgsWkbTypes)
+
+from .core.extractor import valid_mask
+from .core.mapping import CompiledMapping
+from .core.metrics import confusion_matrix_from_labels, regression_sums
+from .core.points import (FEATURE_LABEL, RejectedRows, csv_column_indices, parse_point_chunks, thin_points,
+                          unique_pixel_mask)
+from .core.profiler import StageProfiler, TimeCounter
+from .core.report import assemble_results, band_metrics
+from .core.sample_table import SampleTable
+from .exhaustive import exhaustive_batch_matrices
+from .raster_io import (coords_to_pixels, pixels_to_coords, sample_pixel_bands, sample_pixels,
+                        transform_coordinates, unique_value_counts)
+from .sampling import random_sample, reservoir_stratified_sample, stratified_sample
+
+
+# Hata ayıklama ayarı: true ise aşamaların Python/NumPy bellek tepe değeri ölçülür
+TRACE_MEMORY_SETTING = 'RasterAccuracyAssessment/trace_memory'
+
+
+def trace_memory_enabled():
+    """Aşama bellek ölçümü (tracemalloc) açık mı - QGIS ayarı TRACE_MEMORY_SETTING"""
+    return QgsSettings().value(TRACE_MEMORY_SETTING, False, type=bool)
+
+
+def identical_mappings(reference_values, classified_values):
+    """Aynı değerleri aynı kategoriye atayan eşleştirme (iletişim kutusundaki 'Aynı Değerler (1:1)')
+    
+    (referans eşleştirmesi, sınıflandırılmış eşleştirmesi, kategori adları) döndürür.
+    """
+    value_to_category = {}
+    for value in sorted(set(reference_values)) + sorted(set(classified_values)):
+        if value not in value_to_category:
+            value_to_category[value] = len(value_to_category) + 1
+    
+    reference_mapping = {value: value_to_category[value] for value in set(reference_values)}
+    classified_mapping = {value: value_to_category[value] for value in set(classified_values)}
+    class_names = {category: f"Sınıf_{int(value)}" if float(value).is_integer() else f"Sınıf_{value:.2f}"
+                   for value, category in value_to_category.items()}
+    return reference_mapping, classified_mapping, class_names
+
+
+def load_mappings(path):
+    """JSON eşleştirme dosyasını (referans eşleştirmesi, sınıflandırılmış eşleştirmesi, kategori adları) olarak oku
+    
+    Biçim: {"reference": {"<değer>": <kategori>}, "classified": {"<değer>": <kategori>},
+    "class_names": {"<kategori>": "<ad>"}}; class_names isteğe bağlıdır.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    
+    try:
+        reference_mapping = {float(value): int(category) for value, category in data['reference'].items()}
+        classified_mapping = {float(value): int(category) for value, category in data['classified'].items()}
+    except (KeyError, AttributeError, ValueError) as e:
+        raise ValueError(f"Geçersiz eşleştirme dosyası / Invalid mapping file: {e}")
+    
+    class_names = {int(category): name for category, name in data.get('class_names', {}).items()}
+    return reference_mapping, classified_mapping, class_names
+
+
+def load_points_from_csv(csv_path, reference_layer, transform_context=None, log=None, progress_callback=None):
+    """CSV dosyasından noktaları SampleTable olarak yükle
+    
+    Arka plan görevinden çağrılabilir: arayüze dokunmaz. Satırlar
+    CSV_CHUNK_ROWS'luk parçalar halinde ayrıştırılır; her parçanın
+    koordinatları tek çağrıda dönüştürülür ve piksel indislerine çevrilir,
+    böylece bellek kullanımı satır başına nesne oluşturmadan parça
+    boyutuyla sınırlı kalır. Atlanan satırlar neden bazında sayılarak
+    log fonksiyonuna bildirilir.
+    """
+    rejected = RejectedRows()
+    parts = []
+    try:
+        with open(csv_path, 'r', encoding='utf-8-sig', newline='') as f:
+            file_size = max(os.fstat(f.fileno()).st_size, 1)
+            read_chars = [0]
+            
+            def counted_lines():
+                for line in f:
+                    read_chars[0] += len(line)
+                    yield line
+            
+            reader = csv.reader(counted_lines())
+            header = next(reader, None)
+            if header is None:
+                raise ValueError("CSV dosyası boş / CSV file is empty")
+            columns = csv_column_indices(header)
+            
+            # Koordinatlar WGS 84; gerekirse katman CRS'ine dönüştürülür
+            transform = _points_transform(QgsCoordinateReferenceSystem("EPSG:4326"), reference_layer,
+                                          transform_context)
+            
+            rows = ((reader.line_num, fields) for fields in reader)
+            for chunk in parse_point_chunks(rows, columns, rejected):
+                parts.append(_locate_points(chunk, transform, reference_layer, rejected))
+                if progress_callback is not None:
+                    progress_callback(min(read_chars[0] / file_size, 1.0))
+    
+    except (OSError, UnicodeDecodeError, csv.Error) as e:
+        raise ValueError(f"CSV dosyası yüklenirken hata / Error loading CSV: {str(e)}")
+    
+    if log is not None:
+        log(rejected.summary())
+    
+    # CSV'den gelen referans değerleri tabloda saklanır
+    return _points_table(parts)
+
+
+class PointLayerSource:
+    """Arka plan iş parçacıklarında okunabilecek referans nokta katmanı
+    
+    source, getFeatures(QgsFeatureRequest) sunan bir nesne olmalıdır:
+    ana iş parçacığında oluşturulan QgsVectorLayerFeatureSource veya
+    Processing'in QgsProcessingFeatureSource'u. Alan adları burada
+    indislere çevrilir; id_field boşsa nesne kimliği kullanılır.
+    """
+    def __init__(self, source, fields, crs, name, value_field, id_field=None, feature_count=-1):
+        self.source = source
+        self.crs = crs
+        self.name = name
+        self.feature_count = feature_count
+        if not value_field:
+            raise ValueError("Referans değer alanı seçilmedi / No reference value field selected")
+        self.value_index = fields.lookupField(value_field)
+        if self.value_index < 0:
+            raise ValueError(f"Referans değer alanı bulunamadı / Reference value field not found: {value_field}")
+        self.id_index = fields.lookupField(id_field) if id_field else -1
+        if id_field and self.id_index < 0:
+            raise ValueError(f"Kimlik alanı bulunamadı / Id field not found: {id_field}")
+    
+    @classmethod
+    def from_layer(cls, layer, value_field, id_field=None):
+        """Vektör katmanından (ana iş parçacığında) anlık görüntü oluştur"""
+        if layer.geometryType() != QgsWkbTypes.PointGeometry:
+            raise ValueError(f"{layer.name()}: nokta katmanı değil / not a point layer")
+        return cls(QgsVectorLayerFeatureSource(layer), layer.fields(), layer.crs(), layer.name(),
+                   value_field, id_field, layer.featureCount())
+
+
+def load_points_from_layer(point_source, reference_layer, transform_context=None, log=None,
+                           progress_callback=None):
+    """Nokta katmanından (GeoPackage, FlatGeobuf, Shapefile vb.) noktaları SampleTable olarak yükle
+    
+    Raster kapsamı katman CRS'ine dönüştürülüp sağlayıcıya sınır kutusu
+    süzgeci olarak verilir; mekânsal indeksi olan kaynaklarda yalnızca
+    raster kapsamındaki nesneler okunur ve dönüştürülür. Yalnızca kimlik
+    ve referans değer alanları istenir. Nesneler CSV ile aynı parça
+    ayrıştırıcısından geçer; atlananlar nesne kimliğiyle bildirilir.
+    """
+    rejected = RejectedRows(label=FEATURE_LABEL)
+    transform = _points_transform(point_source.crs, reference_layer, transform_context)
+    
+    request = QgsFeatureRequest()
+    attributes = [index for index in (point_source.id_index, point_source.value_index) if index >= 0]
+    request.setSubsetOfAttributes(attributes)
+    filter_rect = _layer_filter_rect(reference_layer, point_source.crs, transform_context)
+    if filter_rect is not None:
+        request.setFilterRect(filter_rect)
+    elif log is not None:
+        log("   ⚠ Raster kapsamı nokta CRS'ine dönüştürülemedi, tüm nesneler okunuyor / "
+            "Raster extent could not be transformed to the point CRS, reading all features\n")
+    
+    read = [0]
+    
+    def feature_rows():
+        invalid = []
+        for feature in point_source.source.getFeatures(request):
+            read[0] += 1
+            point = _feature_point(feature.geometry())
+            if point is None:
+                invalid.append(feature.id())
+                continue
+            feature_id = None if point_source.id_index < 0 else feature.attribute(point_source.id_index)
+            if feature_id is None or feature_id == NULL:
+                feature_id = feature.id()
+            value = feature.attribute(point_source.value_index)
+            if value is None or value == NULL:
+                value = ''
+            yield feature.id(), [str(feature_id), point.x(), point.y(), value]
+        rejected.add('invalid_geometry', invalid)
+    
+    parts = []
+    for chunk in parse_point_chunks(feature_rows(), (0, 1, 2, 3), rejected):
+        parts.append(_locate_points(chunk, transform, reference_layer, rejected))
+        if progress_callback is not None and point_source.feature_count > 0:
+            progress_callback(min(read[0] / point_source.feature_count, 1.0))
+    # Süzgeç nedeniyle okunan nesne sayısı toplamdan az olabilir
+    if progress_callback is not None:
+        progress_callback(1.0)
+    
+    if log is not None:
+        log(f"   {read[0]} nesne okundu / features read\n" + rejected.summary())
+    return _points_table(parts)
+
+
+def _points_transform(points_crs, reference_layer, transform_context):
+    """Nokta CRS'inden raster CRS'ine dönüşüm; CRS'ler aynıysa None"""
+    layer_crs = reference_layer.crs()
+    if points_crs.authid() == layer_crs.authid():
+        return None
+    return QgsCoordinateTransform(points_crs, layer_crs, transform_context or QgsProject.instance())
+
+
+def _layer_filter_rect(reference_layer, points_crs, transform_context):
+    """Raster kapsamını nokta CRS'inde döndür; dönüştürülemezse None"""
+    extent = reference_layer.extent()
+    if points_crs.authid() == reference_layer.crs().authid():
+        return extent
+    try:
+        transform = QgsCoordinateTransform(reference_layer.crs(), points_crs,
+                                           transform_context or QgsProject.instance())
+        return transform.transformBoundingBox(extent)
+    except QgsCsException:
+        return None
+
+
+def _feature_point(geometry):
+    """Nesne geometrisinin noktası; boş veya çok parçalı ise None"""
+    if geometry is None or geometry.isNull() or geometry.isEmpty():
+        return None
+    if geometry.isMultipart():
+        points = geometry.asMultiPoint()
+        return points[0] if len(points) == 1 else None
+    return geometry.asPoint()
+
+
+def _locate_points(chunk, transform, reference_layer, rejected):
+    """Ayrıştırılmış parçayı raster CRS'ine dönüştür ve piksel indislerine çevir
+    
+    Dönüştürülemeyen ve raster dışında kalan noktalar rejected'a kaydedilir.
+    """
+    line_numbers, ids, xs, ys, refs = chunk
+    if transform is not None:
+        xs, ys, transformed = transform_coordinates(transform, xs, ys)
+        rejected.add('transform_failed', line_numbers[~transformed])
+    else:
+        transformed = np.ones(len(xs), dtype=bool)
+    
+    # Piksel koordinatlarına dönüştür ve sınırlar dışındakileri ele
+    pixel_rows, pixel_cols, inside = coords_to_pixels(reference_layer, xs, ys)
+    rejected.add('outside_raster', line_numbers[transformed & ~inside])
+    keep = transformed & inside
+    return xs[keep], ys[keep], pixel_rows[keep], pixel_cols[keep], ids[keep], refs[keep]
+
+
+def _points_table(parts):
+    """_locate_points parçalarını referans değerli tek SampleTable'da birleştir"""
+    if not parts:
+        return SampleTable([], [], ids=np.empty(0, dtype=str))
+    coords_x, coords_y, pixel_rows, pixel_cols, ids, refs = (np.concatenate(column) for column in zip(*parts))
+    return SampleTable(coords_x, coords_y, pixel_rows, pixel_cols, ids=ids, reference_values=refs)
+
+
+def generate_sampling_points(reference_layer, classified_layer, n_points, method,
+                             allocation='proportional', min_per_class=0, reservoir=False,
+                             seed=None, progress_callback=None):
+    """Örnekleme noktalarını SampleTable olarak oluştur"""
+    if method == 'random':
+        # Her iki raster'da da geçerli piksellerden tam n_points nokta
+        pixel_y, pixel_x = random_sample(reference_layer, classified_layer, n_points, seed=seed,
+                                         progress_callback=progress_callback)
+        x, y = pixels_to_coords(reference_layer, pixel_y, pixel_x)
+    
+    elif method == 'systematic':
+        # Grid tabanlı sistematik örnekleme
+        grid_size = int(np.sqrt(n_points))
+        x_step = reference_layer.width() / grid_size
+        y_step = reference_layer.height() / grid_size
+        
+        grid_i, grid_j = np.meshgrid(np.arange(grid_size), np.arange(grid_size), indexing='ij')
+        pixel_x = (grid_i.ravel() * x_step + x_step / 2).astype(np.int64)[:n_points]
+        pixel_y = (grid_j.ravel() * y_step + y_step / 2).astype(np.int64)[:n_points]
+        
+        inside = (pixel_x < reference_layer.width()) & (pixel_y < reference_layer.height())
+        pixel_x, pixel_y = pixel_x[inside], pixel_y[inside]
+        x, y = pixels_to_coords(reference_layer, pixel_y, pixel_x)
+    
+    elif method == 'stratified':
+        # Referans sınıflarına göre katmanlı örnekleme - tam n_points nokta
+        sampler = reservoir_stratified_sample if reservoir else stratified_sample
+        pixel_y, pixel_x = sampler(reference_layer, classified_layer, n_points, allocation,
+                                   min_per_class, seed=seed, progress_callback=progress_callback)
+        x, y = pixels_to_coords(reference_layer, pixel_y, pixel_x)
+    else:
+        return SampleTable([], [])
+    
+    return SampleTable(x, y, pixel_y, pixel_x)
+
+
+def thin_samples(samples, classified_layer, dedupe=False, min_distance=0.0, log=None):
+    """Aynı pikseldeki ve birbirine min_distance'tan yakın noktaları ele
+    
+    dedupe True ise sınıflandırılmış haritanın her pikselinde sıradaki ilk
+    nokta tutulur. min_distance (harita birimi) sıfırdan büyükse tutulan
+    noktalar arası uzaklık en az bu değer olacak şekilde seyreltilir.
+    Çıkarılan nokta sayıları log fonksiyonuna bildirilir.
+    """
+    if dedupe and len(samples):
+        rows, cols, inside = coords_to_pixels(classified_layer, samples.coord_x, samples.coord_y)
+        rows[~inside] = -1
+        keep = unique_pixel_mask(rows, cols, classified_layer.width())
+        if log is not None:
+            log(f"   {np.count_nonzero(~keep)} nokta aynı pikselde olduğu için çıkarıldı / "
+                f"points removed as pixel duplicates\n")
+        samples = samples.subset(keep)
+    
+    if min_distance > 0 and len(samples):
+        keep = thin_points(samples.coord_x, samples.coord_y, min_distance)
+        if log is not None:
+            log(f"   {np.count_nonzero(~keep)} nokta {min_distance:g} birimden yakın olduğu için çıkarıldı / "
+                f"points closer than {min_distance:g} map units removed\n")
+        samples = samples.subset(keep)
+    return samples
+
+
+def uses_point_reference(params):
+    """Referans değerleri CSV'den veya nokta katmanından mı geliyor"""
+    return bool(params['csv_path']) or params.get('point_layer') is not None
+
+
+def reference_name(params):
+    """Raporda gösterilecek referans kaynağının adı"""
+    if params.get('point_layer') is not None:
+        return params['point_layer'].name
+    if params['csv_path']:
+        return 'CSV Data'
+    return params['reference'].name()
+
+
+def prepare_validation(task, params):
+    """Örnekleme, nokta değerleri ve benzersiz sınıf taraması (arka plan iş parçacığı)"""
+    reference_layer = params['reference']
+    classified_layer = params['classified']
+    classified_layers = [classified_layer] + params['batch']
+    exhaustive = params['exhaustive']
+    
+    # Bellek izleme ölçülen süreleri bozduğundan yalnızca açıkça istenirse yapılır
+    # Raster okuma sayacı çalıştırmaya özeldir (RasterSource'lara verilen sayaç)
+    profiler = StageProfiler(counters={'raster_read': params.get('raster_reads', TimeCounter())}, log=task.debug,
+                             trace_memory=params.get('trace_memory', False))
+    
+    with profiler.stage('sampling'):
+        # Örnekleme noktalarını oluştur veya CSV'den / nokta katmanından yükle
+        is_csv = uses_point_reference(params)
+        samples = None
+        
+        if params.get('point_layer') is not None:
+            point_layer = params['point_layer']
+            task.log(f"📍 Nokta katmanından noktalar yükleniyor: {point_layer.name}\n"
+                     f"📍 Loading points from point layer...\n")
+            
+            # Yalnızca sınıflandırılmış haritanın kapsamındaki nesneler okunur
+            samples = load_points_from_layer(
+                point_layer, classified_layer, params['transform_context'], task.log,
+                task.stage_callback(0, 10))
+            
+            if not len(samples):
+                raise ValueError("Nokta katmanından raster kapsamında nokta yüklenemedi!\n"
+                                 "Could not load points within the raster extent from the point layer!")
+            
+            task.log(f"✓ {len(samples)} nokta katmandan yüklendi\n"
+                     f"✓ {len(samples)} points loaded from layer\n")
+        elif is_csv:
+            task.log("📍 CSV'den noktalar yükleniyor...\n📍 Loading points from CSV...\n")
+            
+            # CSV yükleme için classified layer kullan
+            samples = load_points_from_csv(
+                params['csv_path'], classified_layer, params['transform_context'], task.log,
+                task.stage_callback(0, 10))
+            
+            if not len(samples):
+                raise ValueError("CSV'den nokta yüklenemedi!\n"
+                                 "Could not load points from CSV!")
+            
+            task.log(f"✓ {len(samples)} nokta CSV'den yüklendi\n"
+                     f"✓ {len(samples)} points loaded from CSV\n")
+        elif exhaustive:
+            # Örnekleme yok - tüm pikseller karşılaştırılacak
+            task.log(f"📍 Tüm pikseller karşılaştırılacak "
+                     f"({reference_layer.width()}x{reference_layer.height()})\n"
+                     f"📍 All pixels will be compared\n")
+        else:
+            # Raster'dan örnekleme yap
+            task.log("📍 Örnekleme noktaları oluşturuluyor...\n📍 Generating sampling points...\n")
+            
+            samples = generate_sampling_points(
+                reference_layer, classified_layer, params['n_points'], params['method'],
+                params['allocation'], params['min_per_class'], params['reservoir'], params['seed'],
+                task.stage_callback(0, 10))
+            
+            if not len(samples):
+                raise ValueError("Örnekleme noktaları oluşturulamadı!\n"
+                                 "Could not generate sampling points!")
+            
+            task.log(f"✓ {len(samples)} nokta oluşturuldu\n"
+                     f"✓ {len(samples)} points generated\n")
+        
+        # Aynı piksele düşen ve birbirine çok yakın noktalar bilgi eklemez
+        dedupe, min_distance = params.get('dedupe', False), params.get('min_distance', 0.0)
+        if samples is not None and (dedupe or min_distance > 0):
+            samples = thin_samples(samples, classified_layer, dedupe, min_distance, task.log)
+            task.log(f"✓ Seyreltme sonrası {len(samples)} nokta\n"
+                     f"✓ {len(samples)} points after thinning\n")
+    task.check_canceled()
+    task.setProgress(10)
+    
+    with profiler.stage('extraction'):
+        # Noktalardaki değerleri al - yalnızca noktaların düştüğü bloklar okunur
+        bands = params['bands']
+        band_values = band_valid = None
+        if not exhaustive:
+            task.log("\n📊 Nokta değerleri okunuyor...\n📊 Reading values at points...\n")
+            
+            # Koordinatları kullanarak her raster için ayrı piksel konumu hesapla
+            pixels = [coords_to_pixels(layer, samples.coord_x, samples.coord_y) for layer in classified_layers]
+            inside = np.logical_and.reduce([layer_inside for _, _, layer_inside in pixels])
+            if not is_csv:
+                ref_rows, ref_cols, ref_inside = coords_to_pixels(reference_layer, samples.coord_x, samples.coord_y)
+                inside &= ref_inside
+                ref_rows, ref_cols = ref_rows[inside], ref_cols[inside]
+            
+            # Tüm rasterlarda sınırlar içinde olanlar
+            samples = samples.subset(inside)
+            
+            if is_csv:
+                ref_valid = valid_mask(samples.reference_values)
+                class_start = 10
+                task.log("✓ CSV referans değerleri kullanıldı\n"
+                         "✓ Using CSV reference values\n")
+            else:
+                # Referans değerleri toplu karşılaştırmada da bir kez okunur
+                ref_samples, ref_valid = sample_pixels(reference_layer, ref_rows, ref_cols,
+                                                       progress_callback=task.stage_callback(10, 20))
+                samples.reference_values = ref_samples.astype(np.float64)
+                class_start = 20
+            
+            # Her haritanın seçili tüm bantları her blok için tek geçişte okunur;
+            # sütunlar harita x bant sırasında
+            step = (30 - class_start) / len(classified_layers)
+            layer_values, layer_valid = [], []
+            for layer_no, (layer, (class_rows, class_cols, _)) in enumerate(zip(classified_layers, pixels)):
+                values, valid = sample_pixel_bands(
+                    layer, class_rows[inside], class_cols[inside], bands,
+                    progress_callback=task.stage_callback(class_start + layer_no * step,
+                                                          class_start + (layer_no + 1) * step))
+                layer_values.append(values.astype(np.float64))
+                layer_valid.append(valid)
+                task.check_canceled()
+            band_values, band_valid = np.hstack(layer_values), np.hstack(layer_valid)
+            samples.classified_values = band_values[:, 0]
+            
+            # Katmanların NoData ayarlarına göre geçersiz noktaları at; en az bir harita/bantta
+            # geçerli olan noktalar tutulur, harita/bant bazında ayrıca süzülür
+            keep = ref_valid & band_valid.any(axis=1)
+            samples = samples.subset(keep)
+            band_values, band_valid = band_values[keep], band_valid[keep]
+            
+            if len(samples) == 0:
+                raise ValueError("Geçerli örnekleme noktası bulunamadı!\n"
+                                 "No valid sampling points found!\n"
+                                 "Raster haritalarının extent ve CRS değerlerini kontrol edin.")
+            
+            task.log(f"✓ {len(samples)} geçerli nokta kullanılıyor\n"
+                     f"✓ Using {len(samples)} valid points\n")
+    task.setProgress(30)
+    
+    with profiler.stage('unique_scan'):
+        # Sınıf eşleştirme için TÜM raster'dan benzersiz değerleri al
+        task.log("\n🔍 Tüm sınıf değerleri okunuyor...\n🔍 Reading all class values...\n")
+        
+        # CSV kullanılıyorsa, sadece CSV'deki ve classified'daki değerleri kullan
+        if is_csv:
+            # CSV'den benzersiz referans değerleri
+            values, counts = np.unique(samples.reference_values, return_counts=True)
+            ref_value_counts = dict(zip(values.tolist(), counts.tolist()))
+            class_start = 30
+        else:
+            # Referans haritasından tüm benzersiz değerleri karo karo al
+            ref_value_counts = unique_value_counts(reference_layer, progress_callback=task.stage_callback(30, 45))
+            class_start = 45
+        
+        # Sınıflandırılmış haritalardan tüm benzersiz değerleri karo karo al;
+        # tek eşleştirme hepsine uygulanır
+        class_value_counts = {}
+        step = (60 - class_start) / len(classified_layers)
+        for layer_no, layer in enumerate(classified_layers):
+            layer_counts = unique_value_counts(
+                layer, band=bands, progress_callback=task.stage_callback(class_start + layer_no * step,
+                                                                         class_start + (layer_no + 1) * step))
+            for value, count in layer_counts.items():
+                class_value_counts[value] = class_value_counts.get(value, 0) + count
+            task.check_canceled()
+        
+        task.log(f"✓ Referans: {len(ref_value_counts)} benzersiz sınıf\n"
+                 f"✓ Reference: {len(ref_value_counts)} unique classes\n"
+                 f"✓ Sınıflandırılmış: {len(class_value_counts)} benzersiz sınıf\n"
+                 f"✓ Classified: {len(class_value_counts)} unique classes\n")
+    
+    return {
+        'params': params,
+        'samples': samples,
+        'band_values': band_values,
+        'band_valid': band_valid,
+        'ref_value_counts': ref_value_counts,
+        'class_value_counts': class_value_counts,
+        'profiler': profiler,
+    }
+
+
+def compute_validation(task, state, mappings):
+    """Kategorileri uygula ve metrikleri hesapla (arka plan iş parçacığı)"""
+    params = state['params']
+    reference_layer = params['reference']
+    classified_layer = params['classified']
+    exhaustive = params['exhaustive']
+    bands = params['bands']
+    classified_layers = [classified_layer] + params['batch']
+    samples = state['samples']
+    reference_mapping, classified_mapping, class_names = mappings
+    
+    profiler = state['profiler']
+    with profiler.stage('metrics'):
+        # ÖNEMLİ DÜZELTME: Kategorileri dönüştür ve TÜM sınıfları dahil et
+        task.setProgress(60)
+        task.log("\n🔢 Sınıf kategorileri uygulanıyor...\n🔢 Applying class categories...\n")
+        
+        # Tüm benzersiz kategorileri topla (hem referans hem sınıflandırılmış)
+        all_categories = sorted(set(list(reference_mapping.values()) + list(classified_mapping.values())))
+        
+        # Karmaşıklık matrisi için sınıf etiketlerini hazırla
+        sorted_categories = sorted(all_categories)
+        category_labels = [class_names.get(cat, f"Kategori_{cat}") for cat in sorted_categories]
+        
+        category_lines = "".join(f"  - Kategori {cat}: {class_names.get(cat, f'Kategori_{cat}')}\n"
+                                 for cat in sorted_categories)
+        task.log(f"✓ Toplam {len(all_categories)} kategori tanımlandı\n"
+                 f"✓ Total {len(all_categories)} categories defined\n" + category_lines)
+        task.check_canceled()
+        
+        # Metrikleri hesapla
+        task.setProgress(65)
+        task.log("\n📈 Metrikler hesaplanıyor...\n📈 Calculating metrics...\n")
+        
+        # Değerlendirmeler harita x bant sırasındadır (örnek değer sütunlarıyla aynı)
+        assessments = [(layer.name(), band) for layer in classified_layers for band in bands]
+        band_results = []
+        if exhaustive:
+            # Tüm pikselleri karo karo karşılaştır - referans bir kez, haritalar ve bantlar tek geçişte
+            task.log("🧮 Tüm pikseller karşılaştırılıyor...\n🧮 Comparing all pixels...\n")
+            
+            matrices = [result for layer_results in exhaustive_batch_matrices(
+                reference_layer, classified_layers, reference_mapping, classified_mapping,
+                sorted_categories, bands, workers=params['workers'],
+                progress_callback=task.stage_callback(65, 90)) for result in layer_results]
+            
+            if all(cm.sum() == 0 for cm, _ in matrices):
+                raise ValueError("Geçerli piksel bulunamadı!\n"
+                                 "No valid pixels found!")
+            
+            for (map_name, band), (cm, raw_sums) in zip(assessments, matrices):
+                band_results.append(band_metrics(map_name, band, cm, raw_sums, int(cm.sum()),
+                                                 category_labels, sorted_categories))
+        else:
+            # Değerleri tek vektörel çağrıyla kategorilere dönüştür - eşleşmeyenler UNMAPPED;
+            # referans kategorileri tüm haritalar için bir kez hesaplanır
+            reference_categories = CompiledMapping(reference_mapping)(samples.reference_values)
+            classified_compiled = CompiledMapping(classified_mapping)
+            
+            for column, (map_name, band) in enumerate(assessments):
+                # Bu harita/bantta geçerli olan noktalar
+                band_valid = state['band_valid'][:, column]
+                table = samples.subset(band_valid)
+                table.classified_values = state['band_values'][band_valid, column]
+                table.set_categories(reference_categories[band_valid], classified_compiled(table.classified_values))
+                if column == 0:
+                    state['samples'] = table
+                
+                # DÜZELTME: tüm kategoriler matrise dahil edilir
+                cm = confusion_matrix_from_labels(table.reference_categories, table.classified_categories,
+                                                  sorted_categories)
+                raw_sums = regression_sums(table.reference_values, table.classified_values)
+                band_results.append(band_metrics(map_name, band, cm, raw_sums, int(np.count_nonzero(table.mapped())),
+                                                 category_labels, sorted_categories))
+                task.setProgress(65 + 25 * (column + 1) / len(assessments))
+                task.check_canceled()
+        task.setProgress(99)
+    
+    # Sonuçları kaydet - üst düzey anahtarlar ana haritanın ilk bandına aittir
+    results = assemble_results(band_results, reference_name(params), params['method'], bands,
+                               [layer.name() for layer in classified_layers])
+    results['performance'] = profiler.as_dict()
+    return results
+
+
+def point_fields(samples=None):
+    """Doğrulama noktası katmanının alanları
+    
+    Örnek tablosunda nokta kimlikleri (CSV / nokta katmanı) varsa point_id
+    metin alanıdır ve kimlikleri taşır; yoksa sıra numarasıdır.
+    """
+    fields = QgsFields()
+    has_ids = samples is not None and samples.ids is not None
+    fields.append(QgsField("point_id", QVariant.String if has_ids else QVariant.Int))
+    fields.append(QgsField("ref_value", QVariant.Double))
+    fields.append(QgsField("class_value", QVariant.Double))
+    fields.append(QgsField("ref_cat", QVariant.Int))
+    fields.append(QgsField("class_cat", QVariant.Int))
+    fields.append(QgsField("match", QVariant.String))
+    return fields
+
+
+def point_features(samples, fields):
+    """Örnek tablosundan doğrulama noktası nesneleri üret - değerler ve kategoriler tablodan okunur
+    
+    point_id, tablodaki nokta kimliğidir; kimlik yoksa 1'den başlayan sıra numarası.
+    """
+    if samples.ids is not None:
+        point_ids = [str(point_id) for point_id in samples.ids.tolist()]
+    else:
+        point_ids = range(1, len(samples) + 1)
+    for point_id, x, y, ref_val, class_val, ref_cat, class_cat, match in zip(
+            point_ids, samples.coord_x.tolist(), samples.coord_y.tolist(),
+            samples.reference_values.tolist(), samples.classified_values.tolist(),
+            samples.reference_categories.tolist(), samples.classified_categories.tolist(),
+            samples.match.tolist()):
+        feature = QgsFeature(fields)
+        feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(x, y)))
+        feature.setAttributes([point_id, ref_val, class_val, ref_cat, class_cat, "Yes" if match else "No"])
+        yield feature
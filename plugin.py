@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+Raster Accuracy Assessment - QGIS eklenti sınıfı
+QGIS açılışında yalnızca menü eylemini kaydeder; NumPy ve analiz modülleri ilk çalıştırmada yüklenir
+"""
+
+import time
+
+from qgis.PyQt.QtWidgets import QAction
+from qgis.core import Qgis, QgsApplication, QgsMessageLog
+
+
+# QGIS mesaj günlüğü sekmesi
+LOG_TAG = "Accuracy Assessment"
+
+
+class AccuracyAssessmentPlugin:
+    """QGIS Plugin Sınıfı"""
+    def __init__(self, iface, load_started=None):
+        self.iface = iface
+        self.dialog = None
+        self.action = None
+        self.provider = None
+        # Paketin içe aktarılmaya başladığı an (açılış süresi ölçümü için)
+        self.load_started = load_started
+    
+    def initProcessing(self):
+        """Processing sağlayıcısını kaydet (qgis_process tarafından da çağrılır)"""
+        from .processing_provider import AccuracyAssessmentProvider
+        self.provider = AccuracyAssessmentProvider()
+        QgsApplication.processingRegistry().addProvider(self.provider)
+    
+    def initGui(self):
+        """Plugin GUI'sini başlat - eylemi ve Processing sağlayıcısını kaydeder"""
+        self.initProcessing()
+        
+        self.action = QAction("Raster Doğrulama Analizi", self.iface.mainWindow())
+        self.action.setToolTip("Raster Accuracy Assessment / Doğrulama Analizi")
+        self.action.triggered.connect(self.run)
+        self.iface.addPluginToMenu("&Accuracy Assessment", self.action)
+        self.iface.addToolBarIcon(self.action)
+        
+        # QGIS açılışına eklenen süre: paket içe aktarma + classFactory + initGui
+        if self.load_started is not None:
+            elapsed_ms = (time.perf_counter() - self.load_started) * 1000
+            QgsMessageLog.logMessage(
+                f"Açılış süresi / Startup time: {elapsed_ms:.1f} ms", LOG_TAG, Qgis.Info)
+    
+    def unload(self):
+        """Plugin'i kaldır"""
+        self.iface.removePluginMenu("&Accuracy Assessment", self.action)
+        self.iface.removeToolBarIcon(self.action)
+        if self.provider is not None:
+            QgsApplication.processingRegistry().removeProvider(self.provider)
+            self.provider = None
+    
+    def run(self):
+        """Plugin'i çalıştır"""
+        if self.dialog is None:
+            # Ağır bağımlılıklar (NumPy, analiz modülleri) ilk kullanımda yüklenir
+            import_started = time.perf_counter()
+            from .accuracy_assessment import AccuracyAssessmentDialog
+            self.dialog = AccuracyAssessmentDialog()
+            elapsed_ms = (time.perf_counter() - import_started) * 1000
+            QgsMessageLog.logMessage(
+                f"İlk çalıştırma yükleme süresi / First-run load time: {elapsed_ms:.1f} ms", LOG_TAG, Qgis.Info)
+        
+        # Harita listesini güncelle
+        self.dialog.load_raster_layers(self.dialog.reference_combo)
+        self.dialog.load_raster_layers(self.dialog.classified_combo)
+        self.dialog.load_batch_layers()
+        self.dialog.load_point_layers()
+        
+        self.dialog.show()
+        self.dialog.raise_()
+        self.dialog.activateWindow()
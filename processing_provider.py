@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+"""
+Processing sağlayıcısı
+Doğruluk değerlendirmesini iletişim kutusu olmadan qgis_process, model tasarımcısı ve toplu işlerden çalıştırır
+"""
+
+import json
+
+from qgis.core import (QgsFeatureSink, QgsProcessing, QgsProcessingAlgorithm, QgsProcessingException,
+                       QgsProcessingOutputNumber, QgsProcessingParameterBoolean, QgsProcessingParameterEnum,
+                       QgsProcessingParameterFeatureSink, QgsProcessingParameterFeatureSource,
+                       QgsProcessingParameterField, QgsProcessingParameterFile,
+                       QgsProcessingParameterFileDestination, QgsProcessingParameterMultipleLayers,
+                       QgsProcessingParameterNumber, QgsProcessingParameterRasterLayer,
+                       QgsProcessingParameterString, QgsProcessingProvider, QgsWkbTypes)
+
+
+# Örnekleme yöntemleri (Processing seçenek sırası)
+METHODS = ('random', 'stratified', 'systematic', 'exhaustive')
+# Katmanlı örnekleme dağıtım yöntemleri (iletişim kutusuyla aynı sıra)
+ALLOCATION_OPTIONS = ('proportional', 'equal', 'neyman')
+
+
+class AccuracyAssessmentAlgorithm(QgsProcessingAlgorithm):
+    """Raster doğruluk değerlendirmesi - iletişim kutusuyla aynı doğrulama hattı"""
+    REFERENCE = 'REFERENCE'
+    CLASSIFIED = 'CLASSIFIED'
+    BATCH = 'BATCH'
+    BANDS = 'BANDS'
+    METHOD = 'METHOD'
+    N_POINTS = 'N_POINTS'
+    ALLOCATION = 'ALLOCATION'
+    MIN_PER_CLASS = 'MIN_PER_CLASS'
+    RESERVOIR = 'RESERVOIR'
+    DEDUPE = 'DEDUPE'
+    MIN_DISTANCE = 'MIN_DISTANCE'
+    SEED = 'SEED'
+    WORKERS = 'WORKERS'
+    CSV = 'CSV'
+    POINTS = 'POINTS'
+    POINTS_VALUE_FIELD = 'POINTS_VALUE_FIELD'
+    POINTS_ID_FIELD = 'POINTS_ID_FIELD'
+    MAPPING = 'MAPPING'
+    OUTPUT_JSON = 'OUTPUT_JSON'
+    OUTPUT_HTML = 'OUTPUT_HTML'
+    OUTPUT_POINTS = 'OUTPUT_POINTS'
+    
+    def name(self):
+        return 'rasteraccuracy'
+    
+    def displayName(self):
+        return 'Raster doğruluk değerlendirmesi / Raster accuracy assessment'
+    
+    def shortHelpString(self):
+        return ("Sınıflandırılmış raster(lar)ı referans raster, CSV noktaları veya nokta katmanıyla "
+                "(GeoPackage, FlatGeobuf vb.) karşılaştırır; nokta katmanından yalnızca raster kapsamındaki "
+                "nesneler okunur; "
+                "sonuçlar JSON/HTML rapor ve nokta katmanı olarak yazılır.\n\n"
+                "Eşleştirme dosyası (JSON): {\"reference\": {\"<değer>\": <kategori>}, "
+                "\"classified\": {\"<değer>\": <kategori>}, \"class_names\": {\"<kategori>\": \"<ad>\"}}. "
+                "Verilmezse aynı değerler aynı kategoriye atanır.\n\n"
+                "Compares classified raster(s) with a reference raster, CSV points or a point layer "
+                "(GeoPackage, FlatGeobuf, ...); only point features within the raster extent are read; "
+                "results are written "
+                "as JSON/HTML reports and a point layer. Without a mapping file identical values share a category.")
+    
+    def createInstance(self):
+        return AccuracyAssessmentAlgorithm()
+    
+    def initAlgorithm(self, config=None):
+        self.addParameter(QgsProcessingParameterRasterLayer(
+            self.REFERENCE, 'Referans harita / Reference map', optional=True))
+        self.addParameter(QgsProcessingParameterRasterLayer(
+            self.CLASSIFIED, 'Sınıflandırılmış harita / Classified map'))
+        self.addParameter(QgsProcessingParameterMultipleLayers(
+            self.BATCH, 'Toplu karşılaştırma haritaları / Batch maps', QgsProcessing.TypeRaster, optional=True))
+        self.addParameter(QgsProcessingParameterString(
+            self.BANDS, 'Bantlar / Bands (ör. 1,3,5-10)', defaultValue='1'))
+        self.addParameter(QgsProcessingParameterEnum(
+            self.METHOD, 'Örnekleme metodu / Sampling method', options=list(METHODS), defaultValue=0))
+        self.addParameter(QgsProcessingParameterNumber(
+            self.N_POINTS, 'Nokta sayısı / Number of points', QgsProcessingParameterNumber.Integer,
+            defaultValue=500, minValue=1))
+        self.addParameter(QgsProcessingParameterEnum(
+            self.ALLOCATION, 'Dağıtım / Allocation', options=list(ALLOCATION_OPTIONS), defaultValue=0))
+        self.addParameter(QgsProcessingParameterNumber(
+            self.MIN_PER_CLASS, 'Sınıf başına en az örnek / Minimum per class',
+            QgsProcessingParameterNumber.Integer, defaultValue=0, minValue=0))
+        self.addParameter(QgsProcessingParameterBoolean(
+            self.RESERVOIR, 'Tek geçiş / Single pass', defaultValue=False))
+        self.addParameter(QgsProcessingParameterBoolean(
+            self.DEDUPE, 'Piksel başına tek nokta / One point per pixel', defaultValue=False))
+        self.addParameter(QgsProcessingParameterNumber(
+            self.MIN_DISTANCE, 'Noktalar arası en az uzaklık (harita birimi, 0 = kapalı) / '
+            'Minimum point spacing (map units, 0 = off)', QgsProcessingParameterNumber.Double,
+            defaultValue=0.0, minValue=0.0))
+        self.addParameter(QgsProcessingParameterNumber(
+            self.SEED, 'Rastgele tohum / Random seed', QgsProcessingParameterNumber.Integer,
+            optional=True, minValue=0))
+        self.addParameter(QgsProcessingParameterNumber(
+            self.WORKERS, 'İş parçacığı / Workers', QgsProcessingParameterNumber.Integer,
+            defaultValue=1, minValue=1))
+        self.addParameter(QgsProcessingParameterFile(
+            self.CSV, 'Referans noktaları (CSV) / Reference points (CSV)', extension='csv', optional=True))
+        self.addParameter(QgsProcessingParameterFeatureSource(
+            self.POINTS, 'Referans nokta katmanı / Reference point layer', [QgsProcessing.TypeVectorPoint],
+            optional=True))
+        self.addParameter(QgsProcessingParameterField(
+            self.POINTS_VALUE_FIELD, 'Referans değer alanı / Reference value field',
+            parentLayerParameterName=self.POINTS, optional=True))
+        self.addParameter(QgsProcessingParameterField(
+            self.POINTS_ID_FIELD, 'Nokta kimlik alanı / Point id field', parentLayerParameterName=self.POINTS,
+            optional=True))
+        self.addParameter(QgsProcessingParameterFile(
+            self.MAPPING, 'Sınıf eşleştirme dosyası / Class mapping file', extension='json', optional=True))
+        self.addParameter(QgsProcessingParameterFileDestination(
+            self.OUTPUT_JSON, 'JSON rapor / JSON report', 'JSON File (*.json)'))
+        self.addParameter(QgsProcessingParameterFileDestination(
+            self.OUTPUT_HTML, 'HTML rapor / HTML report', 'HTML Report (*.html)', optional=True,
+            createByDefault=False))
+        self.addParameter(QgsProcessingParameterFeatureSink(
+            self.OUTPUT_POINTS, 'Doğrulama noktaları / Validation points', QgsProcessing.TypeVectorPoint,
+            optional=True, createByDefault=False))
+        self.addOutput(QgsProcessingOutputNumber('OVERALL_ACCURACY', 'Overall Accuracy'))
+        self.addOutput(QgsProcessingOutputNumber('KAPPA', "Cohen's Kappa"))
+        self.addOutput(QgsProcessingOutputNumber('N_VALID', 'Geçerli nokta / Valid points'))
+    
+    def processAlgorithm(self, parameters, context, feedback):
+        # Analiz modülleri (NumPy) yalnızca algoritma çalıştığında yüklenir
+        from .exhaustive import check_alignment
+        from .pipeline import (PointLayerSource, compute_validation, identical_mappings, load_mappings,
+                               point_features, point_fields, prepare_validation, trace_memory_enabled)
+        from .raster_io import RasterSource, parse_bands
+        from .core.profiler import TimeCounter
+        from .core.report import html_report
+        from .validation_task import FeedbackTask, TaskCanceled
+        
+        reference_layer = self.parameterAsRasterLayer(parameters, self.REFERENCE, context)
+        classified_layer = self.parameterAsRasterLayer(parameters, self.CLASSIFIED, context)
+        batch_layers = [layer for layer in self.parameterAsLayerList(parameters, self.BATCH, context)
+                        if layer.id() != classified_layer.id()]
+        csv_path = self.parameterAsFile(parameters, self.CSV, context) or None
+        point_source = self.parameterAsSource(parameters, self.POINTS, context)
+        method = METHODS[self.parameterAsEnum(parameters, self.METHOD, context)]
+        exhaustive = method == 'exhaustive'
+        
+        if csv_path is None and point_source is None and reference_layer is None:
+            raise QgsProcessingException("Referans harita, CSV veya nokta katmanı gerekli / "
+                                         "A reference map, CSV or point layer is required")
+        if csv_path is not None and point_source is not None:
+            raise QgsProcessingException("CSV ve nokta katmanı birlikte kullanılamaz / "
+                                         "CSV and point layer cannot be used together")
+        if (csv_path is not None or point_source is not None) and exhaustive:
+            raise QgsProcessingException("Tüm piksel modu CSV ile kullanılamaz / "
+                                         "All-pixels mode cannot be used with CSV points")
+        for layer in batch_layers:
+            if layer.crs() != classified_layer.crs():
+                raise QgsProcessingException(f"{layer.name()}: CRS sınıflandırılmış haritadan farklı / "
+                                             f"CRS differs from the classified map")
+        
+        try:
+            if exhaustive:
+                for layer in [classified_layer] + batch_layers:
+                    check_alignment(reference_layer, layer)
+            bands = parse_bands(self.parameterAsString(parameters, self.BANDS, context),
+                                min(layer.bandCount() for layer in [classified_layer] + batch_layers))
+            point_layer = None
+            if point_source is not None:
+                # Süzgeç ve alan seçimi QgsProcessingFeatureSource üzerinden sağlayıcıya iletilir
+                vector_layer = self.parameterAsVectorLayer(parameters, self.POINTS, context)
+                point_layer = PointLayerSource(
+                    point_source, point_source.fields(), point_source.sourceCrs(),
+                    vector_layer.name() if vector_layer is not None else self.POINTS,
+                    self.parameterAsString(parameters, self.POINTS_VALUE_FIELD, context),
+                    self.parameterAsString(parameters, self.POINTS_ID_FIELD, context),
+                    point_source.featureCount())
+        except ValueError as e:
+            raise QgsProcessingException(str(e))
+        
+        seed = parameters.get(self.SEED)
+        reads = TimeCounter()
+        params = {
+            'csv_path': csv_path,
+            'point_layer': point_layer,
+            'exhaustive': exhaustive,
+            'method': 'CSV File' if csv_path else 'Point Layer' if point_layer else method,
+            'n_points': self.parameterAsInt(parameters, self.N_POINTS, context),
+            'workers': self.parameterAsInt(parameters, self.WORKERS, context),
+            'bands': bands,
+            'allocation': ALLOCATION_OPTIONS[self.parameterAsEnum(parameters, self.ALLOCATION, context)],
+            'min_per_class': self.parameterAsInt(parameters, self.MIN_PER_CLASS, context),
+            'reservoir': self.parameterAsBoolean(parameters, self.RESERVOIR, context),
+            'dedupe': self.parameterAsBoolean(parameters, self.DEDUPE, context),
+            'min_distance': self.parameterAsDouble(parameters, self.MIN_DISTANCE, context),
+            'trace_memory': trace_memory_enabled(),
+            'seed': None if seed is None else self.parameterAsInt(parameters, self.SEED, context),
+            'reference': None if csv_path or point_layer else RasterSource(reference_layer, reads),
+            'classified': RasterSource(classified_layer, reads),
+            'batch': [RasterSource(layer, reads) for layer in batch_layers],
+            'raster_reads': reads,
+            'transform_context': context.transformContext(),
+        }
+        
+        task = FeedbackTask(feedback)
+        try:
+            state = prepare_validation(task, params)
+            
+            # Eşleştirme dosyası yoksa aynı değerler aynı kategoriye atanır
+            with state['profiler'].stage('mapping'):
+                mapping_path = self.parameterAsFile(parameters, self.MAPPING, context)
+                if mapping_path:
+                    mappings = load_mappings(mapping_path)
+                else:
+                    mappings = identical_mappings(list(state['ref_value_counts']),
+                                                  list(state['class_value_counts']))
+            
+            results = compute_validation(task, state, mappings)
+        except TaskCanceled:
+            return {}
+        except ValueError as e:
+            raise QgsProcessingException(str(e))
+        
+        outputs = {
+            'OVERALL_ACCURACY': results['overall_accuracy'],
+            'KAPPA': results['kappa'],
+            'N_VALID': results['n_points'],
+        }
+        
+        # HTML ve nokta katmanı önce yazılır; JSON rapor bunların süresini de içerir
+        profiler = state['profiler']
+        with profiler.stage('export'):
+            html_path = self.parameterAsFileOutput(parameters, self.OUTPUT_HTML, context)
+            if html_path:
+                with open(html_path, 'w', encoding='utf-8') as f:
+                    f.write(html_report(results))
+                outputs[self.OUTPUT_HTML] = html_path
+            
+            # Nokta katmanı ana haritanın ilk bandının örneklerinden yazılır
+            samples = state['samples']
+            if samples is not None:
+                fields = point_fields(samples)
+                sink, dest_id = self.parameterAsSink(parameters, self.OUTPUT_POINTS, context, fields,
+                                                     QgsWkbTypes.Point, classified_layer.crs())
+                if sink is not None:
+                    for feature in point_features(samples, fields):
+                        sink.addFeature(feature, QgsFeatureSink.FastInsert)
+                    outputs[self.OUTPUT_POINTS] = dest_id
+        results['performance'] = profiler.as_dict()
+        
+        json_path = self.parameterAsFileOutput(parameters, self.OUTPUT_JSON, context)
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        outputs[self.OUTPUT_JSON] = json_path
+        
+        return outputs
+
+
+class AccuracyAssessmentProvider(QgsProcessingProvider):
+    """Eklentinin Processing sağlayıcısı"""
+    def id(self):
+        return 'accuracyassessment'
+    
+    def name(self):
+        return 'Accuracy Assessment'
+    
+    def loadAlgorithms(self):
+        self.addAlgorithm(AccuracyAssessmentAlgorithm())
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+Raster önbelleği
+Çözülmüş raster bloklarını kaynak, bant, NoData ayarı, kapsam ve dosya değişiklik zamanına göre
+bellek sınırlı LRU önbellekte tutar; aynı harita çifti üzerindeki tekrar çalıştırmalar diski okumaz.
+Yalnızca nokta örneklemesinin okuduğu bloklar önbelleğe alınır; tam taramalar önbelleği atlar,
+ancak sonuçları (değer sayıları, karo başına geçerli piksel sayıları) önbellekte tutulur
+"""
+
+from collections import OrderedDict
+import os
+import threading
+
+from .core.extractor import NoDataSpec
+
+
+# Varsayılan bellek sınırı (bayt)
+DEFAULT_CACHE_BUDGET = 512 * 1024 * 1024
+
+
+def source_signature(provider):
+    """Sağlayıcının (kaynak, değişiklik zamanı) imzası; dosya değilse None
+    
+    Dosya tabanlı olmayan kaynaklar (WMS, bellek vb.) değişikliği
+    algılanamadığı için önbelleğe alınmaz.
+    """
+    uri = provider.dataSourceUri()
+    path = uri.split('|')[0]
+    try:
+        return uri, os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def source_key(provider, band):
+    """(kaynak, değişiklik zamanı, bant, NoData özeti) anahtarı; önbelleğe alınamıyorsa None
+    
+    Tam tarama sonuçları bu anahtarla saklanır; NoData ayarı değişirse
+    anahtar da değişir.
+    """
+    signature = source_signature(provider)
+    if signature is None:
+        return None
+    return signature + (band, NoDataSpec.from_provider(provider, band).fingerprint())
+
+
+def block_key(provider, band, extent, width, height):
+    """Bir blok okuması için önbellek anahtarı; önbelleğe alınamıyorsa None
+    
+    Geçerlilik maskesi de önbellekte tutulduğundan anahtar NoData özetini
+    içerir; kullanıcı NoData değerlerini değiştirince bloklar yeniden okunur.
+    """
+    key = source_key(provider, band)
+    if key is None:
+        return None
+    return key + (extent.xMinimum(), extent.yMinimum(), extent.xMaximum(), extent.yMaximum(), width, height)
+
+
+def entry_nbytes(entry):
+    """Bir NumPy dizisinin veya dizi demetinin bellek kullanımı"""
+    if isinstance(entry, tuple):
+        return sum(item.nbytes for item in entry)
+    return entry.nbytes
+
+
+class RasterCache:
+    """NumPy dizileri (veya dizi demetleri) için bellek sınırlı, iş parçacığı güvenli LRU önbellek"""
+    def __init__(self, budget=DEFAULT_CACHE_BUDGET):
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self.budget = budget
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key):
+        """Diziyi döndür ve en son kullanılan olarak işaretle; yoksa None"""
+        with self._lock:
+            array = self._items.get(key)
+            if array is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return array
+    
+    def put(self, key, array):
+        """Diziyi ekle; bellek sınırı aşılırsa en eski kullanılanları çıkar"""
+        size = entry_nbytes(array)
+        if size > self.budget:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.nbytes -= entry_nbytes(old)
+            self._items[key] = array
+            self.nbytes += size
+            self._evict()
+    
+    def set_budget(self, budget):
+        """Bellek sınırını değiştir"""
+        with self._lock:
+            self.budget = budget
+            self._evict()
+    
+    def clear(self):
+        """Önbelleği boşalt"""
+        with self._lock:
+            self._items.clear()
+            self.nbytes = 0
+    
+    def _evict(self):
+        while self.nbytes > self.budget and self._items:
+            _, array = self._items.popitem(last=False)
+            self.nbytes -= entry_nbytes(array)
+
+
+# Eklenti genelinde paylaşılan önbellek; çalıştırmalar arasında korunur
+RASTER_CACHE = RasterCache()
@@ -0,0 +1,398 @@
+# -*- coding: utf-8 -*-
+"""
+Raster okuma katmanı
+QgsRasterBlock verisini piksel piksel dolaşmadan NumPy dizisine dönüştürür
+"""
+
+import time
+
+from qgis.core import Qgis, QgsCsException, QgsLineString, QgsPointXY, QgsRasterBandStats, QgsRectangle
+import numpy as np
+
+from .core.extractor import (DEFAULT_TILE_SIZE, NoDataSpec, extract_pixels, iter_windows, merge_value_counts,
+                             tile_value_counts)
+from .raster_cache import RASTER_CACHE, block_key, source_key
+
+# Nokta örneklemede tek seferde okunacak en büyük pencere kenarı (piksel)
+MAX_SAMPLE_WINDOW = 1024
+# Sağlayıcı blok boyutu bildirmezse kullanılacak varsayılan
+DEFAULT_BLOCK_SIZE = 256
+# Sağlayıcı histogramından okunacak en fazla sınıf aralığı
+MAX_HISTOGRAM_BINS = 65536
+
+# Qgis veri tipi -> NumPy veri tipi
+_NUMPY_DTYPES = {
+    Qgis.Byte: np.uint8,
+    Qgis.UInt16: np.uint16,
+    Qgis.Int16: np.int16,
+    Qgis.UInt32: np.uint32,
+    Qgis.Int32: np.int32,
+    Qgis.Float32: np.float32,
+    Qgis.Float64: np.float64,
+}
+# Int8 yalnızca QGIS 3.30 ve sonrasında mevcut
+if hasattr(Qgis, 'Int8'):
+    _NUMPY_DTYPES[Qgis.Int8] = np.int8
+
+
+def numpy_dtype(data_type):
+    """Qgis veri tipine karşılık gelen NumPy veri tipini döndür"""
+    try:
+        return _NUMPY_DTYPES[data_type]
+    except KeyError:
+        raise ValueError(f"Desteklenmeyen raster veri tipi / Unsupported raster data type: {data_type}")
+
+
+def block_to_array(block):
+    """QgsRasterBlock'u kopyalamadan (height, width) NumPy dizisine dönüştür
+    
+    Dizi bloğun kendi veri tipindedir ve salt okunurdur.
+    """
+    dtype = numpy_dtype(block.dataType())
+    return np.frombuffer(block.data(), dtype=dtype).reshape(block.height(), block.width())
+
+
+def block_valid_mask(block, data, nodata):
+    """Bir blok için geçerlilik maskesi
+    
+    NoData değer ve aralıkları NumPy ile uygulanır. Blokta NoData değeri
+    yoksa NoData bilgisi piksel başına bit eşlemdedir (maske bantları vb.);
+    yalnızca bu durumda bit eşlem QGIS 3.34 ve sonrasında as_numpy ile
+    eklenir. NoData değeri olan bloklarda bit eşlem tutulmaz, maskeli dizi
+    oluşturmak gereksiz bir kopya olur.
+    """
+    valid = nodata.valid(data)
+    if block.hasNoData() and not block.hasNoDataValue() and hasattr(block, 'as_numpy'):
+        valid &= ~np.ma.getmaskarray(block.as_numpy(use_masking=True))
+    return valid
+
+
+def read_valid_block(provider, band, extent, width, height, cache=RASTER_CACHE, reads=None):
+    """Sağlayıcıdan bir blok oku; (dizi, geçerlilik maskesi) döndür
+    
+    cache verilirse dosya tabanlı kaynaklarda bloklar önbellekte tutulur;
+    dönen diziler salt okunur kabul edilmeli ve değiştirilmemelidir.
+    Raster'ı bir kez baştan sona tarayan okumalar cache=None vermelidir:
+    büyük karolar, nokta örneklemesinin tekrar kullandığı küçük blokları
+    önbellekten çıkarır. reads (TimeCounter) verilirse önbellekten
+    dönmeyen okumaların süresi ve sayısı eklenir.
+    """
+    key = block_key(provider, band, extent, width, height) if cache is not None else None
+    if key is not None:
+        entry = cache.get(key)
+        if entry is not None:
+            return entry
+    
+    started = time.perf_counter()
+    block = provider.block(band, extent, width, height)
+    if block is None or not block.isValid():
+        raise ValueError("Raster bloğu okunamadı / Could not read raster block")
+    data = block_to_array(block)
+    entry = (data, block_valid_mask(block, data, NoDataSpec.from_provider(provider, band)))
+    if reads is not None:
+        reads.add(time.perf_counter() - started)
+    
+    if key is not None:
+        cache.put(key, entry)
+    return entry
+
+
+def read_block(provider, band, extent, width, height, cache=RASTER_CACHE, reads=None):
+    """Sağlayıcıdan bir blok oku ve NumPy dizisi olarak döndür"""
+    return read_valid_block(provider, band, extent, width, height, cache, reads)[0]
+
+
+def layer_reads(layer):
+    """Katmanın okuma sayacı (RasterSource.reads); yoksa None"""
+    return getattr(layer, 'reads', None)
+
+
+class RasterSource:
+    """Arka plan iş parçacıklarında kullanılabilecek raster anlık görüntüsü
+    
+    Sağlayıcı ana iş parçacığında klonlanır. QgsRasterLayer ile aynı erişim
+    metotlarını sunduğundan bu modüldeki fonksiyonlara katman yerine verilebilir.
+    reads (TimeCounter) verilirse bu kaynaktan yapılan blok okumaları o
+    sayaçta toplanır; her çalıştırma kendi sayacını verir.
+    """
+    def __init__(self, layer, reads=None):
+        self.reads = reads
+        self._provider = layer.dataProvider().clone()
+        self._extent = QgsRectangle(layer.extent())
+        self._width = layer.width()
+        self._height = layer.height()
+        self._res_x = layer.rasterUnitsPerPixelX()
+        self._res_y = layer.rasterUnitsPerPixelY()
+        self._crs = layer.crs()
+        self._name = layer.name()
+        self._source = layer.source()
+        self._band_count = layer.bandCount()
+    
+    def dataProvider(self):
+        return self._provider
+    
+    def extent(self):
+        return QgsRectangle(self._extent)
+    
+    def width(self):
+        return self._width
+    
+    def height(self):
+        return self._height
+    
+    def rasterUnitsPerPixelX(self):
+        return self._res_x
+    
+    def rasterUnitsPerPixelY(self):
+        return self._res_y
+    
+    def crs(self):
+        return self._crs
+    
+    def name(self):
+        return self._name
+    
+    def source(self):
+        return self._source
+    
+    def bandCount(self):
+        return self._band_count
+
+
+def parse_bands(text, band_count):
+    """'1,3,5-10' biçimindeki bant listesini bant numaralarına dönüştür (sıra korunur)"""
+    bands = []
+    for part in text.replace(' ', '').split(','):
+        if not part:
+            continue
+        try:
+            if '-' in part:
+                first, last = part.split('-', 1)
+                selected = range(int(first), int(last) + 1)
+            else:
+                selected = [int(part)]
+        except ValueError:
+            raise ValueError(f"Geçersiz bant listesi / Invalid band list: {text}")
+        for band in selected:
+            if not 1 <= band <= band_count:
+                raise ValueError(f"Bant {band} mevcut değil (1-{band_count}) / "
+                                 f"Band {band} does not exist (1-{band_count})")
+            if band not in bands:
+                bands.append(band)
+    if not bands:
+        raise ValueError("En az bir bant seçilmelidir / At least one band must be selected")
+    return bands
+
+
+def read_raster(layer, band=1):
+    """Raster katmanının tamamını tek bant olarak oku"""
+    return read_block(layer.dataProvider(), band, layer.extent(), layer.width(), layer.height(), cache=None,
+                      reads=layer_reads(layer))
+
+
+def pixel_window_extent(layer, row, col, height, width):
+    """Piksel penceresinin harita koordinatlarındaki kapsamını döndür"""
+    extent = layer.extent()
+    res_x = layer.rasterUnitsPerPixelX()
+    res_y = layer.rasterUnitsPerPixelY()
+    x_min = extent.xMinimum() + col * res_x
+    y_max = extent.yMaximum() - row * res_y
+    return QgsRectangle(x_min, y_max - height * res_y, x_min + width * res_x, y_max)
+
+
+def coords_to_pixels(layer, xs, ys):
+    """Harita koordinat dizilerini tek NumPy işlemiyle piksel indislerine dönüştür
+    
+    (rows, cols, valid) döndürür. rows/cols raster sınırlarına kırpılmıştır;
+    valid, raster içine düşen (ve NaN olmayan) noktaları işaretler.
+    """
+    extent = layer.extent()
+    width, height = layer.width(), layer.height()
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    
+    cols = np.floor((xs - extent.xMinimum()) / layer.rasterUnitsPerPixelX())
+    rows = np.floor((extent.yMaximum() - ys) / layer.rasterUnitsPerPixelY())
+    valid = (cols >= 0) & (cols < width) & (rows >= 0) & (rows < height)
+    
+    cols = np.clip(np.nan_to_num(cols), 0, max(width - 1, 0)).astype(np.int64)
+    rows = np.clip(np.nan_to_num(rows), 0, max(height - 1, 0)).astype(np.int64)
+    return rows, cols, valid
+
+
+def transform_coordinates(transform, xs, ys):
+    """Koordinat dizilerini QgsCoordinateTransform ile toplu dönüştür
+    
+    Noktalar tek bir QgsLineString'e yazılır ve tek C++ çağrısıyla
+    dönüştürülür; nokta başına QgsPointXY oluşturulmaz. Dönüştürülemeyen
+    nokta varsa yalnızca o parça nokta nokta dönüştürülür.
+    (xs, ys, başarılı maskesi) döndürür.
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    if len(xs) == 0:
+        return xs, ys, np.ones(0, dtype=bool)
+    
+    line = QgsLineString(xs.tolist(), ys.tolist())
+    try:
+        line.transform(transform)
+    except QgsCsException:
+        return _transform_points(transform, xs, ys)
+    
+    if hasattr(line, 'xVector'):
+        out_x, out_y = line.xVector(), line.yVector()
+    else:
+        out_x = [line.xAt(i) for i in range(len(xs))]
+        out_y = [line.yAt(i) for i in range(len(xs))]
+    return np.array(out_x, dtype=np.float64), np.array(out_y, dtype=np.float64), np.ones(len(xs), dtype=bool)
+
+
+def _transform_points(transform, xs, ys):
+    """Noktaları tek tek dönüştür; başarısız olanları işaretle"""
+    out_x = np.full(len(xs), np.nan)
+    out_y = np.full(len(xs), np.nan)
+    ok = np.zeros(len(xs), dtype=bool)
+    for i, (x, y) in enumerate(zip(xs.tolist(), ys.tolist())):
+        try:
+            point = transform.transform(QgsPointXY(x, y))
+        except QgsCsException:
+            continue
+        out_x[i], out_y[i], ok[i] = point.x(), point.y(), True
+    return out_x, out_y, ok
+
+
+def pixels_to_coords(layer, rows, cols):
+    """Piksel indislerini piksel merkezlerinin harita koordinatlarına dönüştür"""
+    extent = layer.extent()
+    xs = extent.xMinimum() + (np.asarray(cols, dtype=np.float64) + 0.5) * layer.rasterUnitsPerPixelX()
+    ys = extent.yMaximum() - (np.asarray(rows, dtype=np.float64) + 0.5) * layer.rasterUnitsPerPixelY()
+    return xs, ys
+
+
+def sample_window_size(provider):
+    """Nokta örneklemede kullanılacak pencere boyutunu (genişlik, yükseklik) döndür
+    
+    Sağlayıcının iç blok boyutu (ör. GeoTIFF tile/strip) esas alınır.
+    """
+    block_w = provider.xBlockSize() or DEFAULT_BLOCK_SIZE
+    block_h = provider.yBlockSize() or DEFAULT_BLOCK_SIZE
+    return min(block_w, MAX_SAMPLE_WINDOW), min(block_h, MAX_SAMPLE_WINDOW)
+
+
+def sample_pixels(layer, rows, cols, band=1, progress_callback=None):
+    """Yalnızca noktaların düştüğü blokları okuyarak piksel değerlerini al
+    
+    (değerler, geçerlilik maskesi) döndürür. rows ve cols raster sınırları
+    içindeki piksel indisleri olmalıdır.
+    Noktalar iç bloklara göre gruplanır ve her blok bir kez okunur; maliyet
+    raster boyutuyla değil nokta sayısıyla ölçeklenir.
+    """
+    values, valid = sample_pixel_bands(layer, rows, cols, [band], progress_callback)
+    return values[:, 0], valid[:, 0]
+
+
+def sample_pixel_bands(layer, rows, cols, bands, progress_callback=None):
+    """Birden çok bant için piksel değerlerini tek geçişte al
+    
+    (nokta x bant) boyutlu (değerler, geçerlilik maskesi) döndürür. Her
+    blok penceresi için tüm bantlar art arda okunur.
+    """
+    provider = layer.dataProvider()
+    dtype = np.result_type(*[numpy_dtype(provider.dataType(band)) for band in bands])
+    block_w, block_h = sample_window_size(provider)
+    
+    def read_window(row, col, height, width):
+        extent = pixel_window_extent(layer, row, col, height, width)
+        return [read_valid_block(provider, band, extent, width, height, reads=layer_reads(layer)) for band in bands]
+    
+    return extract_pixels(read_window, rows, cols, len(bands), dtype, (layer.height(), layer.width()),
+                          (block_h, block_w), progress_callback)
+
+
+def iter_tiles(layer, band=1, tile_size=DEFAULT_TILE_SIZE):
+    """Raster'ı karo karo oku; (satır, sütun, dizi, geçerlilik maskesi) üretir"""
+    provider = layer.dataProvider()
+    for row, col, win_h, win_w in iter_windows(layer.width(), layer.height(), tile_size):
+        extent = pixel_window_extent(layer, row, col, win_h, win_w)
+        yield (row, col) + read_valid_block(provider, band, extent, win_w, win_h, cache=None,
+                                            reads=layer_reads(layer))
+
+
+def cached_histogram_counts(provider, band=1):
+    """Sağlayıcıda hesaplanmış tam histogram varsa {değer: sayı} döndür
+    
+    Yalnızca tam sayı rasterlarda ve istatistik/histogram önceden
+    hesaplanmışsa kullanılır; aksi halde None döner.
+    """
+    if np.dtype(numpy_dtype(provider.dataType(band))).kind not in 'iu':
+        return None
+    
+    stats_flags = QgsRasterBandStats.Min | QgsRasterBandStats.Max
+    if not provider.hasStatistics(band, stats_flags):
+        return None
+    stats = provider.bandStatistics(band, stats_flags)
+    minimum = int(stats.minimumValue)
+    maximum = int(stats.maximumValue)
+    bins = maximum - minimum + 1
+    if bins <= 0 or bins > MAX_HISTOGRAM_BINS:
+        return None
+    
+    # Her tam sayı değeri tek bir kutuya düşecek şekilde sınırlar
+    if not provider.hasHistogram(band, bins, minimum - 0.5, maximum + 0.5):
+        return None
+    histogram = provider.histogram(band, bins, minimum - 0.5, maximum + 0.5)
+    
+    return {minimum + i: int(count) for i, count in enumerate(histogram.histogramVector) if count > 0}
+
+
+def unique_value_counts(layer, band=1, tile_size=DEFAULT_TILE_SIZE, progress_callback=None, cache=RASTER_CACHE):
+    """Raster'daki benzersiz değerleri ve piksel sayılarını {değer: sayı} olarak döndür
+    
+    band bir bant numarası ya da listesi olabilir; birden çok bantta
+    sayılar toplanır ve her karo penceresi için tüm bantlar art arda okunur.
+    NoData pikselleri sayılmaz. Sağlayıcının önbellekteki histogramı varsa
+    o kullanılır; yoksa raster karo karo taranır, bellek kullanımı karo
+    boyutuyla sınırlıdır. cache verilirse dosya tabanlı kaynaklarda sonuç
+    önbellekte tutulur; farklı sınıf eşleştirmeleriyle tekrar çalıştırmak
+    raster'ı yeniden okumaz.
+    """
+    provider = layer.dataProvider()
+    bands = [band] if np.isscalar(band) else list(band)
+    key = None
+    if cache is not None:
+        band_keys = tuple(source_key(provider, band_no) for band_no in bands)
+        if all(band_key is not None for band_key in band_keys):
+            key = ('unique_value_counts',) + band_keys
+            entry = cache.get(key)
+            if entry is not None:
+                if progress_callback is not None:
+                    progress_callback(1.0)
+                return dict(zip(entry[0].tolist(), entry[1].tolist()))
+    
+    counts = _scan_value_counts(layer, provider, bands, tile_size, progress_callback)
+    if key is not None:
+        cache.put(key, (np.array(list(counts.keys())), np.array(list(counts.values()), dtype=np.int64)))
+    return counts
+
+
+def _scan_value_counts(layer, provider, bands, tile_size, progress_callback):
+    """unique_value_counts için histogramdan ya da karo taramasıyla sayım"""
+    cached = [cached_histogram_counts(provider, band_no) for band_no in bands]
+    if all(band_counts is not None for band_counts in cached):
+        counts = {}
+        for band_counts in cached:
+            for value, count in band_counts.items():
+                counts[value] = counts.get(value, 0) + count
+        return counts
+    
+    counts = {}
+    windows = list(iter_windows(layer.width(), layer.height(), tile_size))
+    for tile_no, (row, col, win_h, win_w) in enumerate(windows, start=1):
+        extent = pixel_window_extent(layer, row, col, win_h, win_w)
+        for band_no in bands:
+            data, valid = read_valid_block(provider, band_no, extent, win_w, win_h, cache=None,
+                                           reads=layer_reads(layer))
+            merge_value_counts(counts, *tile_value_counts(data[valid]))
+        if progress_callback is not None:
+            progress_callback(tile_no / len(windows))
+    return counts
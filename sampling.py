@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+"""
+Örnekleme
+Geçerli pikselleri karo karo sayar ve piksel indislerini tek seferde çeker;
+bellek kullanımı raster boyutuyla değil karo boyutuyla sınırlıdır
+"""
+
+import numpy as np
+
+from .core.extractor import DEFAULT_TILE_SIZE, extract_pixels, iter_windows
+from .core.sampler import Reservoir, allocate_samples, split_sample, stratum_std
+from .raster_cache import RASTER_CACHE, source_key
+from .raster_io import (coords_to_pixels, layer_reads, numpy_dtype, pixel_window_extent, pixels_to_coords,
+                        read_valid_block)
+
+
+def valid_tile_mask(reference_layer, classified_layer, window, band=1):
+    """Referans ızgarasındaki bir karo için (referans dizisi, geçerlilik maskesi,
+    sınıflandırılmış değerler) döndür
+    
+    Bir piksel, referans değeri geçerliyse ve merkezi sınıflandırılmış
+    raster'da geçerli bir piksele düşüyorsa geçerlidir. Rasterlar farklı
+    ızgaralarda olabilir; sınıflandırılmış raster'dan karoyu kapsayan
+    pencere okunur, pencere karodan büyükse (daha ince çözünürlük) karo
+    boyutunu aşmayan alt pencerelere bölünür. Sınıflandırılmış değerler
+    geçerli pikseller için np.flatnonzero(valid) sırasıyla döner.
+    """
+    row, col, win_h, win_w = window
+    ref_data, ref_valid = read_valid_block(reference_layer.dataProvider(), band,
+                                           pixel_window_extent(reference_layer, row, col, win_h, win_w),
+                                           win_w, win_h, cache=None, reads=layer_reads(reference_layer))
+    valid = ref_valid.copy()
+    
+    # Piksel merkezleri: x yalnızca sütuna, y yalnızca satıra bağlı
+    xs, ys = pixels_to_coords(reference_layer, np.arange(row, row + win_h)[:, np.newaxis],
+                              np.arange(col, col + win_w)[np.newaxis, :])
+    class_rows, class_cols, inside = coords_to_pixels(classified_layer, xs, ys)
+    valid &= inside
+    if not valid.any():
+        return ref_data, valid, np.empty(0, dtype=np.float64)
+    
+    class_rows, class_cols = np.broadcast_arrays(class_rows, class_cols)
+    class_rows, class_cols = class_rows[valid], class_cols[valid]
+    row0, col0 = int(class_rows.min()), int(class_cols.min())
+    height = int(class_rows.max()) - row0 + 1
+    width = int(class_cols.max()) - col0 + 1
+    class_provider = classified_layer.dataProvider()
+    if height * width <= win_h * win_w:
+        class_data, class_data_valid = read_valid_block(
+            class_provider, band, pixel_window_extent(classified_layer, row0, col0, height, width),
+            width, height, cache=None, reads=layer_reads(classified_layer))
+        class_values = class_data[class_rows - row0, class_cols - col0]
+        class_valid = class_data_valid[class_rows - row0, class_cols - col0]
+    else:
+        # Sınıflandırılmış raster daha ince: karo izdüşümü karo boyutunu aşmayan alt pencerelerle okunur
+        def read_window(sub_row, sub_col, sub_h, sub_w):
+            extent = pixel_window_extent(classified_layer, sub_row, sub_col, sub_h, sub_w)
+            return [read_valid_block(class_provider, band, extent, sub_w, sub_h, cache=None,
+                                     reads=layer_reads(classified_layer))]
+        
+        dtype = numpy_dtype(class_provider.dataType(band))
+        values, values_valid = extract_pixels(read_window, class_rows, class_cols, 1, dtype,
+                                              (classified_layer.height(), classified_layer.width()),
+                                              (win_h, win_w))
+        class_values, class_valid = values[:, 0], values_valid[:, 0]
+    valid[valid] = class_valid
+    return ref_data, valid, class_values[class_valid]
+
+
+def scan_key(kind, reference_layer, classified_layer, tile_size):
+    """Harita çifti üzerindeki bir tarama sonucu için önbellek anahtarı; önbelleğe alınamıyorsa None"""
+    reference_key = source_key(reference_layer.dataProvider(), 1)
+    classified_key = source_key(classified_layer.dataProvider(), 1)
+    if reference_key is None or classified_key is None:
+        return None
+    return kind, reference_key, classified_key, tile_size
+
+
+def count_valid_pixels(reference_layer, classified_layer, tile_size=DEFAULT_TILE_SIZE, progress_callback=None,
+                       cache=RASTER_CACHE):
+    """Her karodaki geçerli piksel sayısını döndür: (pencereler, sayılar)
+    
+    cache verilirse dosya tabanlı kaynaklarda sayılar önbellekte tutulur;
+    aynı harita çiftiyle tekrar örnekleme ilk geçişi yeniden okumaz.
+    """
+    windows = list(iter_windows(reference_layer.width(), reference_layer.height(), tile_size))
+    key = scan_key('count_valid_pixels', reference_layer, classified_layer, tile_size) if cache is not None else None
+    counts = cache.get(key) if key is not None else None
+    if counts is not None:
+        if progress_callback is not None:
+            progress_callback(1.0)
+        return windows, counts
+    
+    counts = np.zeros(len(windows), dtype=np.int64)
+    for tile_no, window in enumerate(windows):
+        _, valid, _ = valid_tile_mask(reference_layer, classified_layer, window)
+        counts[tile_no] = np.count_nonzero(valid)
+        if progress_callback is not None:
+            progress_callback((tile_no + 1) / len(windows))
+    if key is not None:
+        cache.put(key, counts)
+    return windows, counts
+
+
+def random_sample(reference_layer, classified_layer, n_points, seed=None,
+                  tile_size=DEFAULT_TILE_SIZE, progress_callback=None):
+    """Her iki raster'da da geçerli piksellerden iadesiz tam n_points piksel çek
+    
+    Referans ızgarasında (rows, cols) döndürür. İlk geçişte karo başına
+    geçerli pikseller sayılır ve örnek sayısı karolara hipergeometrik olarak
+    dağıtılır; ikinci geçişte yalnızca örnek düşen karolar yeniden okunur.
+    """
+    rng = np.random.default_rng(seed)
+    first_pass = None if progress_callback is None else (lambda f: progress_callback(f / 2))
+    windows, counts = count_valid_pixels(reference_layer, classified_layer, tile_size, first_pass)
+    per_tile = split_sample(rng, counts, n_points)
+    
+    second_pass = None if progress_callback is None else (lambda f: progress_callback(0.5 + f / 2))
+    return _draw_positions(reference_layer, classified_layer, windows, per_tile[:, np.newaxis], None,
+                           rng, second_pass)
+
+
+def stratum_statistics(reference_layer, classified_layer, tile_size=DEFAULT_TILE_SIZE, progress_callback=None,
+                       cache=RASTER_CACHE):
+    """Referans sınıflarını tek geçişte say
+    
+    (pencereler, sınıf değerleri, karo x sınıf sayı matrisi, sınıf başına
+    doğruluk standart sapması) döndürür. Örnekleme sınıf eşleştirmesinden
+    önce yapıldığından, sınıflandırılmış değeri referans değerine eşit olan
+    pikseller doğru sayılır (stratum_std). Sonuç count_valid_pixels gibi
+    önbellekte tutulur.
+    """
+    windows = list(iter_windows(reference_layer.width(), reference_layer.height(), tile_size))
+    key = scan_key('stratum_statistics', reference_layer, classified_layer, tile_size) if cache is not None else None
+    entry = cache.get(key) if key is not None else None
+    if entry is not None:
+        if progress_callback is not None:
+            progress_callback(1.0)
+        return (windows,) + entry
+    
+    tile_stats = []
+    for tile_no, window in enumerate(windows):
+        ref_data, valid, class_values = valid_tile_mask(reference_layer, classified_layer, window)
+        values, inverse = np.unique(ref_data[valid], return_inverse=True)
+        inverse = inverse.ravel()
+        agree = class_values.astype(np.float64) == ref_data[valid].astype(np.float64)
+        tile_stats.append((values, np.bincount(inverse, minlength=len(values)),
+                           np.bincount(inverse, weights=agree, minlength=len(values))))
+        if progress_callback is not None:
+            progress_callback((tile_no + 1) / len(windows))
+    
+    strata = np.unique(np.concatenate([stats[0] for stats in tile_stats])) if tile_stats else np.empty(0)
+    counts = np.zeros((len(windows), len(strata)), dtype=np.int64)
+    agreements = np.zeros(len(strata), dtype=np.float64)
+    for tile_no, (values, tile_counts, tile_agreements) in enumerate(tile_stats):
+        idx = np.searchsorted(strata, values)
+        counts[tile_no, idx] = tile_counts
+        agreements[idx] += tile_agreements
+    
+    entry = (strata, counts, stratum_std(counts.sum(axis=0), agreements))
+    if key is not None:
+        cache.put(key, entry)
+    return (windows,) + entry
+
+
+def stratified_sample(reference_layer, classified_layer, n_points, allocation='proportional',
+                      min_per_class=0, seed=None, tile_size=DEFAULT_TILE_SIZE, progress_callback=None):
+    """Referans sınıflarına göre katmanlı örnekleme; tam n_points piksel döndürür
+    
+    Sınıf boyutları tek geçişte sayılır, örnek sayıları allocate_samples ile
+    dağıtılır. Her sınıfın örnekleri karolara hipergeometrik olarak bölünür;
+    ikinci geçişte karo içindeki sınıf pikselleri sıra numarasıyla seçilir,
+    sınıf başına koordinat listesi oluşturulmaz. Referans ızgarasında
+    (rows, cols) döndürür.
+    """
+    rng = np.random.default_rng(seed)
+    first_pass = None if progress_callback is None else (lambda f: progress_callback(f / 2))
+    windows, strata, counts, std = stratum_statistics(reference_layer, classified_layer, tile_size, first_pass)
+    per_class = allocate_samples(counts.sum(axis=0), n_points, allocation, min_per_class, std)
+    
+    per_tile = np.zeros_like(counts)
+    for stratum_no in np.flatnonzero(per_class):
+        per_tile[:, stratum_no] = split_sample(rng, counts[:, stratum_no], per_class[stratum_no])
+    
+    second_pass = None if progress_callback is None else (lambda f: progress_callback(0.5 + f / 2))
+    return _draw_positions(reference_layer, classified_layer, windows, per_tile, strata, rng, second_pass)
+
+
+def _draw_positions(reference_layer, classified_layer, windows, per_tile, strata, rng, progress_callback=None):
+    """Karo x katman örnek sayılarına göre piksel konumlarını seç
+    
+    strata None ise tek katman (tüm geçerli pikseller) kullanılır. Yalnızca
+    örnek düşen karolar yeniden okunur.
+    """
+    rows = []
+    cols = []
+    tiles = np.flatnonzero(per_tile.sum(axis=1))
+    for done, tile_no in enumerate(tiles, start=1):
+        row, col, _, win_w = windows[tile_no]
+        ref_data, valid, _ = valid_tile_mask(reference_layer, classified_layer, windows[tile_no])
+        positions = np.flatnonzero(valid)
+        
+        if strata is None:
+            groups = [positions]
+        else:
+            # Geçerli pikselleri sınıfa göre sırala; her sınıf ardışık bir dilim olur
+            labels = ref_data.ravel()[positions]
+            order = np.argsort(labels, kind='stable')
+            sorted_labels = labels[order]
+            starts = np.searchsorted(sorted_labels, strata, side='left')
+            ends = np.searchsorted(sorted_labels, strata, side='right')
+            groups = [positions[order[start:end]] for start, end in zip(starts, ends)]
+        
+        for stratum_no in np.flatnonzero(per_tile[tile_no]):
+            members = groups[stratum_no]
+            picked = members[rng.choice(len(members), per_tile[tile_no, stratum_no], replace=False)]
+            rows.append(row + picked // win_w)
+            cols.append(col + picked % win_w)
+        
+        if progress_callback is not None:
+            progress_callback(done / len(tiles))
+    
+    if not rows:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.concatenate(rows), np.concatenate(cols)
+
+
+def reservoir_stratified_sample(reference_layer, classified_layer, n_points, allocation='proportional',
+                                min_per_class=0, seed=None, tile_size=DEFAULT_TILE_SIZE,
+                                progress_callback=None):
+    """Tek geçişte (akış) katmanlı örnekleme; tam n_points piksel döndürür
+    
+    Raster karo karo bir kez okunur; her sınıf için n_points kapasiteli bir
+    rezervuar tutulur. Geçiş sonunda sınıf boyutları bilindiğinden örnek
+    dağıtımı stratified_sample ile aynıdır; her rezervuardan gereken sayıda
+    eleman iadesiz alt örneklenir. Bellek kullanımı raster boyutuna değil
+    sınıf sayısı x n_points'e bağlıdır. Referans ızgarasında (rows, cols)
+    döndürür.
+    """
+    rng = np.random.default_rng(seed)
+    width = reference_layer.width()
+    windows = list(iter_windows(width, reference_layer.height(), tile_size))
+    reservoirs = {}
+    sizes = {}
+    agreements = {}
+    
+    for tile_no, (row, col, win_h, win_w) in enumerate(windows):
+        ref_data, valid, class_values = valid_tile_mask(reference_layer, classified_layer,
+                                                        (row, col, win_h, win_w))
+        positions = np.flatnonzero(valid)
+        labels = ref_data.ravel()[positions]
+        agree = class_values.astype(np.float64) == labels.astype(np.float64)
+        
+        # Sınıfları ardışık dilimlere ayır; dilim içi sıra piksel sırasıdır
+        order = np.argsort(labels, kind='stable')
+        sorted_labels = labels[order]
+        starts = np.flatnonzero(np.r_[True, sorted_labels[1:] != sorted_labels[:-1]]) if len(order) else []
+        ends = np.r_[starts[1:], len(order)] if len(order) else []
+        linear = (row + positions // win_w) * width + col + positions % win_w
+        
+        for start, end in zip(starts, ends):
+            value = sorted_labels[start].item()
+            members = order[start:end]
+            if value not in reservoirs:
+                reservoirs[value] = Reservoir(n_points, rng)
+                sizes[value] = agreements[value] = 0
+            reservoirs[value].extend(linear[members])
+            sizes[value] += end - start
+            agreements[value] += int(np.count_nonzero(agree[members]))
+        
+        if progress_callback is not None:
+            progress_callback((tile_no + 1) / len(windows))
+    
+    strata = sorted(reservoirs)
+    size_array = np.array([sizes[value] for value in strata], dtype=np.int64)
+    std = stratum_std(size_array, [agreements[value] for value in strata])
+    per_class = allocate_samples(size_array, n_points, allocation, min_per_class, std)
+    
+    picked = [np.empty(0, dtype=np.int64)]
+    for value, n_class in zip(strata, per_class):
+        sample = reservoirs[value].sample()
+        picked.append(sample[rng.choice(len(sample), n_class, replace=False)])
+    picked = np.concatenate(picked)
+    return picked // width, picked % width
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+Arka plan doğrulama görevi
+Uzun süren doğrulama aşamalarını QGIS görev yöneticisinde iptal edilebilir şekilde çalıştırır
+"""
+
+from qgis.PyQt.QtCore import pyqtSignal
+from qgis.core import Qgis, QgsMessageLog, QgsTask
+
+from .plugin import LOG_TAG
+
+
+class TaskCanceled(Exception):
+    """Görev kullanıcı tarafından iptal edildi"""
+
+
+class ValidationTask(QgsTask):
+    """Bir doğrulama aşamasını arka planda çalıştıran iptal edilebilir görev
+    
+    function(task) arka plan iş parçacığında çalışır ve arayüz nesnelerine
+    dokunmamalıdır; ilerleme için setProgress/stage_callback, mesajlar için
+    log kullanılır. Sonuç on_finished(success, result, exception) ile ana
+    iş parçacığında iletilir.
+    """
+    message = pyqtSignal(str)
+    
+    def __init__(self, description, function, on_finished):
+        super(ValidationTask, self).__init__(description, QgsTask.CanCancel)
+        self.function = function
+        self.on_finished = on_finished
+        self.result = None
+        self.exception = None
+    
+    def run(self):
+        """Arka plan iş parçacığında çalışır"""
+        try:
+            self.result = self.function(self)
+        except TaskCanceled:
+            return False
+        except Exception as e:
+            self.exception = e
+            return False
+        return not self.isCanceled()
+    
+    def finished(self, result):
+        """Ana iş parçacığında çalışır"""
+        self.on_finished(result, self.result, self.exception)
+    
+    def check_canceled(self):
+        """İptal istendiyse TaskCanceled fırlat"""
+        if self.isCanceled():
+            raise TaskCanceled()
+    
+    def stage_callback(self, start, end):
+        """[start, end] yüzde aralığına ölçeklenen ve iptali denetleyen ilerleme fonksiyonu döndür"""
+        def callback(fraction):
+            self.check_canceled()
+            self.setProgress(start + (end - start) * fraction)
+        return callback
+    
+    def log(self, text):
+        """Sonuç alanına mesaj gönder (ana iş parçacığında gösterilir)"""
+        self.message.emit(text)
+    
+    def debug(self, text):
+        """Ayrıntı mesajını QGIS mesaj günlüğüne yaz (iş parçacığı güvenli)"""
+        QgsMessageLog.logMessage(text.rstrip('\n'), LOG_TAG, Qgis.Info)
+
+
+class FeedbackTask:
+    """QgsProcessingFeedback'i ValidationTask ile aynı arayüze uyarlar
+    
+    Doğrulama hattı fonksiyonları Processing algoritmasından bu nesneyle
+    çağrılır; iptal TaskCanceled, mesajlar feedback.pushInfo ile iletilir.
+    """
+    def __init__(self, feedback):
+        self.feedback = feedback
+    
+    def setProgress(self, value):
+        self.feedback.setProgress(value)
+    
+    def check_canceled(self):
+        """İptal istendiyse TaskCanceled fırlat"""
+        if self.feedback.isCanceled():
+            raise TaskCanceled()
+    
+    def stage_callback(self, start, end):
+        """[start, end] yüzde aralığına ölçeklenen ve iptali denetleyen ilerleme fonksiyonu döndür"""
+        def callback(fraction):
+            self.check_canceled()
+            self.setProgress(start + (end - start) * fraction)
+        return callback
+    
+    def log(self, text):
+        """Mesajı Processing günlüğüne yaz"""
+        self.feedback.pushInfo(text.rstrip('\n'))
+    
+    def debug(self, text):
+        """Ayrıntı mesajını Processing günlüğüne yaz (yalnızca ayrıntılı günlükte görünür)"""
+        self.feedback.pushDebugInfo(text.rstrip('\n'))